@@ -23,6 +23,9 @@ class DiscreteActionSpace:
     n: int
 
     def contains(self, action: int) -> bool:
+        # Plain ints are the common case; skip the isinstance tuple check for them.
+        if type(action) is int:
+            return 0 <= action < self.n
         return isinstance(action, (int, np.integer)) and 0 <= int(action) < self.n
 
 
@@ -37,11 +40,17 @@ class ObservationSpace:
 class HelloProspectorEnv:
     """Contract-only environment stub for Milestone M0."""
 
-    def __init__(self, seed: int | None = None) -> None:
+    def __init__(self, seed: int | None = None, *, copy_obs: bool = False) -> None:
+        del seed  # The stub draws no randomness; accepted for the env constructor contract.
         self.action_space = DiscreteActionSpace(N_ACTIONS)
         self.observation_space = ObservationSpace(shape=(OBS_DIM,), dtype=np.float32)
-        self._rng = np.random.default_rng(seed)
-        self._obs = np.zeros((OBS_DIM,), dtype=np.float32)
+        self._obs = np.empty((OBS_DIM,), dtype=np.float32)
+        self._obs.fill(0.0)
+        # Without copy_obs, reset/step hand out one shared read-only view of the
+        # observation buffer; callers that need to keep or mutate it must copy.
+        self._copy_obs = bool(copy_obs)
+        self._obs_ro = self._obs.view()
+        self._obs_ro.flags.writeable = False
 
     def reset(
         self,
@@ -50,11 +59,8 @@ class HelloProspectorEnv:
         options: dict[str, Any] | None = None,
     ) -> tuple[np.ndarray, dict[str, Any]]:
         del options  # Reserved for future Gymnasium compatibility.
-        if seed is not None:
-            self._rng = np.random.default_rng(seed)
-
         self._obs.fill(0.0)
-        return self._obs.copy(), {"seed": seed}
+        return self._emit_obs(), {"seed": seed}
 
     def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
         invalid_action = not self.action_space.contains(action)
@@ -63,4 +69,7 @@ class HelloProspectorEnv:
             "invalid_action": invalid_action,
             "action_received": int(action),
         }
-        return self._obs.copy(), float(reward), False, False, info
+        return self._emit_obs(), float(reward), False, False, info
+
+    def _emit_obs(self) -> np.ndarray:
+        return self._obs.copy() if self._copy_obs else self._obs_ro
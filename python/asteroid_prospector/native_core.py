@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import ctypes
+import functools
 import math
+import struct
 import sys
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -52,12 +55,171 @@ class _AbpCoreStepResult(ctypes.Structure):
     ]
 
 
+_STEP_RESULT_DTYPE = np.dtype(_AbpCoreStepResult)
+
+# Trailing float metrics of AbpCoreStepResult, in struct order. They are laid out
+# contiguously, so a single float32 view covers all of them.
+_METRIC_FIELDS = (
+    "credits",
+    "net_profit",
+    "profit_per_tick",
+    "survival",
+    "overheat_ticks",
+    "pirate_encounters",
+    "value_lost_to_pirates",
+    "fuel_used",
+    "hull_damage",
+    "tool_wear",
+    "scan_count",
+    "mining_ticks",
+    "cargo_utilization_avg",
+    "time_remaining",
+)
+# Everything after obs (reward, flags, dt, action, metrics) unpacked in one call.
+_RESULT_TAIL = struct.Struct("<fBBBxHh" + "f" * len(_METRIC_FIELDS))
+_RESULT_TAIL_OFFSET = _AbpCoreStepResult.reward.offset
+_STEP_INFO_KEYS = (
+    "action",
+    "action_received",
+    "dt",
+    "invalid_action",
+    *_METRIC_FIELDS,
+    "terminated",
+    "truncated",
+)
+# Position of each info key inside a `_RESULT_TAIL` unpack; flags are exposed as bools.
+_TAIL_INDEX = {
+    "terminated": 1,
+    "truncated": 2,
+    "invalid_action": 3,
+    "dt": 4,
+    "action": 5,
+    **{name: 6 + i for i, name in enumerate(_METRIC_FIELDS)},
+}
+_FLAG_KEYS = frozenset(("terminated", "truncated", "invalid_action"))
+# (key, tail index, is_flag) in `_STEP_INFO_KEYS` order, for materializing a full dict.
+_INFO_PLAN = tuple((key, _TAIL_INDEX.get(key, -1), key in _FLAG_KEYS) for key in _STEP_INFO_KEYS)
+
+# Column layout of batched infos. One aligned record per env keeps every column a
+# view into a single allocation; the field order is the public info key order.
+_INFO_DTYPE = np.dtype(
+    [
+        ("action", np.int16),
+        ("action_received", np.int64),
+        ("dt", np.int32),
+        ("invalid_action", np.bool_),
+        *((name, np.float32) for name in _METRIC_FIELDS),
+        ("terminated", np.bool_),
+        ("truncated", np.bool_),
+    ],
+    align=True,
+)
+
+
+class _StepInfo(Mapping[str, Any]):
+    """Read-only step info backed by a snapshot of the native result fields.
+
+    No per-step dict is built; the snapshot is taken at construction because the
+    native result buffer is reused by the next step.
+    """
+
+    __slots__ = ("_values", "_action_received")
+
+    def __init__(self, values: tuple[Any, ...], action_received: int) -> None:
+        self._values = values
+        self._action_received = action_received
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "action_received":
+            return self._action_received
+        value = self._values[_TAIL_INDEX[key]]
+        return value != 0 if key in _FLAG_KEYS else value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _TAIL_INDEX or key == "action_received"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STEP_INFO_KEYS)
+
+    def __len__(self) -> int:
+        return len(_STEP_INFO_KEYS)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def copy(self) -> dict[str, Any]:
+        values = self._values
+        out: dict[str, Any] = {}
+        for key, index, is_flag in _INFO_PLAN:
+            if index < 0:
+                out[key] = self._action_received
+            else:
+                value = values[index]
+                out[key] = value != 0 if is_flag else value
+        return out
+
+
 class _AbpCoreState(ctypes.Structure):
     pass
 
 
+def _state_address(core: Any) -> int:
+    addr = getattr(core, "_state_addr", None)
+    if addr is None:
+        addr = ctypes.cast(core._state, ctypes.c_void_p).value or 0
+    return addr
+
+
+class _BatchBuffers:
+    """Reusable argument/result arrays for the batch FFI entry points."""
+
+    __slots__ = (
+        "capacity",
+        "results",
+        "results_ptr",
+        "states",
+        "states_ptr",
+        "actions",
+        "actions_ptr",
+        "seeds",
+        "seeds_ptr",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.results = np.zeros((capacity,), dtype=_STEP_RESULT_DTYPE)
+        self.results_ptr = self.results.ctypes.data_as(ctypes.POINTER(_AbpCoreStepResult))
+        self.states = np.zeros((capacity,), dtype=np.uintp)
+        self.states_ptr = self.states.ctypes.data_as(ctypes.POINTER(ctypes.POINTER(_AbpCoreState)))
+        self.actions = np.zeros((capacity,), dtype=np.uint8)
+        self.actions_ptr = self.actions.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8))
+        self.seeds = np.zeros((capacity,), dtype=np.uint64)
+        self.seeds_ptr = self.seeds.ctypes.data_as(ctypes.POINTER(ctypes.c_uint64))
+
+    def fill_states(self, cores: Sequence[Any]) -> None:
+        # Addresses are re-read every call so a closed or replaced core can never
+        # leave a stale pointer behind in the cached array.
+        count = len(cores)
+        self.states[:count] = np.fromiter(
+            (_state_address(core) for core in cores), dtype=np.uintp, count=count
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _native_build_dir() -> Path:
+    return Path(__file__).resolve().parents[2] / "engine_core" / "build"
+
+
+# Only a located library is cached, so a core built after a failed probe is still found.
+_FOUND_LIBRARY_PATH: Path | None = None
+
+
 def default_native_library_path() -> Path:
-    build_dir = Path(__file__).resolve().parents[2] / "engine_core" / "build"
+    global _FOUND_LIBRARY_PATH
+    if _FOUND_LIBRARY_PATH is not None:
+        return _FOUND_LIBRARY_PATH
+
+    build_dir = _native_build_dir()
 
     if sys.platform.startswith("win"):
         candidate_names = ("abp_core.dll",)
@@ -69,11 +231,70 @@ def default_native_library_path() -> Path:
     for name in candidate_names:
         candidate = build_dir / name
         if candidate.exists():
+            _FOUND_LIBRARY_PATH = candidate
             return candidate
 
     return build_dir / candidate_names[0]
 
 
+def _configure_signatures(lib: ctypes.CDLL) -> bool:
+    lib.abp_core_create.argtypes = [ctypes.POINTER(_AbpCoreConfig), ctypes.c_uint64]
+    lib.abp_core_create.restype = ctypes.POINTER(_AbpCoreState)
+
+    lib.abp_core_destroy.argtypes = [ctypes.POINTER(_AbpCoreState)]
+    lib.abp_core_destroy.restype = None
+
+    lib.abp_core_reset.argtypes = [
+        ctypes.POINTER(_AbpCoreState),
+        ctypes.c_uint64,
+        ctypes.POINTER(ctypes.c_float),
+    ]
+    lib.abp_core_reset.restype = None
+
+    lib.abp_core_step.argtypes = [
+        ctypes.POINTER(_AbpCoreState),
+        ctypes.c_uint8,
+        ctypes.POINTER(_AbpCoreStepResult),
+    ]
+    lib.abp_core_step.restype = None
+
+    if hasattr(lib, "abp_core_reset_many") and hasattr(lib, "abp_core_step_many"):
+        lib.abp_core_reset_many.argtypes = [
+            ctypes.POINTER(ctypes.POINTER(_AbpCoreState)),
+            ctypes.POINTER(ctypes.c_uint64),
+            ctypes.c_uint32,
+            ctypes.POINTER(ctypes.c_float),
+        ]
+        lib.abp_core_reset_many.restype = None
+
+        lib.abp_core_step_many.argtypes = [
+            ctypes.POINTER(ctypes.POINTER(_AbpCoreState)),
+            ctypes.POINTER(ctypes.c_uint8),
+            ctypes.c_uint32,
+            ctypes.POINTER(_AbpCoreStepResult),
+        ]
+        lib.abp_core_step_many.restype = None
+        return True
+    return False
+
+
+# Loaded library handles keyed by path, shared by every core created in-process.
+# Each entry carries whether the batch (`*_many`) symbols are available.
+_LIBRARY_CACHE: dict[str, tuple[ctypes.CDLL, bool]] = {}
+_LIBRARY_LOCK = threading.Lock()
+
+
+def _load_library(library_file: Path) -> tuple[ctypes.CDLL, bool]:
+    key = str(library_file)
+    with _LIBRARY_LOCK:
+        entry = _LIBRARY_CACHE.get(key)
+        if entry is None:
+            lib = ctypes.CDLL(key)
+            entry = (lib, _configure_signatures(lib))
+            _LIBRARY_CACHE[key] = entry
+    return entry
+
+
 class NativeProspectorCore:
     def __init__(
         self,
@@ -84,18 +305,29 @@ class NativeProspectorCore:
     ) -> None:
         self._cfg_ref: _AbpCoreConfig | None = None
         self._has_batch_apis = False
+        # Reused across step() calls; ctypes stays the binding layer (ADR-0057).
+        self._result = _AbpCoreStepResult()
+        self._result_ref = ctypes.byref(self._result)
+        self._obs_view = np.frombuffer(self._result.obs, dtype=np.float32, count=OBS_DIM)
+        self._reset_obs_buf = (ctypes.c_float * OBS_DIM)()
+        self._reset_obs_view = np.frombuffer(self._reset_obs_buf, dtype=np.float32, count=OBS_DIM)
         library_file = (
             Path(library_path) if library_path is not None else default_native_library_path()
         )
 
-        if not library_file.exists():
+        # Let the loader do the only filesystem probe; stat just to explain a failure.
+        try:
+            self._lib, self._has_batch_apis = _load_library(library_file)
+        except OSError as exc:
+            if library_file.exists():
+                raise
             raise FileNotFoundError(
                 f"Native core library not found at '{library_file}'. "
                 "Run .\\tools\\build_native_core.ps1 first."
-            )
-
-        self._lib = ctypes.CDLL(str(library_file))
-        self._configure_signatures()
+            ) from exc
+        # Bound once so the per-step paths skip the CDLL attribute lookup.
+        self._step_fn = self._lib.abp_core_step
+        self._reset_fn = self._lib.abp_core_reset
 
         if config is None:
             self._state = self._lib.abp_core_create(None, ctypes.c_uint64(int(seed)))
@@ -110,50 +342,14 @@ class NativeProspectorCore:
 
         if not self._state:
             raise RuntimeError("Failed to create native core state")
-
-    def _configure_signatures(self) -> None:
-        self._lib.abp_core_create.argtypes = [ctypes.POINTER(_AbpCoreConfig), ctypes.c_uint64]
-        self._lib.abp_core_create.restype = ctypes.POINTER(_AbpCoreState)
-
-        self._lib.abp_core_destroy.argtypes = [ctypes.POINTER(_AbpCoreState)]
-        self._lib.abp_core_destroy.restype = None
-
-        self._lib.abp_core_reset.argtypes = [
-            ctypes.POINTER(_AbpCoreState),
-            ctypes.c_uint64,
-            ctypes.POINTER(ctypes.c_float),
-        ]
-        self._lib.abp_core_reset.restype = None
-
-        self._lib.abp_core_step.argtypes = [
-            ctypes.POINTER(_AbpCoreState),
-            ctypes.c_uint8,
-            ctypes.POINTER(_AbpCoreStepResult),
-        ]
-        self._lib.abp_core_step.restype = None
-
-        if hasattr(self._lib, "abp_core_reset_many") and hasattr(self._lib, "abp_core_step_many"):
-            self._lib.abp_core_reset_many.argtypes = [
-                ctypes.POINTER(ctypes.POINTER(_AbpCoreState)),
-                ctypes.POINTER(ctypes.c_uint64),
-                ctypes.c_uint32,
-                ctypes.POINTER(ctypes.c_float),
-            ]
-            self._lib.abp_core_reset_many.restype = None
-
-            self._lib.abp_core_step_many.argtypes = [
-                ctypes.POINTER(ctypes.POINTER(_AbpCoreState)),
-                ctypes.POINTER(ctypes.c_uint8),
-                ctypes.c_uint32,
-                ctypes.POINTER(_AbpCoreStepResult),
-            ]
-            self._lib.abp_core_step_many.restype = None
-            self._has_batch_apis = True
+        self._state_addr = ctypes.cast(self._state, ctypes.c_void_p).value
 
     @staticmethod
     def _coerce_action_u8(action: int) -> int:
+        # The core remaps every action >= N_ACTIONS the same way, so out-of-range
+        # values collapse to N_ACTIONS with a single bounds check.
         action_value = int(action)
-        return action_value if 0 <= action_value < 256 else N_ACTIONS
+        return action_value if 0 <= action_value < N_ACTIONS else N_ACTIONS
 
     @staticmethod
     def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -180,66 +376,18 @@ class NativeProspectorCore:
             return bool(default)
 
     @staticmethod
-    def _info_from_result(
-        result: _AbpCoreStepResult,
-        *,
-        action_received: int,
-        terminated: bool,
-        truncated: bool,
-    ) -> dict[str, Any]:
-        return {
-            "action": int(result.action),
-            "action_received": int(action_received),
-            "dt": int(result.dt),
-            "invalid_action": bool(result.invalid_action),
-            "credits": float(result.credits),
-            "net_profit": float(result.net_profit),
-            "profit_per_tick": float(result.profit_per_tick),
-            "survival": float(result.survival),
-            "overheat_ticks": float(result.overheat_ticks),
-            "pirate_encounters": float(result.pirate_encounters),
-            "value_lost_to_pirates": float(result.value_lost_to_pirates),
-            "fuel_used": float(result.fuel_used),
-            "hull_damage": float(result.hull_damage),
-            "tool_wear": float(result.tool_wear),
-            "scan_count": float(result.scan_count),
-            "mining_ticks": float(result.mining_ticks),
-            "cargo_utilization_avg": float(result.cargo_utilization_avg),
-            "time_remaining": float(result.time_remaining),
-            "terminated": bool(terminated),
-            "truncated": bool(truncated),
-        }
+    def _info_from_result(values: tuple[Any, ...], *, action_received: int) -> _StepInfo:
+        """Build step info from a `_RESULT_TAIL` unpack of the result struct."""
+        return _StepInfo(values, int(action_received))
 
     @staticmethod
     def _allocate_info_arrays(
         count: int, *, action_received: np.ndarray | None = None
     ) -> dict[str, np.ndarray]:
-        received = np.zeros((count,), dtype=np.int64)
+        buffer = np.zeros((count,), dtype=_INFO_DTYPE)
         if action_received is not None:
-            received = np.asarray(action_received, dtype=np.int64).copy()
-
-        return {
-            "action": np.zeros((count,), dtype=np.int16),
-            "action_received": received,
-            "dt": np.zeros((count,), dtype=np.int32),
-            "invalid_action": np.zeros((count,), dtype=bool),
-            "credits": np.zeros((count,), dtype=np.float32),
-            "net_profit": np.zeros((count,), dtype=np.float32),
-            "profit_per_tick": np.zeros((count,), dtype=np.float32),
-            "survival": np.zeros((count,), dtype=np.float32),
-            "overheat_ticks": np.zeros((count,), dtype=np.float32),
-            "pirate_encounters": np.zeros((count,), dtype=np.float32),
-            "value_lost_to_pirates": np.zeros((count,), dtype=np.float32),
-            "fuel_used": np.zeros((count,), dtype=np.float32),
-            "hull_damage": np.zeros((count,), dtype=np.float32),
-            "tool_wear": np.zeros((count,), dtype=np.float32),
-            "scan_count": np.zeros((count,), dtype=np.float32),
-            "mining_ticks": np.zeros((count,), dtype=np.float32),
-            "cargo_utilization_avg": np.zeros((count,), dtype=np.float32),
-            "time_remaining": np.zeros((count,), dtype=np.float32),
-            "terminated": np.zeros((count,), dtype=bool),
-            "truncated": np.zeros((count,), dtype=bool),
-        }
+            buffer["action_received"] = action_received
+        return {name: buffer[name] for name in _INFO_DTYPE.names}
 
     @staticmethod
     def _infos_rows_to_arrays(
@@ -248,56 +396,23 @@ class NativeProspectorCore:
         count = len(rows)
         infos = NativeProspectorCore._allocate_info_arrays(count, action_received=action_received)
 
-        for i, row in enumerate(rows):
-            infos["action"][i] = np.int16(NativeProspectorCore._safe_int(row.get("action", 0)))
-            infos["dt"][i] = np.int32(NativeProspectorCore._safe_int(row.get("dt", 1)))
-            infos["invalid_action"][i] = NativeProspectorCore._safe_bool(
-                row.get("invalid_action", False)
-            )
-            infos["credits"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("credits", 0.0))
-            )
-            infos["net_profit"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("net_profit", 0.0))
-            )
-            infos["profit_per_tick"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("profit_per_tick", 0.0))
-            )
-            infos["survival"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("survival", 0.0))
-            )
-            infos["overheat_ticks"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("overheat_ticks", 0.0))
-            )
-            infos["pirate_encounters"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("pirate_encounters", 0.0))
-            )
-            infos["value_lost_to_pirates"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("value_lost_to_pirates", 0.0))
-            )
-            infos["fuel_used"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("fuel_used", 0.0))
-            )
-            infos["hull_damage"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("hull_damage", 0.0))
-            )
-            infos["tool_wear"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("tool_wear", 0.0))
+        safe_int = NativeProspectorCore._safe_int
+        safe_float = NativeProspectorCore._safe_float
+        safe_bool = NativeProspectorCore._safe_bool
+        for key, default in (("action", 0), ("dt", 1)):
+            infos[key][:] = np.fromiter(
+                (safe_int(row.get(key, default)) for row in rows),
+                dtype=infos[key].dtype,
+                count=count,
             )
-            infos["scan_count"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("scan_count", 0.0))
+        for key in _METRIC_FIELDS:
+            infos[key][:] = np.fromiter(
+                (safe_float(row.get(key, 0.0)) for row in rows), dtype=np.float32, count=count
             )
-            infos["mining_ticks"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("mining_ticks", 0.0))
+        for key in ("invalid_action", "terminated", "truncated"):
+            infos[key][:] = np.fromiter(
+                (safe_bool(row.get(key, False)) for row in rows), dtype=bool, count=count
             )
-            infos["cargo_utilization_avg"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("cargo_utilization_avg", 0.0))
-            )
-            infos["time_remaining"][i] = np.float32(
-                NativeProspectorCore._safe_float(row.get("time_remaining", 0.0))
-            )
-            infos["terminated"][i] = NativeProspectorCore._safe_bool(row.get("terminated", False))
-            infos["truncated"][i] = NativeProspectorCore._safe_bool(row.get("truncated", False))
 
         return infos
 
@@ -327,6 +442,19 @@ class NativeProspectorCore:
                 return False
         return True
 
+    @staticmethod
+    def _batch_buffers(first: NativeProspectorCore, count: int) -> _BatchBuffers:
+        """Return reusable FFI buffers with room for `count` cores.
+
+        The buffers live on the first core of the batch and only grow; callers copy
+        results out before the next batch call overwrites them.
+        """
+        buffers = getattr(first, "_batch_buffers_cache", None)
+        if buffers is None or buffers.capacity < count:
+            buffers = _BatchBuffers(count)
+            first._batch_buffers_cache = buffers
+        return buffers
+
     @staticmethod
     def reset_many(cores: Sequence[Any], seeds: Sequence[int]) -> np.ndarray:
         count = len(cores)
@@ -337,14 +465,16 @@ class NativeProspectorCore:
 
         if NativeProspectorCore._can_use_batch_ops(cores):
             first: NativeProspectorCore = cores[0]
-            state_array_type = ctypes.POINTER(_AbpCoreState) * count
-            state_ptrs = state_array_type(*(core._state for core in cores))
-            seed_array = (ctypes.c_uint64 * count)(*(int(seed) for seed in seeds))
+            buffers = NativeProspectorCore._batch_buffers(first, count)
+            buffers.fill_states(cores)
+            buffers.seeds[:count] = np.fromiter(
+                (int(seed) for seed in seeds), dtype=np.uint64, count=count
+            )
             obs = np.empty((count, OBS_DIM), dtype=np.float32)
             obs_ptr = obs.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
             first._lib.abp_core_reset_many(
-                state_ptrs,
-                seed_array,
+                buffers.states_ptr,
+                buffers.seeds_ptr,
                 ctypes.c_uint32(count),
                 obs_ptr,
             )
@@ -359,7 +489,15 @@ class NativeProspectorCore:
     def step_many(
         cores: Sequence[Any],
         actions: Sequence[int],
+        *,
+        infos_out: dict[str, np.ndarray] | None = None,
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Step every core once and return batched arrays plus dict-of-arrays infos.
+
+        When `infos_out` (as built by `_allocate_info_arrays(len(cores))`) is given it is
+        filled in place and returned, so callers that consume infos before the next
+        step can reuse one set of columns instead of allocating per tick.
+        """
         count = len(cores)
         if count != len(actions):
             raise ValueError("step_many requires equal lengths for cores and actions")
@@ -375,59 +513,46 @@ class NativeProspectorCore:
 
         if NativeProspectorCore._can_use_batch_ops(cores):
             first: NativeProspectorCore = cores[0]
-            state_array_type = ctypes.POINTER(_AbpCoreState) * count
-            state_ptrs = state_array_type(*(core._state for core in cores))
-
-            action_u8 = np.empty((count,), dtype=np.uint8)
-            for i in range(count):
-                action_u8[i] = np.uint8(
-                    NativeProspectorCore._coerce_action_u8(int(action_received[i]))
-                )
-            action_array = (ctypes.c_uint8 * count)(*(int(v) for v in action_u8))
+            buffers = NativeProspectorCore._batch_buffers(first, count)
+            buffers.fill_states(cores)
+            # Vectorized `_coerce_action_u8`: anything outside [0, N_ACTIONS) becomes
+            # N_ACTIONS, written straight into the cached uint8 argument buffer.
+            np.copyto(
+                buffers.actions[:count],
+                np.where(
+                    (action_received >= 0) & (action_received < N_ACTIONS),
+                    action_received,
+                    N_ACTIONS,
+                ),
+                casting="unsafe",
+            )
 
-            result_array_type = _AbpCoreStepResult * count
-            results = result_array_type()
             first._lib.abp_core_step_many(
-                state_ptrs,
-                action_array,
+                buffers.states_ptr,
+                buffers.actions_ptr,
                 ctypes.c_uint32(count),
-                results,
-            )
-
-            obs = np.empty((count, OBS_DIM), dtype=np.float32)
-            rewards = np.empty((count,), dtype=np.float32)
-            terminated = np.empty((count,), dtype=bool)
-            truncated = np.empty((count,), dtype=bool)
-            infos = NativeProspectorCore._allocate_info_arrays(
-                count, action_received=action_received
+                buffers.results_ptr,
             )
-
-            for i in range(count):
-                result = results[i]
-                obs[i] = np.ctypeslib.as_array(result.obs).astype(np.float32, copy=True)
-                rewards[i] = np.float32(result.reward)
-                terminated[i] = bool(result.terminated)
-                truncated[i] = bool(result.truncated)
-
-                infos["action"][i] = np.int16(result.action)
-                infos["dt"][i] = np.int32(result.dt)
-                infos["invalid_action"][i] = bool(result.invalid_action)
-                infos["credits"][i] = np.float32(result.credits)
-                infos["net_profit"][i] = np.float32(result.net_profit)
-                infos["profit_per_tick"][i] = np.float32(result.profit_per_tick)
-                infos["survival"][i] = np.float32(result.survival)
-                infos["overheat_ticks"][i] = np.float32(result.overheat_ticks)
-                infos["pirate_encounters"][i] = np.float32(result.pirate_encounters)
-                infos["value_lost_to_pirates"][i] = np.float32(result.value_lost_to_pirates)
-                infos["fuel_used"][i] = np.float32(result.fuel_used)
-                infos["hull_damage"][i] = np.float32(result.hull_damage)
-                infos["tool_wear"][i] = np.float32(result.tool_wear)
-                infos["scan_count"][i] = np.float32(result.scan_count)
-                infos["mining_ticks"][i] = np.float32(result.mining_ticks)
-                infos["cargo_utilization_avg"][i] = np.float32(result.cargo_utilization_avg)
-                infos["time_remaining"][i] = np.float32(result.time_remaining)
-                infos["terminated"][i] = bool(result.terminated)
-                infos["truncated"][i] = bool(result.truncated)
+            rows = buffers.results[:count]
+
+            obs = rows["obs"].copy()
+            rewards = rows["reward"].copy()
+            terminated = rows["terminated"].astype(bool)
+            truncated = rows["truncated"].astype(bool)
+            if infos_out is None:
+                infos = NativeProspectorCore._allocate_info_arrays(
+                    count, action_received=action_received
+                )
+            else:
+                infos = infos_out
+                infos["action_received"][:] = action_received
+            infos["action"][:] = rows["action"]
+            infos["dt"][:] = rows["dt"]
+            infos["invalid_action"][:] = rows["invalid_action"] != 0
+            for key in _METRIC_FIELDS:
+                infos[key][:] = rows[key]
+            infos["terminated"][:] = terminated
+            infos["truncated"][:] = truncated
 
             return obs, rewards, terminated, truncated, infos
 
@@ -444,43 +569,44 @@ class NativeProspectorCore:
             terminated[i] = bool(term_i)
             truncated[i] = bool(trunc_i)
 
-            row = dict(info_i)
+            row = info_i.copy() if isinstance(info_i, _StepInfo) else dict(info_i)
             row.setdefault("action_received", int(action_received[i]))
             row.setdefault("terminated", bool(term_i))
             row.setdefault("truncated", bool(trunc_i))
             info_rows.append(row)
 
         infos = NativeProspectorCore._infos_rows_to_arrays(info_rows, action_received)
+        if infos_out is not None:
+            for key, values in infos.items():
+                infos_out[key][:] = values
+            infos = infos_out
         return obs, rewards, terminated, truncated, infos
 
     def reset(self, seed: int) -> np.ndarray:
-        obs_buffer = (ctypes.c_float * OBS_DIM)()
-        self._lib.abp_core_reset(self._state, ctypes.c_uint64(int(seed)), obs_buffer)
-        return np.ctypeslib.as_array(obs_buffer).copy()
+        # Scalar arguments are plain ints; the declared argtypes convert them.
+        self._reset_fn(self._state, int(seed), self._reset_obs_buf)
+        return self._reset_obs_view.copy()
 
-    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, Mapping[str, Any]]:
         action_value = int(action)
-        action_u8 = self._coerce_action_u8(action_value)
-
-        result = _AbpCoreStepResult()
-        self._lib.abp_core_step(self._state, ctypes.c_uint8(action_u8), ctypes.byref(result))
-
-        obs = np.ctypeslib.as_array(result.obs).copy()
-        reward = float(result.reward)
-        terminated = bool(result.terminated)
-        truncated = bool(result.truncated)
-        info = self._info_from_result(
-            result,
-            action_received=action_value,
-            terminated=terminated,
-            truncated=truncated,
-        )
+        # Inlined `_coerce_action_u8`.
+        action_u8 = action_value if 0 <= action_value < N_ACTIONS else N_ACTIONS
+        self._step_fn(self._state, action_u8, self._result_ref)
+
+        # The result buffer is reused, so callers always receive an owned copy.
+        obs = self._obs_view.copy()
+        values = _RESULT_TAIL.unpack_from(self._result, _RESULT_TAIL_OFFSET)
+        info = _StepInfo(values, action_value)
+        reward = values[0]
+        terminated = values[1] != 0
+        truncated = values[2] != 0
         return obs, reward, terminated, truncated, info
 
     def close(self) -> None:
         if hasattr(self, "_state") and self._state:
             self._lib.abp_core_destroy(self._state)
             self._state = None
+            self._state_addr = None
 
     def __enter__(self) -> NativeProspectorCore:
         return self
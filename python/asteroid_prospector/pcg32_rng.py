@@ -2,12 +2,82 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
 _MASK64 = (1 << 64) - 1
 _MASK32 = (1 << 32) - 1
+_PCG_MULT = 6364136223846793005
+_INV_2_32 = 1.0 / 4294967296.0
+# Scalar parameter types that take the no-ndarray path for size-less draws.
+_SCALAR_TYPES = frozenset((float, int, np.float64, np.float32))
+
+# Below this many draws the scalar generator is cheaper than building a block.
+_BLOCK_MIN = 32
+
+
+@lru_cache(maxsize=8)
+def _lcg_jump_tables(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (mult^i, sum_{j<i} mult^j) mod 2**64 for i in 0..n.
+
+    The state after i steps is `mult^i * state + inc * sum_{j<i} mult^j`, so a
+    block of n consecutive states needs only these two tables. uint64 array
+    arithmetic wraps modulo 2**64, matching the scalar recurrence.
+    """
+    powers = np.empty((n + 1,), dtype=np.uint64)
+    powers[0] = 1
+    powers[1:] = _PCG_MULT
+    np.cumprod(powers, out=powers)
+    sums = np.zeros((n + 1,), dtype=np.uint64)
+    np.cumsum(powers[:-1], out=sums[1:])
+    powers.flags.writeable = False
+    sums.flags.writeable = False
+    return powers, sums
+
+
+def _unit_exponentials(u: np.ndarray) -> np.ndarray:
+    """Array form of `Pcg32Rng._draw_exponential_unit` applied to uniforms `u`."""
+    return -np.log(np.maximum(u, 1.0e-8))
+
+
+def _normals_from_uniforms(u1: np.ndarray, u2: np.ndarray) -> np.ndarray:
+    """Array form of `Pcg32Rng._draw_normal(0, 1)` for uniform pairs `(u1, u2)`."""
+    mag = np.sqrt(-2.0 * np.log(np.maximum(u1, 1.0e-8)))
+    return mag * np.cos(2.0 * np.pi * u2)
+
+
+def _integer_gammas(u: np.ndarray, shapes: tuple[int, ...]) -> np.ndarray:
+    """Integer-shape gammas from rows of uniforms, one column per entry of `shapes`.
+
+    Each row of `u` holds `sum(shapes)` uniforms in scalar `_gamma` call order; each
+    gamma is a sequential (cumsum) sum of unit exponentials.
+    """
+    exps = _unit_exponentials(u)
+    out = np.empty((u.shape[0], len(shapes)), dtype=np.float64)
+    start = 0
+    for col, k in enumerate(shapes):
+        segment = exps[:, start : start + k]
+        out[:, col] = segment[:, 0] if k == 1 else np.cumsum(segment, axis=1)[:, -1]
+        start += k
+    return out
+
+
+def _dirichlet_from_gammas(vals: np.ndarray) -> np.ndarray:
+    """Normalize rows of gamma draws as `Pcg32Rng.dirichlet` does (uniform if sum <= 0)."""
+    totals = np.sum(vals, axis=1, keepdims=True)
+    positive = totals > 0.0
+    return np.where(positive, vals / np.where(positive, totals, 1.0), 1.0 / float(vals.shape[1]))
+
+
+def _integer_shape(shape: float) -> int:
+    """Return the integer gamma shape `shape` rounds to, or 0 if it is not integral."""
+    rounded = int(round(shape))
+    if abs(shape - float(rounded)) < 1.0e-12 and rounded > 0:
+        return rounded
+    return 0
 
 
 @dataclass
@@ -29,11 +99,39 @@ class Pcg32Rng:
         xorshifted = (((oldstate >> 18) ^ oldstate) >> 27) & _MASK32
         rot = (oldstate >> 59) & 31
 
-        self._state = (oldstate * 6364136223846793005 + self._inc) & _MASK64
+        self._state = (oldstate * _PCG_MULT + self._inc) & _MASK64
         return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & _MASK32
 
+    def _next_u32_block(self, n: int) -> np.ndarray:
+        """Draw n consecutive outputs at once; identical to n `_next_u32()` calls."""
+        if n < _BLOCK_MIN:
+            # Same recurrence as `_next_u32`, kept in locals for short blocks.
+            state = self._state
+            inc = self._inc
+            out = []
+            for _ in range(n):
+                xorshifted = (((state >> 18) ^ state) >> 27) & _MASK32
+                rot = state >> 59
+                out.append(((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & _MASK32)
+                state = (state * _PCG_MULT + inc) & _MASK64
+            self._state = state
+            return np.array(out, dtype=np.uint64)
+
+        powers, sums = _lcg_jump_tables(n)
+        states = powers * np.uint64(self._state) + sums * np.uint64(self._inc)
+        self._state = int(states[n])
+
+        old = states[:n]
+        xorshifted = (((old >> np.uint64(18)) ^ old) >> np.uint64(27)) & np.uint64(_MASK32)
+        rot = old >> np.uint64(59)
+        left = (np.uint64(32) - rot) & np.uint64(31)
+        return ((xorshifted >> rot) | (xorshifted << left)) & np.uint64(_MASK32)
+
     def _next_f64(self) -> float:
-        return float(self._next_u32() / 4294967296.0)
+        return self._next_u32() * _INV_2_32
+
+    def _next_f64_block(self, n: int) -> np.ndarray:
+        return self._next_u32_block(n).astype(np.float64) * _INV_2_32
 
     def _draw_exponential_unit(self) -> float:
         u = self._next_f64()
@@ -46,10 +144,19 @@ class Pcg32Rng:
         u2 = self._next_f64()
         if u1 < 1.0e-8:
             u1 = 1.0e-8
-        mag = float(np.sqrt(-2.0 * np.log(u1)))
+        # np.log and np.cos are kept over libm: they can round differently in the last
+        # ulp (NumPy may use SIMD kernels), and the block paths (and recorded traces)
+        # use NumPy. sqrt is correctly rounded everywhere.
+        mag = math.sqrt(-2.0 * float(np.log(u1)))
         z0 = mag * float(np.cos(2.0 * np.pi * u2))
         return float(mean + sigma * z0)
 
+    def _standard_normal_block(self, shape: tuple[int, ...]) -> np.ndarray:
+        """Vectorized `_draw_normal(0, 1)`: same cos-only Box-Muller, same 2 draws each."""
+        count = int(np.prod(shape, dtype=np.int64))
+        u = self._next_f64_block(2 * count).reshape(count, 2)
+        return _normals_from_uniforms(u[:, 0], u[:, 1]).reshape(shape)
+
     def _sample_scalar(self, draw_fn, size: tuple[int, ...]) -> np.ndarray:
         arr = np.empty(size, dtype=np.float64)
         flat = arr.reshape(-1)
@@ -63,6 +170,9 @@ class Pcg32Rng:
         high: int | None = None,
         size: int | tuple[int, ...] | None = None,
     ) -> int | np.ndarray:
+        if size is None and type(low) is int and type(high) is int and high > low:
+            return low + self._next_u32() % (high - low)
+
         lo = int(low)
         hi = int(high) if high is not None else lo
         if high is None:
@@ -72,25 +182,24 @@ class Pcg32Rng:
         if span <= 0:
             raise ValueError("high must be greater than low")
 
-        def draw() -> int:
-            return lo + (self._next_u32() % span)
-
         if size is None:
-            return int(draw())
+            return lo + self._next_u32() % span
 
         shape = (size,) if isinstance(size, int) else tuple(size)
-        arr = np.empty(shape, dtype=np.int64)
-        flat = arr.reshape(-1)
-        for i in range(flat.size):
-            flat[i] = draw()
-        return arr
+        count = int(np.prod(shape, dtype=np.int64))
+        draws = self._next_u32_block(count)
+        # Modulo (not multiply-high) keeps the stream identical to the C core; for
+        # spans past the u32 range it is the identity and would overflow uint64.
+        if span <= _MASK32:
+            draws %= np.uint64(span)
+        return (draws.astype(np.int64) + lo).reshape(shape)
 
     def random(self, size: int | tuple[int, ...] | None = None) -> float | np.ndarray:
         if size is None:
             return self._next_f64()
 
         shape = (size,) if isinstance(size, int) else tuple(size)
-        return self._sample_scalar(self._next_f64, shape)
+        return self._next_f64_block(math.prod(shape)).reshape(shape)
 
     def uniform(
         self,
@@ -98,6 +207,10 @@ class Pcg32Rng:
         high: float | np.ndarray = 1.0,
         size: int | tuple[int, ...] | None = None,
     ) -> float | np.ndarray:
+        if size is None and type(low) in _SCALAR_TYPES and type(high) in _SCALAR_TYPES:
+            lo = float(low)
+            return lo + (float(high) - lo) * self._next_f64()
+
         lo_arr = np.asarray(low, dtype=np.float64)
         hi_arr = np.asarray(high, dtype=np.float64)
 
@@ -109,17 +222,13 @@ class Pcg32Rng:
         else:
             target_shape = (size,) if isinstance(size, int) else tuple(size)
 
-        lo_b = np.broadcast_to(lo_arr, target_shape)
-        hi_b = np.broadcast_to(hi_arr, target_shape)
-        out = np.empty(target_shape, dtype=np.float64)
-        flat_out = out.reshape(-1)
-        flat_lo = lo_b.reshape(-1)
-        flat_hi = hi_b.reshape(-1)
-
-        for i in range(flat_out.size):
-            flat_out[i] = flat_lo[i] + (flat_hi[i] - flat_lo[i]) * self._next_f64()
-
-        return out
+        if np.broadcast_shapes(lo_arr.shape, hi_arr.shape, target_shape) != target_shape:
+            raise ValueError(f"low/high cannot be broadcast to size {target_shape}")
+        u = self._next_f64_block(int(np.prod(target_shape, dtype=np.int64))).reshape(target_shape)
+        # Scale in place; low/high broadcast inside the ufuncs instead of as views.
+        u *= hi_arr - lo_arr
+        u += lo_arr
+        return u
 
     def normal(
         self,
@@ -127,6 +236,9 @@ class Pcg32Rng:
         scale: float | np.ndarray = 1.0,
         size: int | tuple[int, ...] | None = None,
     ) -> float | np.ndarray:
+        if size is None and type(loc) in _SCALAR_TYPES and type(scale) in _SCALAR_TYPES:
+            return self._draw_normal(float(loc), float(scale))
+
         loc_arr = np.asarray(loc, dtype=np.float64)
         scale_arr = np.asarray(scale, dtype=np.float64)
 
@@ -140,15 +252,7 @@ class Pcg32Rng:
 
         loc_b = np.broadcast_to(loc_arr, target_shape)
         scale_b = np.broadcast_to(scale_arr, target_shape)
-        out = np.empty(target_shape, dtype=np.float64)
-        flat_out = out.reshape(-1)
-        flat_loc = loc_b.reshape(-1)
-        flat_scale = scale_b.reshape(-1)
-
-        for i in range(flat_out.size):
-            flat_out[i] = self._draw_normal(float(flat_loc[i]), float(flat_scale[i]))
-
-        return out
+        return loc_b + scale_b * self._standard_normal_block(target_shape)
 
     def lognormal(
         self,
@@ -163,8 +267,8 @@ class Pcg32Rng:
         if shape <= 0.0:
             raise ValueError("shape must be positive")
 
-        rounded = int(round(shape))
-        if abs(shape - float(rounded)) < 1.0e-12 and rounded > 0:
+        rounded = _integer_shape(shape)
+        if rounded > 0:
             total = 0.0
             for _ in range(rounded):
                 total += self._draw_exponential_unit()
@@ -176,7 +280,7 @@ class Pcg32Rng:
             return self._gamma(shape + 1.0) * (u ** (1.0 / shape))
 
         d = shape - 1.0 / 3.0
-        c = 1.0 / np.sqrt(9.0 * d)
+        c = 1.0 / math.sqrt(9.0 * d)
         while True:
             x = self._draw_normal(0.0, 1.0)
             v = (1.0 + c * x) ** 3
@@ -188,6 +292,16 @@ class Pcg32Rng:
             if np.log(u) < 0.5 * x * x + d * (1.0 - v + np.log(v)):
                 return d * v
 
+    def _gamma_integer_rows(self, shapes: tuple[int, ...], rows: int) -> np.ndarray:
+        """Draw `rows` rows of integer-shape gammas, one column per entry of `shapes`.
+
+        Consumes uniforms in exactly the order of row-by-row, column-by-column
+        `_gamma` calls.
+        """
+        per_row = sum(shapes)
+        u = self._next_f64_block(rows * per_row).reshape(rows, per_row)
+        return _integer_gammas(u, shapes)
+
     def beta(
         self,
         a: float,
@@ -204,6 +318,14 @@ class Pcg32Rng:
             return float(draw())
 
         shape = (size,) if isinstance(size, int) else tuple(size)
+        count = int(np.prod(shape, dtype=np.int64))
+        ka = _integer_shape(float(a))
+        kb = _integer_shape(float(b))
+        if ka > 0 and kb > 0 and count * (ka + kb) >= _BLOCK_MIN:
+            gammas = self._gamma_integer_rows((ka, kb), count)
+            total = gammas[:, 0] + gammas[:, 1]
+            safe_total = np.where(total > 0.0, total, 1.0)
+            return np.where(total > 0.0, gammas[:, 0] / safe_total, 0.5).reshape(shape)
         return self._sample_scalar(draw, shape)
 
     def dirichlet(
@@ -229,6 +351,12 @@ class Pcg32Rng:
             return one_draw()
 
         shape = (size,) if isinstance(size, int) else tuple(size)
+        rows = int(np.prod(shape, dtype=np.int64))
+        int_shapes = tuple(_integer_shape(float(a)) for a in alpha_arr)
+        if all(k > 0 for k in int_shapes) and rows * sum(int_shapes) >= _BLOCK_MIN:
+            vals = self._gamma_integer_rows(int_shapes, rows)
+            return _dirichlet_from_gammas(vals).reshape(shape + alpha_arr.shape)
+
         out = np.empty(shape + alpha_arr.shape, dtype=np.float64)
         flat = out.reshape(-1, alpha_arr.size)
         for i in range(flat.shape[0]):
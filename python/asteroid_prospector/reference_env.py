@@ -8,8 +8,8 @@ This module implements the frozen RL interface contract:
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 import numpy as np
@@ -33,19 +33,35 @@ from .constants import (
     TIME_MAX,
     TOOL_MAX,
 )
-from .pcg32_rng import Pcg32Rng
+from .pcg32_rng import (
+    Pcg32Rng,
+    _dirichlet_from_gammas,
+    _integer_gammas,
+    _normals_from_uniforms,
+)
 
 # Observation indices intentionally mirror the frozen specification.
 MKT_PRICE_BASE = 244
 MKT_DPRICE_BASE = 250
 MKT_INV_BASE = 256
 
+# World generation draws a fixed number of uniforms per record, so each record type
+# is sampled as one (rows, draws) block whose columns follow the scalar call order:
+#   node:      random (hazard roll), uniform (hazard), uniform (pirate)
+#   asteroid:  dirichlet(ones) x6, lognormal x2, beta(3, 2) x5, uniform x1, dirichlet(ones) x6
+#   commodity: uniform (inventory), uniform (phase), uniform (period), uniform (amp)
+_NODE_DRAWS = 3
+_ASTEROID_DRAWS = 2 * N_COMMODITIES + 8
+_COMMODITY_DRAWS = 4
+
 
 @dataclass(frozen=True)
 class DiscreteActionSpace:
     n: int
 
     def contains(self, action: int) -> bool:
+        if type(action) is int:
+            return 0 <= action < self.n
         return isinstance(action, int | np.integer) and 0 <= int(action) < self.n
 
 
@@ -74,6 +90,11 @@ class RewardCfg:
     destroyed_pen: float = 100.0
     terminal_bonus_b: float = 0.002
 
+    @cached_property
+    def heat_safe(self) -> float:
+        """Heat level above which the overheat penalty applies."""
+        return self.heat_safe_frac * HEAT_MAX
+
 
 @dataclass(frozen=True)
 class ReferenceEnvConfig:
@@ -171,14 +192,13 @@ class ReferenceEnvConfig:
     reward_cfg: RewardCfg = RewardCfg()
 
 
-@dataclass
+@dataclass(slots=True)
 class _StepSnapshot:
     credits_before: float
     fuel_before: float
     hull_before: float
     heat_before: float
     tool_before: float
-    cargo_before: np.ndarray
     cargo_value_before: float
     value_lost_to_pirates_before: float
 
@@ -191,12 +211,22 @@ def _sigmoid(x: float) -> float:
     return 1.0 / (1.0 + float(np.exp(-x)))
 
 
-def _normalize_probs(values: np.ndarray) -> np.ndarray:
-    arr = np.clip(values.astype(np.float64, copy=False), 1.0e-8, None)
-    total = float(np.sum(arr))
+def _normalize_probs(values: np.ndarray, out: np.ndarray) -> None:
+    """Normalize `values` into the float64 buffer `out` without temporaries."""
+    np.copyto(out, values)
+    np.maximum(out, 1.0e-8, out=out)
+    total = float(out.sum())
     if total <= 0.0:
-        return np.full_like(arr, 1.0 / float(arr.size), dtype=np.float64)
-    return arr / total
+        out.fill(1.0 / float(out.size))
+        return
+    out /= total
+
+
+def _normalize_prob_rows(values: np.ndarray) -> np.ndarray:
+    """Row-wise `_normalize_probs` for a float64 2D array, in place."""
+    np.maximum(values, 1.0e-8, out=values)
+    values /= values.sum(axis=1, keepdims=True)
+    return values
 
 
 def compute_reward(
@@ -231,11 +261,10 @@ def compute_reward(
     r_wear = -cfg.delta_wear * max(0.0, snapshot.tool_before - tool_after) / 10.0
     r_damage = -cfg.zeta_damage * max(0.0, snapshot.hull_before - hull_after) / 10.0
 
-    heat_safe = cfg.heat_safe_frac * HEAT_MAX
-    heat_excess = max(0.0, heat_after - heat_safe)
+    heat_excess = max(0.0, heat_after - cfg.heat_safe)
     r_heat = -cfg.epsilon_heat * (heat_excess / HEAT_MAX) ** 2
 
-    r_scan = -cfg.scan_cost if action in (8, 9, 10) else 0.0
+    r_scan = -cfg.scan_cost if 8 <= action <= 10 else 0.0
     r_invalid = -cfg.invalid_action_pen if invalid else 0.0
 
     delta_pirate_loss = max(
@@ -272,6 +301,12 @@ class ProspectorReferenceEnv:
 
     def __init__(self, config: ReferenceEnvConfig | None = None, seed: int | None = None) -> None:
         self.config = config or ReferenceEnvConfig()
+        # Config is frozen, so its price tables are converted once instead of per tick.
+        self._price_base = np.array(self.config.price_base, dtype=np.float64)
+        self._price_min = np.array(self.config.price_min, dtype=np.float64)
+        self._price_max = np.array(self.config.price_max, dtype=np.float64)
+        self._edge_time_high = int(self.config.travel_time_max) + 1
+        self._edge_fuel_high = self.config.travel_fuel_cost_max * 0.7
 
         self.action_space = DiscreteActionSpace(N_ACTIONS)
         self.observation_space = BoxObservationSpace(
@@ -291,16 +326,27 @@ class ProspectorReferenceEnv:
     def _init_buffers(self) -> None:
         self.node_count = 0
         self.current_node = 0
+        # Kept in step with `current_node` by world generation and travel.
+        self._at_station = False
+        self._station_dist = [0] * MAX_NODES
 
         self.node_type = np.full((MAX_NODES,), NODE_CLUSTER, dtype=np.int32)
         self.node_hazard = np.zeros((MAX_NODES,), dtype=np.float32)
         self.node_pirate = np.zeros((MAX_NODES,), dtype=np.float32)
 
         self.neighbors = np.full((MAX_NODES, MAX_NEIGHBORS), -1, dtype=np.int32)
+        # Mirrors of `neighbors` for world generation: slots fill in order and are never
+        # freed, so a node's degree is also its first free slot.
+        self._edge_set: set[tuple[int, int]] = set()
+        self._degree = [0] * MAX_NODES
+        # Edges accepted by `_add_edge` (with their threat noise), stored in one pass.
+        self._pending_edges: list[tuple[int, int, int, int, int, float, float]] = []
         self.edge_travel_time = np.ones((MAX_NODES, MAX_NEIGHBORS), dtype=np.int32)
         self.edge_fuel_cost = np.zeros((MAX_NODES, MAX_NEIGHBORS), dtype=np.float32)
         self.edge_threat_true = np.zeros((MAX_NODES, MAX_NEIGHBORS), dtype=np.float32)
         self.edge_threat_est = np.full((MAX_NODES, MAX_NEIGHBORS), 0.5, dtype=np.float32)
+        self._probs_scratch = np.empty((N_COMMODITIES,), dtype=np.float64)
+        self._value_scratch = np.empty((2, N_COMMODITIES), dtype=np.float64)
 
         self.ast_valid = np.zeros((MAX_NODES, MAX_ASTEROIDS), dtype=np.int8)
         self.true_comp = np.zeros((MAX_NODES, MAX_ASTEROIDS, N_COMMODITIES), dtype=np.float32)
@@ -313,16 +359,23 @@ class ProspectorReferenceEnv:
         self.scan_conf = np.zeros((MAX_NODES, MAX_ASTEROIDS), dtype=np.float32)
         self.depletion = np.zeros((MAX_NODES, MAX_ASTEROIDS), dtype=np.float32)
 
-        self.price = np.array(self.config.price_base, dtype=np.float32)
-        self.prev_price = np.array(self.config.price_base, dtype=np.float32)
+        # Market state shares one (4, N_COMMODITIES) block; the rows below are the
+        # interface and every update writes through them in place.
+        self._market = np.zeros((4, N_COMMODITIES), dtype=np.float32)
+        self.price = self._market[0]
+        self.prev_price = self._market[1]
+        self.station_inventory = self._market[2]
+        self.recent_sales = self._market[3]
+        self.price[:] = self.config.price_base
+        self.prev_price[:] = self.config.price_base
         self.price_phase = np.zeros((N_COMMODITIES,), dtype=np.float32)
         self.price_period = np.full((N_COMMODITIES,), 256.0, dtype=np.float32)
         self.price_amp = np.zeros((N_COMMODITIES,), dtype=np.float32)
 
-        self.station_inventory = np.zeros((N_COMMODITIES,), dtype=np.float32)
-        self.recent_sales = np.zeros((N_COMMODITIES,), dtype=np.float32)
-
         self.selected_asteroid = -1
+        # Whether `selected_asteroid` is a valid, undepleted asteroid at `current_node`;
+        # updated by selection, travel, mining and reset.
+        self._selected_valid = False
         self.escape_buff_ticks = 0
         self.stabilize_buff_ticks = np.zeros((MAX_ASTEROIDS,), dtype=np.int32)
 
@@ -369,6 +422,7 @@ class ProspectorReferenceEnv:
         self._generate_world()
 
         self.selected_asteroid = -1
+        self._selected_valid = False
         self.escape_buff_ticks = 0
         self.stabilize_buff_ticks.fill(0)
 
@@ -426,7 +480,6 @@ class ProspectorReferenceEnv:
             hull_before=self.hull,
             heat_before=self.heat,
             tool_before=self.tool_condition,
-            cargo_before=self.cargo.copy(),
             cargo_value_before=self._est_cargo_value(),
             value_lost_to_pirates_before=self.value_lost_to_pirates,
         )
@@ -436,7 +489,8 @@ class ProspectorReferenceEnv:
         invalid_action = False
         dt = 1
 
-        if not self.action_space.contains(action_int):
+        # `action_int` is already an int, so the range is all `action_space.contains` checks.
+        if not 0 <= action_int < N_ACTIONS:
             invalid_action = True
             action_int = 6
 
@@ -599,45 +653,50 @@ class ProspectorReferenceEnv:
         return obs, reward, terminated, truncated, info
 
     def _generate_world(self) -> None:
-        self.node_count = int(self._rng.integers(8, MAX_NODES + 1))
+        self.node_count = self._rng.integers(8, MAX_NODES + 1)
         self.current_node = 0
 
         self.node_type.fill(NODE_CLUSTER)
         self.node_hazard.fill(0.0)
         self.node_pirate.fill(0.0)
         self.node_type[0] = NODE_STATION
-
-        for node in range(1, self.node_count):
-            is_hazard = float(self._rng.random()) < 0.25
-            self.node_type[node] = NODE_HAZARD if is_hazard else NODE_CLUSTER
-            self.node_hazard[node] = np.float32(self._rng.uniform(0.05, 0.35))
-            self.node_pirate[node] = np.float32(self._rng.uniform(0.05, 0.30))
-            if is_hazard:
-                self.node_hazard[node] = np.float32(
-                    _clamp(float(self.node_hazard[node]) + 0.25, 0.0, 1.0)
-                )
-                self.node_pirate[node] = np.float32(
-                    _clamp(float(self.node_pirate[node]) + 0.12, 0.0, 1.0)
-                )
+        self._at_station = True
+
+        n_field = self.node_count - 1
+        u = self._rng.random((n_field, _NODE_DRAWS))
+        is_hazard = u[:, 0] < 0.25
+        hazard = (0.05 + (0.35 - 0.05) * u[:, 1]).astype(np.float32)
+        pirate = (0.05 + (0.30 - 0.05) * u[:, 2]).astype(np.float32)
+        hazard_boost = np.minimum(hazard.astype(np.float64) + 0.25, 1.0).astype(np.float32)
+        pirate_boost = np.minimum(pirate.astype(np.float64) + 0.12, 1.0).astype(np.float32)
+        self.node_type[1 : self.node_count] = np.where(is_hazard, NODE_HAZARD, NODE_CLUSTER)
+        self.node_hazard[1 : self.node_count] = np.where(is_hazard, hazard_boost, hazard)
+        self.node_pirate[1 : self.node_count] = np.where(is_hazard, pirate_boost, pirate)
 
         self.neighbors.fill(-1)
+        self._edge_set.clear()
+        self._degree = [0] * MAX_NODES
         self.edge_travel_time.fill(1)
         self.edge_fuel_cost.fill(0.0)
         self.edge_threat_true.fill(0.0)
         self.edge_threat_est.fill(0.5)
 
+        # Candidate pairs stay scalar draws: each accepted edge draws its own
+        # attributes in between, so the stream cannot be pre-drawn in bulk.
+        integers = self._rng.integers
         for node in range(1, self.node_count):
-            parent = int(self._rng.integers(0, node))
-            self._add_edge(node, parent)
+            self._add_edge(node, integers(0, node))
 
         extra_attempts = max(0, self.node_count)
         for _ in range(extra_attempts):
-            u = int(self._rng.integers(0, self.node_count))
-            v = int(self._rng.integers(0, self.node_count))
+            u = integers(0, self.node_count)
+            v = integers(0, self.node_count)
             if u == v:
                 continue
             self._add_edge(u, v)
+        self._write_pending_edges()
 
+        self._compute_station_distances()
         self._generate_asteroids()
         self._generate_market()
 
@@ -652,41 +711,42 @@ class ProspectorReferenceEnv:
         if u_slot < 0 or v_slot < 0:
             return
 
-        t_time = int(self._rng.integers(1, int(self.config.travel_time_max) + 1))
-        fuel_cost = float(self._rng.uniform(20.0, self.config.travel_fuel_cost_max * 0.7))
-
-        threat = float(
-            _clamp(
-                0.5 * (self.node_hazard[u] + self.node_hazard[v])
-                + 0.5 * (self.node_pirate[u] + self.node_pirate[v])
-                + float(self._rng.normal(0.0, 0.05)),
-                0.0,
-                1.0,
-            )
-        )
-
-        self.neighbors[u, u_slot] = v
-        self.neighbors[v, v_slot] = u
-
-        self.edge_travel_time[u, u_slot] = t_time
-        self.edge_travel_time[v, v_slot] = t_time
+        t_time = self._rng.integers(1, self._edge_time_high)
+        fuel_cost = self._rng.uniform(20.0, self._edge_fuel_high)
+        threat_noise = self._rng.normal(0.0, 0.05)
 
-        self.edge_fuel_cost[u, u_slot] = fuel_cost
-        self.edge_fuel_cost[v, v_slot] = fuel_cost
+        self._edge_set.add((u, v) if u < v else (v, u))
+        self._degree[u] += 1
+        self._degree[v] += 1
+        self._pending_edges.append((u, u_slot, v, v_slot, t_time, fuel_cost, threat_noise))
 
-        self.edge_threat_true[u, u_slot] = threat
-        self.edge_threat_true[v, v_slot] = threat
-        self.edge_threat_est[u, u_slot] = 0.5
-        self.edge_threat_est[v, v_slot] = 0.5
+    def _write_pending_edges(self) -> None:
+        """Store the edges accepted by `_add_edge` into both endpoints' slot arrays."""
+        if not self._pending_edges:
+            return
+        u, u_slot, v, v_slot, t_time, fuel_cost, threat_noise = (
+            np.array(column) for column in zip(*self._pending_edges, strict=True)
+        )
+        self._pending_edges = []
+        # float32 node terms with the noise rounded to float32 first, as the scalar
+        # `np.float32 + float` expression evaluates it.
+        threat = 0.5 * (self.node_hazard[u] + self.node_hazard[v])
+        threat += 0.5 * (self.node_pirate[u] + self.node_pirate[v])
+        threat += threat_noise.astype(np.float32)
+        threat = np.minimum(np.maximum(threat, 0.0), 1.0)
+        rows = np.concatenate((u, v))
+        slots = np.concatenate((u_slot, v_slot))
+        self.neighbors[rows, slots] = np.concatenate((v, u))
+        self.edge_travel_time[rows, slots] = np.tile(t_time, 2)
+        self.edge_fuel_cost[rows, slots] = np.tile(fuel_cost, 2)
+        self.edge_threat_true[rows, slots] = np.tile(threat, 2)
 
     def _edge_exists(self, u: int, v: int) -> bool:
-        return bool(np.any(self.neighbors[u] == v))
+        return ((u, v) if u < v else (v, u)) in self._edge_set
 
     def _first_free_slot(self, node: int) -> int:
-        slots = np.where(self.neighbors[node] < 0)[0]
-        if slots.size == 0:
-            return -1
-        return int(slots[0])
+        degree = self._degree[node]
+        return degree if degree < MAX_NEIGHBORS else -1
 
     def _generate_asteroids(self) -> None:
         self.ast_valid.fill(0)
@@ -700,58 +760,60 @@ class ProspectorReferenceEnv:
         self.scan_conf.fill(0.0)
         self.depletion.fill(0.0)
 
+        # Only each node's count and uniform block come off the stream in node order;
+        # the transforms then run once over every asteroid row in the world.
+        blocks: list[np.ndarray] = []
         for node in range(self.node_count):
             if self.node_type[node] == NODE_STATION:
                 continue
-
             n_ast = int(self._rng.integers(5, MAX_ASTEROIDS + 1))
             self.ast_valid[node, :n_ast] = 1
+            blocks.append(self._rng.random((n_ast, _ASTEROID_DRAWS)))
+        if not blocks:
+            return
 
-            for a_idx in range(n_ast):
-                true_comp = self._rng.dirichlet(np.ones((N_COMMODITIES,), dtype=np.float64))
-                self.true_comp[node, a_idx] = true_comp.astype(np.float32)
-
-                self.richness[node, a_idx] = float(
-                    _clamp(float(self._rng.lognormal(mean=-0.2, sigma=0.65)), 0.2, 4.0)
-                )
-                self.stability_true[node, a_idx] = float(self._rng.beta(3.0, 2.0))
-                self.noise_profile[node, a_idx] = float(self._rng.uniform(0.04, 0.22))
-
-                self.comp_est[node, a_idx] = (
-                    self._rng.dirichlet(np.ones((N_COMMODITIES,), dtype=np.float64))
-                ).astype(np.float32)
-                self.stability_est[node, a_idx] = 0.5
-                self.scan_conf[node, a_idx] = 0.10
-                self.depletion[node, a_idx] = 0.0
+        u = np.concatenate(blocks)
+        ones = (1,) * N_COMMODITIES
+        true_comp = _dirichlet_from_gammas(_integer_gammas(u[:, :N_COMMODITIES], ones))
+        col = N_COMMODITIES
+        richness = np.exp(-0.2 + 0.65 * _normals_from_uniforms(u[:, col], u[:, col + 1]))
+        gammas = _integer_gammas(u[:, col + 2 : col + 7], (3, 2))
+        total = gammas[:, 0] + gammas[:, 1]
+        stability = np.where(total > 0.0, gammas[:, 0] / np.where(total > 0.0, total, 1.0), 0.5)
+        noise = 0.04 + (0.22 - 0.04) * u[:, col + 7]
+        comp_est = _dirichlet_from_gammas(_integer_gammas(u[:, col + 8 :], ones))
+
+        # Valid slots are a prefix of each node's row, so the row-major mask visits
+        # asteroids in the same (node, slot) order the blocks were drawn in.
+        live = self.ast_valid > 0
+        self.true_comp[live] = true_comp
+        self.richness[live] = np.clip(richness, 0.2, 4.0)
+        self.stability_true[live] = stability
+        self.noise_profile[live] = noise
+        self.comp_est[live] = comp_est
+        self.stability_est[live] = 0.5
+        self.scan_conf[live] = 0.10
 
     def _generate_market(self) -> None:
         self.recent_sales.fill(0.0)
 
-        base = np.array(self.config.price_base, dtype=np.float64)
-
-        for c_idx in range(N_COMMODITIES):
-            self.station_inventory[c_idx] = np.float32(self._rng.uniform(20.0, 120.0))
-
-            phase = float(self._rng.uniform(0.0, 2.0 * np.pi))
-            period = float(self._rng.uniform(180.0, 380.0))
-            amp_factor = float(self._rng.uniform(0.10, 0.30))
-            self.price_phase[c_idx] = np.float32(phase)
-            self.price_period[c_idx] = np.float32(period)
-            self.price_amp[c_idx] = np.float32(base[c_idx] * amp_factor)
+        u = self._rng.random((N_COMMODITIES, _COMMODITY_DRAWS))
+        self.station_inventory[:] = 20.0 + (120.0 - 20.0) * u[:, 0]
+        self.price_phase[:] = 2.0 * np.pi * u[:, 1]
+        self.price_period[:] = 180.0 + (380.0 - 180.0) * u[:, 2]
+        self.price_amp[:] = self._price_base * (0.10 + (0.30 - 0.10) * u[:, 3])
 
-            cycle = float(self.price_amp[c_idx]) * float(np.sin(float(self.price_phase[c_idx])))
-            self.price[c_idx] = np.float32(
-                _clamp(
-                    float(base[c_idx] + cycle),
-                    float(self.config.price_min[c_idx]),
-                    float(self.config.price_max[c_idx]),
-                )
-            )
-            self.prev_price[c_idx] = self.price[c_idx]
+        cycle = self.price_amp.astype(np.float64) * np.sin(self.price_phase.astype(np.float64))
+        self.price[:] = np.clip(self._price_base + cycle, self._price_min, self._price_max)
+        self.prev_price[:] = self.price
 
     def _apply_hold(self) -> None:
-        self.alert = max(0.0, self.alert - self.config.alert_decay_hold)
-        self._passive_heat_dissipation(1)
+        # `max(0.0, x - d)` and one tick of `_passive_heat_dissipation`, without the calls.
+        cfg = self.config
+        decay = cfg.alert_decay_hold
+        self.alert = self.alert - decay if self.alert > decay else 0.0
+        cooling = cfg.heat_dissipation_per_tick
+        self.heat = self.heat - cooling if self.heat > cooling else 0.0
 
     def _apply_emergency_burn(self) -> None:
         self.fuel -= self.config.emergency_burn_fuel
@@ -770,7 +832,9 @@ class ProspectorReferenceEnv:
 
         self.fuel -= fuel_cost
         self.current_node = neighbor
+        self._at_station = int(self.node_type[neighbor]) == NODE_STATION
         self.selected_asteroid = -1
+        self._selected_valid = False
 
         self._apply_edge_hazards_and_pirates(dt=dt, edge_threat=threat)
         return dt, False
@@ -790,14 +854,23 @@ class ProspectorReferenceEnv:
 
     def _update_cluster_priors_with_noise(self) -> None:
         node = self.current_node
-        valid_indices = np.where(self.ast_valid[node] > 0)[0]
-        for a_idx in valid_indices:
-            self._update_asteroid_estimates(int(a_idx), mode="wide")
+        valid_indices = np.flatnonzero(self.ast_valid[node] > 0)
+        if valid_indices.size:
+            self._update_asteroid_estimates_batch(valid_indices, mode="wide")
 
     def _update_asteroid_estimates(self, asteroid: int, mode: str) -> None:
         if self.ast_valid[self.current_node, asteroid] == 0:
             return
+        # A one-row slice keeps the batch update on cheap basic indexing.
+        self._update_asteroid_estimates_batch(slice(asteroid, asteroid + 1), mode=mode)
 
+    def _update_asteroid_estimates_batch(self, asteroids: np.ndarray | slice, mode: str) -> None:
+        """Scan update for valid `asteroids` at the current node, in index order.
+
+        Each asteroid consumes `2 * N_COMMODITIES` uniforms for its composition noise
+        and 2 for its stability noise, exactly as one `normal(0, sigma, N_COMMODITIES)`
+        followed by one scalar `normal(0, sigma)` per asteroid would.
+        """
         if mode == "wide":
             blend = 0.22
             conf_gain = 0.10
@@ -812,38 +885,43 @@ class ProspectorReferenceEnv:
             noise_mult = 0.55
 
         node = self.current_node
-        base_noise = float(self.noise_profile[node, asteroid])
-        conf = float(self.scan_conf[node, asteroid])
-        sigma = base_noise * (1.0 - conf + 0.1) * noise_mult
-
-        noisy_truth = self.true_comp[node, asteroid].astype(np.float64) + self._rng.normal(
-            0.0, sigma, N_COMMODITIES
-        )
-        noisy_truth = _normalize_probs(noisy_truth)
-
-        prev_est = self.comp_est[node, asteroid].astype(np.float64)
-        new_est = _normalize_probs((1.0 - blend) * prev_est + blend * noisy_truth)
-        self.comp_est[node, asteroid] = new_est.astype(np.float32)
-
-        stable_truth = float(self.stability_true[node, asteroid])
-        stable_noisy = _clamp(stable_truth + float(self._rng.normal(0.0, sigma)), 0.0, 1.0)
-        stable_est = (1.0 - blend) * float(
-            self.stability_est[node, asteroid]
-        ) + blend * stable_noisy
-        self.stability_est[node, asteroid] = np.float32(_clamp(stable_est, 0.0, 1.0))
-
-        conf_next = _clamp(conf + conf_gain, 0.0, 1.0)
-        self.scan_conf[node, asteroid] = np.float32(conf_next)
+        conf = self.scan_conf[node, asteroids].astype(np.float64)
+        sigma = self.noise_profile[node, asteroids].astype(np.float64) * (1.0 - conf + 0.1)
+        sigma *= noise_mult
+
+        n_comp = 2 * N_COMMODITIES
+        u = self._rng.random((conf.shape[0], n_comp + 2))
+        comp_noise = _normals_from_uniforms(u[:, 0:n_comp:2], u[:, 1:n_comp:2])
+        noisy_truth = self.true_comp[node, asteroids].astype(np.float64)
+        noisy_truth += sigma[:, None] * comp_noise
+        _normalize_prob_rows(noisy_truth)
+
+        new_est = self.comp_est[node, asteroids].astype(np.float64)
+        new_est *= 1.0 - blend
+        noisy_truth *= blend
+        new_est += noisy_truth
+        self.comp_est[node, asteroids] = _normalize_prob_rows(new_est)
+
+        stable_noise = sigma * _normals_from_uniforms(u[:, n_comp], u[:, n_comp + 1])
+        stable_truth = self.stability_true[node, asteroids].astype(np.float64)
+        # Bounded via ufuncs; np.clip's Python-level dispatch dominates at these sizes.
+        stable_noisy = np.minimum(np.maximum(stable_truth + stable_noise, 0.0), 1.0)
+        stable_est = (1.0 - blend) * self.stability_est[node, asteroids].astype(np.float64)
+        stable_est += blend * stable_noisy
+        self.stability_est[node, asteroids] = np.minimum(np.maximum(stable_est, 0.0), 1.0)
+
+        self.scan_conf[node, asteroids] = np.minimum(conf + conf_gain, 1.0)
 
     def _update_neighbor_threat_estimates(self) -> None:
-        for slot in range(MAX_NEIGHBORS):
-            neighbor = int(self.neighbors[self.current_node, slot])
-            if neighbor < 0:
-                continue
-            truth = float(self.edge_threat_true[self.current_node, slot])
-            est = float(self.edge_threat_est[self.current_node, slot])
-            noisy = _clamp(truth + float(self._rng.normal(0.0, 0.08)), 0.0, 1.0)
-            self.edge_threat_est[self.current_node, slot] = np.float32(0.25 * est + 0.75 * noisy)
+        # Slots fill in order, so the occupied ones are the first `degree`; each
+        # consumes one uniform pair, exactly as a scalar normal draw would.
+        node = self.current_node
+        degree = self._degree[node]
+        u = self._rng.random((degree, 2))
+        noise = 0.08 * _normals_from_uniforms(u[:, 0], u[:, 1])
+        noisy = np.minimum(np.maximum(self.edge_threat_true[node, :degree] + noise, 0.0), 1.0)
+        est = self.edge_threat_est[node, :degree]
+        est[:] = 0.25 * est.astype(np.float64) + 0.75 * noisy
 
     def _select_asteroid(self, asteroid: int) -> bool:
         if asteroid < 0 or asteroid >= MAX_ASTEROIDS:
@@ -853,16 +931,11 @@ class ProspectorReferenceEnv:
         if float(self.depletion[self.current_node, asteroid]) >= 1.0:
             return False
         self.selected_asteroid = asteroid
+        self._selected_valid = True
         return True
 
     def _selected_asteroid_valid(self) -> bool:
-        if self.selected_asteroid < 0 or self.selected_asteroid >= MAX_ASTEROIDS:
-            return False
-        if self.ast_valid[self.current_node, self.selected_asteroid] == 0:
-            return False
-        if float(self.depletion[self.current_node, self.selected_asteroid]) >= 1.0:
-            return False
-        return True
+        return self._selected_valid
 
     def _mine_selected(self, action: int) -> None:
         mode = {28: "cons", 29: "std", 30: "agg"}[action]
@@ -935,6 +1008,8 @@ class ProspectorReferenceEnv:
             self.node_hazard[node] = np.float32(
                 _clamp(float(self.node_hazard[node]) + 0.1, 0.0, 1.0)
             )
+        if float(self.depletion[node, a_idx]) >= 1.0:
+            self._selected_valid = False
 
     def _refine_some_cargo(self) -> None:
         low_value = float(self.cargo[0] + self.cargo[1])
@@ -1034,9 +1109,8 @@ class ProspectorReferenceEnv:
         if self.escape_buff_ticks > 0:
             self.escape_buff_ticks = max(0, self.escape_buff_ticks - dt)
 
-        for a_idx in range(MAX_ASTEROIDS):
-            if self.stabilize_buff_ticks[a_idx] > 0:
-                self.stabilize_buff_ticks[a_idx] = max(0, self.stabilize_buff_ticks[a_idx] - dt)
+        buff = self.stabilize_buff_ticks
+        np.maximum(buff - dt, 0, out=buff, where=buff > 0)
 
         if self.heat > HEAT_MAX:
             overflow = self.heat - HEAT_MAX
@@ -1110,11 +1184,11 @@ class ProspectorReferenceEnv:
         self.alert += 8.0
 
     def _update_market(self, dt: int) -> None:
-        self.prev_price = self.price.copy()
+        self.prev_price[:] = self.price
 
-        base = np.array(self.config.price_base, dtype=np.float64)
-        p_min = np.array(self.config.price_min, dtype=np.float64)
-        p_max = np.array(self.config.price_max, dtype=np.float64)
+        base = self._price_base
+        p_min = self._price_min
+        p_max = self._price_max
 
         t = float(self.ticks_elapsed + dt)
         cycles = self.price_amp.astype(np.float64) * np.sin(
@@ -1128,11 +1202,12 @@ class ProspectorReferenceEnv:
         noise = self._rng.normal(0.0, noise_std)
 
         new_price = np.clip(base + cycles - inv_pressure - sale_pressure + noise, p_min, p_max)
-        self.price = new_price.astype(np.float32)
+        self.price[:] = new_price
 
         decay = float(np.exp(-float(dt) / self.config.sales_decay_tau))
         self.recent_sales *= np.float32(decay)
-        self.station_inventory = np.maximum(self.station_inventory * np.float32(0.998), 0.0)
+        self.station_inventory *= np.float32(0.998)
+        np.maximum(self.station_inventory, 0.0, out=self.station_inventory)
 
     def _clamp_state(self) -> None:
         self.fuel = _clamp(self.fuel, 0.0, FUEL_MAX)
@@ -1153,33 +1228,38 @@ class ProspectorReferenceEnv:
         self._cargo_util_count += float(dt)
 
     def _est_cargo_value(self) -> float:
-        return float(np.dot(self.cargo.astype(np.float64), self.price.astype(np.float64)))
+        # Widen into scratch rows rather than two fresh float64 copies.
+        scratch = self._value_scratch
+        scratch[0] = self.cargo
+        scratch[1] = self.price
+        return float(scratch[0].dot(scratch[1]))
 
     def _is_at_station(self) -> bool:
-        return int(self.node_type[self.current_node]) == NODE_STATION
+        return self._at_station
 
     def _steps_to_station(self) -> int:
-        if self.current_node == 0:
-            return 0
-
-        visited = np.zeros((MAX_NODES,), dtype=np.int8)
-        queue: deque[tuple[int, int]] = deque()
-
-        visited[self.current_node] = 1
-        queue.append((self.current_node, 0))
-
-        while queue:
-            node, dist = queue.popleft()
-            for slot in range(MAX_NEIGHBORS):
-                nxt = int(self.neighbors[node, slot])
-                if nxt < 0 or nxt >= self.node_count or visited[nxt]:
+        return self._station_dist[self.current_node]
+
+    def _compute_station_distances(self) -> None:
+        # Edges are undirected and fixed once the world is built, so one BFS from the
+        # station answers `_steps_to_station` for every node. The queue is a preallocated
+        # list read through a head index; each node is enqueued at most once.
+        dist = [MAX_NODES - 1] * MAX_NODES
+        dist[0] = 0
+        queue = [0] * self.node_count
+        head, tail = 0, 1
+        neighbors = self.neighbors.tolist()
+        while head < tail:
+            node = queue[head]
+            head += 1
+            step = dist[node] + 1
+            for nxt in neighbors[node]:
+                if nxt < 0 or nxt >= self.node_count or nxt == 0 or dist[nxt] <= step:
                     continue
-                if nxt == 0:
-                    return dist + 1
-                visited[nxt] = 1
-                queue.append((nxt, dist + 1))
-
-        return MAX_NODES - 1
+                dist[nxt] = step
+                queue[tail] = nxt
+                tail += 1
+        self._station_dist = dist
 
     def _build_observation(self) -> np.ndarray:
         obs = self._obs
@@ -1237,14 +1317,15 @@ class ProspectorReferenceEnv:
             )
             obs[base + 6] = np.float32(_clamp(threat, 0.0, 1.0))
 
+        comp = self._probs_scratch
         for a_idx in range(MAX_ASTEROIDS):
             base = 68 + 11 * a_idx
             if self.ast_valid[self.current_node, a_idx] == 0:
                 continue
 
             obs[base] = 1.0
-            comp = _normalize_probs(self.comp_est[self.current_node, a_idx].astype(np.float64))
-            obs[base + 1 : base + 7] = comp.astype(np.float32)
+            _normalize_probs(self.comp_est[self.current_node, a_idx], out=comp)
+            obs[base + 1 : base + 7] = comp
             obs[base + 7] = np.float32(
                 _clamp(float(self.stability_est[self.current_node, a_idx]), 0.0, 1.0)
             )
@@ -1256,7 +1337,7 @@ class ProspectorReferenceEnv:
             )
             obs[base + 10] = np.float32(float(a_idx == self.selected_asteroid))
 
-        price_base = np.array(self.config.price_base, dtype=np.float64)
+        price_base = self._price_base
         price_norm = np.divide(
             self.price.astype(np.float64),
             price_base,
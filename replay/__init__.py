@@ -2,12 +2,20 @@
 
 from .index import (
     REPLAY_INDEX_SCHEMA_VERSION,
+    ReplayEntryTable,
     append_replay_entry,
     filter_replay_entries,
     get_replay_entry_by_id,
+    json_loads,
+    load_replay_count,
     load_replay_index,
+    read_replay_count,
+    replay_count_path,
+    resolve_replay_index_path,
+    write_replay_count,
 )
 from .schema import REPLAY_SCHEMA_VERSION, frame_from_step, validate_replay_frame
+from .seek import ReplaySeekIndex, iter_replay_lines
 
 __all__ = [
     "REPLAY_SCHEMA_VERSION",
@@ -15,7 +23,16 @@ __all__ = [
     "frame_from_step",
     "validate_replay_frame",
     "load_replay_index",
+    "json_loads",
+    "load_replay_count",
+    "read_replay_count",
+    "write_replay_count",
+    "replay_count_path",
+    "resolve_replay_index_path",
     "append_replay_entry",
     "filter_replay_entries",
     "get_replay_entry_by_id",
+    "ReplayEntryTable",
+    "ReplaySeekIndex",
+    "iter_replay_lines",
 ]
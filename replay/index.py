@@ -5,6 +5,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
+
 REPLAY_INDEX_SCHEMA_VERSION = 1
 
 
@@ -12,6 +15,18 @@ def now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def json_loads(raw: str | bytes) -> Any:
+    """Parse JSON with orjson; raises `json.JSONDecodeError` on invalid input.
+
+    Documents orjson rejects but the stdlib accepts (NaN/Infinity tokens, integers past
+    64 bits) are parsed by `json.loads`.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
 def default_replay_index(*, run_id: str) -> dict[str, Any]:
     return {
         "schema_version": REPLAY_INDEX_SCHEMA_VERSION,
@@ -21,11 +36,20 @@ def default_replay_index(*, run_id: str) -> dict[str, Any]:
     }
 
 
+def resolve_replay_index_path(*, run_dir: Path, metadata: dict[str, Any] | None) -> Path:
+    """Replay index of a run: `replay_index_path` from its metadata, else `replay_index.json`."""
+    if metadata is not None:
+        raw_path = metadata.get("replay_index_path")
+        if isinstance(raw_path, str) and raw_path.strip() != "":
+            return run_dir / raw_path
+    return run_dir / "replay_index.json"
+
+
 def load_replay_index(*, path: Path, run_id: str) -> dict[str, Any]:
     if not path.exists():
         return default_replay_index(run_id=run_id)
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json_loads(path.read_bytes())
     if int(payload.get("schema_version", -1)) != REPLAY_INDEX_SCHEMA_VERSION:
         raise ValueError(
             "unsupported replay index schema version: " f"{payload.get('schema_version')}"
@@ -40,6 +64,58 @@ def load_replay_index(*, path: Path, run_id: str) -> dict[str, Any]:
     return payload
 
 
+def replay_count_path(index_path: Path) -> Path:
+    """Sidecar next to a replay index holding its entry count (`replay_index.count`)."""
+    return index_path.with_suffix(".count")
+
+
+def write_replay_count(*, path: Path, run_id: str, count: int) -> None:
+    """Record `count` for the index at `path`, stamped with the index's current mtime/size."""
+    stat = path.stat()
+    payload = {
+        "schema_version": REPLAY_INDEX_SCHEMA_VERSION,
+        "run_id": run_id,
+        "entry_count": int(count),
+        "index_stamp": [stat.st_mtime_ns, stat.st_size],
+    }
+    replay_count_path(path).write_text(json.dumps(payload), encoding="utf-8")
+
+
+def read_replay_count(*, path: Path, run_id: str) -> int | None:
+    """Entry count from the sidecar of the index at `path`, or None if it can't be trusted.
+
+    The sidecar is trusted only for the same run and while its stamp matches the index.
+    """
+    try:
+        sidecar = json_loads(replay_count_path(path).read_bytes())
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+    if (
+        isinstance(sidecar, dict)
+        and sidecar.get("schema_version") == REPLAY_INDEX_SCHEMA_VERSION
+        and sidecar.get("run_id") == run_id
+        and sidecar.get("index_stamp") == [stat.st_mtime_ns, stat.st_size]
+        and type(sidecar.get("entry_count")) is int
+    ):
+        return sidecar["entry_count"]
+    return None
+
+
+def load_replay_count(*, path: Path, run_id: str) -> int:
+    """Number of entries in the replay index at `path`.
+
+    Uses the count sidecar when it is current; otherwise parses the index with
+    `load_replay_index` (including its validation errors).
+    """
+    if not path.exists():
+        return 0
+    count = read_replay_count(path=path, run_id=run_id)
+    if count is not None:
+        return count
+    return len(load_replay_index(path=path, run_id=run_id)["entries"])
+
+
 def append_replay_entry(*, path: Path, run_id: str, entry: dict[str, Any]) -> dict[str, Any]:
     index_payload = load_replay_index(path=path, run_id=run_id)
     index_payload["entries"].append(entry)
@@ -47,6 +123,7 @@ def append_replay_entry(*, path: Path, run_id: str, entry: dict[str, Any]) -> di
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(index_payload, indent=2), encoding="utf-8")
+    write_replay_count(path=path, run_id=run_id, count=len(index_payload["entries"]))
     return index_payload
 
 
@@ -57,6 +134,18 @@ def _entry_tags(entry: dict[str, Any]) -> set[str]:
     return {str(tag) for tag in raw}
 
 
+def _entry_sort_key(entry: dict[str, Any]) -> tuple[int, str, str]:
+    return (
+        int(entry.get("window_id", -1)),
+        str(entry.get("created_at", "")),
+        str(entry.get("replay_id", "")),
+    )
+
+
+def _normalize_tag_filter(values: list[str] | None) -> set[str]:
+    return {str(value) for value in (values or []) if str(value) != ""}
+
+
 def filter_replay_entries(
     entries: list[dict[str, Any]],
     *,
@@ -66,8 +155,8 @@ def filter_replay_entries(
     window_id: int | None = None,
     limit: int | None = None,
 ) -> list[dict[str, Any]]:
-    normalized_any = {str(value) for value in (tags_any or []) if str(value) != ""}
-    normalized_all = {str(value) for value in (tags_all or []) if str(value) != ""}
+    normalized_any = _normalize_tag_filter(tags_any)
+    normalized_all = _normalize_tag_filter(tags_all)
 
     filtered: list[dict[str, Any]] = []
     for entry in entries:
@@ -86,20 +175,90 @@ def filter_replay_entries(
 
         filtered.append(entry)
 
-    filtered.sort(
-        key=lambda item: (
-            int(item.get("window_id", -1)),
-            str(item.get("created_at", "")),
-            str(item.get("replay_id", "")),
-        ),
-        reverse=True,
-    )
+    filtered.sort(key=_entry_sort_key, reverse=True)
 
     if limit is not None and limit >= 0:
         return filtered[:limit]
     return filtered
 
 
+class ReplayEntryTable:
+    """Columnar form of an index's entries for repeated `filter_replay_entries` calls.
+
+    Entries are sorted once in the listing order; each tag keeps the positions of the
+    entries carrying it, so a filter is a few NumPy mask operations instead of a
+    per-entry set scan. `filter` returns exactly what `filter_replay_entries` returns
+    for the same entries.
+    """
+
+    def __init__(self, entries: list[dict[str, Any]]) -> None:
+        rows = [entry for entry in entries if isinstance(entry, dict)]
+        rows.sort(key=_entry_sort_key, reverse=True)
+        self._rows = rows
+        # `int()` of every window_id already succeeded in the sort key above.
+        self._window_ids = np.array([int(row.get("window_id", -1)) for row in rows], dtype=np.int64)
+        positions: dict[str, list[int]] = {}
+        for position, row in enumerate(rows):
+            for tag in _entry_tags(row):
+                positions.setdefault(tag, []).append(position)
+        self._tag_positions = {
+            tag: np.asarray(values, dtype=np.intp) for tag, values in positions.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _tag_mask(self, tag: str) -> np.ndarray | None:
+        positions = self._tag_positions.get(tag)
+        if positions is None:
+            return None
+        mask = np.zeros(len(self._rows), dtype=bool)
+        mask[positions] = True
+        return mask
+
+    def filter(
+        self,
+        *,
+        tag: str | None = None,
+        tags_any: list[str] | None = None,
+        tags_all: list[str] | None = None,
+        window_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        mask = np.ones(len(self._rows), dtype=bool)
+        for required in ([tag] if tag is not None else []) + sorted(
+            _normalize_tag_filter(tags_all)
+        ):
+            tag_mask = self._tag_mask(required)
+            if tag_mask is None:
+                return []
+            mask &= tag_mask
+
+        normalized_any = _normalize_tag_filter(tags_any)
+        if normalized_any:
+            known = [
+                self._tag_positions[value]
+                for value in normalized_any
+                if value in self._tag_positions
+            ]
+            if not known:
+                return []
+            any_mask = np.zeros(len(self._rows), dtype=bool)
+            any_mask[np.concatenate(known)] = True
+            mask &= any_mask
+
+        if window_id is not None:
+            wanted = int(window_id)
+            if not -(2**63) <= wanted < 2**63:
+                return []
+            mask &= self._window_ids == wanted
+
+        picks = np.flatnonzero(mask)
+        if limit is not None and limit >= 0:
+            picks = picks[:limit]
+        return [self._rows[position] for position in picks.tolist()]
+
+
 def get_replay_entry_by_id(index_payload: dict[str, Any], replay_id: str) -> dict[str, Any] | None:
     entries = index_payload.get("entries", [])
     if not isinstance(entries, list):
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+READ_BLOCK_BYTES = 128 * 1024
+CHECKPOINT_EVERY_LINES = 1024
+DEFAULT_MAX_INDEXED_FILES = 32
+DEFAULT_MAX_CHECKPOINTS_PER_FILE = 16
+
+# zlib wbits for a single gzip member (header and trailer included).
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+# Compressed bytes fed to the decompressor per call. A decompressor copy keeps its
+# `unconsumed_tail`, so this bounds the input bytes each gzip checkpoint holds on to.
+_INFLATE_INPUT_BYTES = 4 * 1024
+
+
+@dataclass(frozen=True)
+class _Checkpoint:
+    """Everything needed to resume line iteration at `line`.
+
+    `raw_offset` is the first byte not yet fed to the decoder. For gzip files
+    `inflater` is a copy of the decompressor that has consumed everything before it,
+    and `fresh` marks an inflater that has not seen any input of its member yet.
+    `tail` is the decoded start of line `line` (a partial line), if any.
+    """
+
+    line: int
+    raw_offset: int
+    tail: bytes
+    inflater: Any | None = None
+    fresh: bool = False
+
+
+@dataclass
+class _FileIndex:
+    stamp: tuple[int, int]
+    checkpoints: list[_Checkpoint]
+    every: int
+
+
+def _split_lines(tail: bytes, block: bytes) -> tuple[list[bytes], bytes]:
+    """Split on the newlines text-mode iteration uses (`\\n`, `\\r\\n`, `\\r`).
+
+    The unterminated remainder is returned as the new tail; a trailing `\\r` is held
+    back too, in case its `\\n` arrives with the next block.
+    """
+    lines = (tail + block).splitlines(keepends=True)
+    if lines and not lines[-1].endswith(b"\n"):
+        return lines, lines.pop()
+    return lines, b""
+
+
+def iter_replay_lines(handle: Any) -> Iterator[bytes]:
+    """Yield the lines of a binary handle (terminators kept), reading fixed-size blocks."""
+    tail = b""
+    while True:
+        block = handle.read(READ_BLOCK_BYTES)
+        if not block:
+            break
+        lines, tail = _split_lines(tail, block)
+        yield from lines
+    if tail:
+        yield tail
+
+
+class ReplaySeekIndex:
+    """Per-file line checkpoints so paginated reads skip straight to an offset.
+
+    Plain files checkpoint a byte offset; gzip files checkpoint a copy of the zlib
+    decompressor, so resuming never re-inflates the skipped prefix. Checkpoints are
+    recorded while files are read, every `checkpoint_every` lines, and dropped when
+    a file's size or mtime changes. A file keeps at most `max_checkpoints` of them
+    (about 40KiB of zlib state each for gzip); past that, every other one is dropped
+    and the file's spacing doubles.
+    """
+
+    def __init__(
+        self,
+        *,
+        checkpoint_every: int = CHECKPOINT_EVERY_LINES,
+        max_files: int = DEFAULT_MAX_INDEXED_FILES,
+        max_checkpoints: int = DEFAULT_MAX_CHECKPOINTS_PER_FILE,
+    ) -> None:
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be >= 1")
+        self._checkpoint_every = int(checkpoint_every)
+        self._max_files = max(1, int(max_files))
+        self._max_checkpoints = max(2, int(max_checkpoints))
+        self._lock = threading.Lock()
+        self._files: OrderedDict[str, _FileIndex] = OrderedDict()
+
+    def iter_lines(self, path: Path, *, start: int = 0) -> Iterator[tuple[int, bytes]]:
+        """Yield `(line_index, line)` for every line of `path` from `start` onward."""
+        stat = path.stat()
+        key = str(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        gz = path.suffix == ".gz"
+        checkpoint = self._nearest_checkpoint(key, stamp, start, gz=gz)
+        yield from self._scan(path, key, stamp, checkpoint, gz=gz, start=start)
+
+    def _nearest_checkpoint(
+        self, key: str, stamp: tuple[int, int], start: int, *, gz: bool
+    ) -> _Checkpoint:
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None or entry.stamp != stamp:
+                first = _Checkpoint(
+                    line=0,
+                    raw_offset=0,
+                    tail=b"",
+                    inflater=zlib.decompressobj(_GZIP_WBITS) if gz else None,
+                    fresh=gz,
+                )
+                entry = _FileIndex(stamp=stamp, checkpoints=[first], every=self._checkpoint_every)
+                self._files[key] = entry
+                while len(self._files) > self._max_files:
+                    self._files.popitem(last=False)
+            else:
+                self._files.move_to_end(key)
+            best = entry.checkpoints[0]
+            for checkpoint in entry.checkpoints:
+                if checkpoint.line > start:
+                    break
+                best = checkpoint
+            return best
+
+    def _wants_checkpoint(self, key: str, stamp: tuple[int, int], line: int) -> bool:
+        with self._lock:
+            entry = self._files.get(key)
+            return (
+                entry is not None
+                and entry.stamp == stamp
+                and line >= entry.checkpoints[-1].line + entry.every
+            )
+
+    def _record(self, key: str, stamp: tuple[int, int], checkpoint: _Checkpoint) -> None:
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None or entry.stamp != stamp:
+                return
+            if checkpoint.line < entry.checkpoints[-1].line + entry.every:
+                return
+            entry.checkpoints.append(checkpoint)
+            if len(entry.checkpoints) > self._max_checkpoints:
+                entry.checkpoints = entry.checkpoints[::2]
+                entry.every *= 2
+
+    def _scan(
+        self,
+        path: Path,
+        key: str,
+        stamp: tuple[int, int],
+        checkpoint: _Checkpoint,
+        *,
+        gz: bool,
+        start: int,
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yield lines from `start` on, resuming at `checkpoint` (at or before `start`)."""
+        line_no = checkpoint.line
+        tail = checkpoint.tail
+        inflater = checkpoint.inflater.copy() if gz else None
+        # Compressed input read but not yet fed to the decompressor: `pending[pos:]`.
+        pending = b""
+        pos = 0
+        fresh = checkpoint.fresh
+        next_mark = line_no + self._checkpoint_every
+
+        with path.open("rb") as raw:
+            raw.seek(checkpoint.raw_offset)
+            while True:
+                if line_no >= next_mark:
+                    if self._wants_checkpoint(key, stamp, line_no):
+                        # First raw byte not yet decoded; `pending` is re-read on resume.
+                        self._record(
+                            key,
+                            stamp,
+                            _Checkpoint(
+                                line=line_no,
+                                raw_offset=raw.tell() - (len(pending) - pos),
+                                tail=tail,
+                                inflater=inflater.copy() if inflater is not None else None,
+                                fresh=fresh,
+                            ),
+                        )
+                    next_mark = line_no + self._checkpoint_every
+
+                if inflater is None:
+                    block = raw.read(READ_BLOCK_BYTES)
+                    if not block:
+                        break
+                else:
+                    at_eof = False
+                    if pos == len(pending):
+                        pending = raw.read(READ_BLOCK_BYTES)
+                        pos = 0
+                        at_eof = not pending
+                    if fresh and not at_eof:
+                        # NUL padding between or after gzip members is skipped, as the
+                        # gzip module does; padding can fill whole reads.
+                        pending = pending[pos:].lstrip(b"\x00")
+                        pos = 0
+                        if not pending:
+                            continue
+                    if at_eof:
+                        if fresh:
+                            break
+                        # Drain output held back by the bounded decompress.
+                        block = inflater.flush()
+                        if inflater.eof:
+                            inflater = zlib.decompressobj(_GZIP_WBITS)
+                            fresh = True
+                        elif not block:
+                            raise EOFError(
+                                "Compressed file ended before the end-of-stream marker "
+                                "was reached"
+                            )
+                    else:
+                        # Bounded output keeps highly compressible frames from inflating
+                        # a whole read at once.
+                        chunk = pending[pos : pos + _INFLATE_INPUT_BYTES]
+                        block = inflater.decompress(chunk, READ_BLOCK_BYTES)
+                        fresh = False
+                        if inflater.eof:
+                            pos += len(chunk) - len(inflater.unused_data)
+                            inflater = zlib.decompressobj(_GZIP_WBITS)
+                            fresh = True
+                        else:
+                            pos += len(chunk) - len(inflater.unconsumed_tail)
+
+                if line_no < start and b"\r" not in block and b"\r" not in tail:
+                    # Skipping toward `start`: with `\n` as the only terminator, lines
+                    # are counted in C instead of split into objects.
+                    data = tail + block
+                    newlines = data.count(b"\n")
+                    if line_no + newlines <= start:
+                        line_no += newlines
+                        tail = data[data.rfind(b"\n") + 1 :] if newlines else data
+                        continue
+
+                lines, tail = _split_lines(tail, block)
+                skip = start - line_no
+                if skip > 0:
+                    line_no += min(skip, len(lines))
+                    lines = lines[skip:]
+                for line in lines:
+                    yield line_no, line
+                    line_no += 1
+
+        if tail and line_no >= start:
+            yield line_no, tail
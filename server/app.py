@@ -1,27 +1,43 @@
 from __future__ import annotations
 
 import asyncio
-import gzip
+import heapq
 import json
 import math
+import os
 import random
 import re
 import sys
 import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from uuid import uuid4
 
 import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
-from replay.index import filter_replay_entries, get_replay_entry_by_id, load_replay_index
+from replay.index import (
+    ReplayEntryTable,
+    filter_replay_entries,
+    get_replay_entry_by_id,
+    json_loads,
+    load_replay_index,
+    read_replay_count,
+    resolve_replay_index_path,
+)
+from replay.seek import ReplaySeekIndex
 
 DEFAULT_CORS_ORIGINS = (
     "http://localhost:3000",
@@ -32,6 +48,13 @@ DEFAULT_CORS_ORIGINS = (
 DEFAULT_CORS_ORIGIN_REGEX = r"https://.*\.vercel\.app"
 N_ACTIONS = 69
 DEFAULT_WANDB_CACHE_TTL_SECONDS = 30.0
+DEFAULT_JSON_FILE_CACHE_ENTRIES = 1024
+DEFAULT_PLAY_ENV_POOL_SIZE = 8
+# Sequential by default: with page-cached run dirs the scan is GIL-bound JSON parsing.
+DEFAULT_RUN_SCAN_WORKERS = 1
+PLAY_SESSION_ID_BYTES = 16
+# Session ids are sliced from one `os.urandom` read per this many ids.
+PLAY_SESSION_ID_BATCH = 256
 DEFAULT_WANDB_HISTORY_KEYS = (
     "_step",
     "window_id",
@@ -80,6 +103,8 @@ ANALYTICS_WANDB_SUMMARY_REQUIRED_FIELDS = (
 )
 ANALYTICS_STATUS_PRIORITY = ("error", "missing", "stale", "ok")
 WANDB_RUN_URL_RE = re.compile(r"/runs/([^/?#]+)")
+# One path component: no separators (or drive colons), NUL, `.`/`..`, or names past NAME_MAX.
+RUN_ID_RE = re.compile(r"(?!\.{1,2}\Z)[^/\\:\x00]{1,255}")
 
 
 def now_iso() -> str:
@@ -100,23 +125,65 @@ def _as_relative_posix(path: Path, *, start: Path) -> str:
         return path.as_posix()
 
 
+@lru_cache(maxsize=1024)
+def _split_csv(value: str) -> tuple[str, ...]:
+    # Query filters repeat across requests, so each raw string is split once.
+    return tuple(item for item in (part.strip() for part in value.split(",")) if item)
+
+
 def _parse_csv_arg(value: str | None) -> list[str] | None:
     if value is None:
         return None
-    cleaned = [item.strip() for item in value.split(",") if item.strip()]
-    return cleaned or None
+    return list(_split_csv(value)) or None
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+def _null_non_finite(value: Any) -> Any:
+    """`value` with NaN/Infinity floats replaced by None, as orjson encodes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _null_non_finite(child) for key, child in value.items()}
+    if isinstance(value, list | tuple):
+        return [_null_non_finite(child) for child in value]
+    return value
 
 
-def _resolve_replay_index_path(*, run_dir: Path, metadata: dict[str, Any] | None) -> Path:
-    if metadata is not None:
-        raw_path = metadata.get("replay_index_path")
-        if isinstance(raw_path, str) and raw_path.strip() != "":
-            return run_dir / raw_path
-    return run_dir / "replay_index.json"
+def _json_dumps_text(payload: Any) -> str:
+    """Compact JSON text, matching Starlette's `send_json` output for JSON-safe payloads.
+
+    NaN/Infinity are written as `null`, including on the stdlib fallback.
+    """
+    try:
+        return orjson.dumps(payload).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # Integers past 64 bits.
+        pass
+    return json.dumps(
+        _null_non_finite(payload), separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    )
+
+
+def _json_response(payload: Any) -> Response:
+    """Pre-encoded JSON response for large plain-dict payloads.
+
+    Skips FastAPI's response serialization (validating the payload against the return
+    annotation, then encoding it). Like that path, NaN/Infinity are written as `null`.
+    """
+    try:
+        return Response(content=orjson.dumps(payload), media_type="application/json")
+    except orjson.JSONEncodeError:
+        pass
+    return Response(
+        content=_json_dumps_text(payload).encode("utf-8"), media_type="application/json"
+    )
+
+
+async def _send_json_text(websocket: WebSocket, payload: dict[str, Any]) -> None:
+    await websocket.send_text(_json_dumps_text(payload))
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    return json_loads(path.read_text(encoding="utf-8"))
 
 
 def _resolve_metrics_windows_path(*, run_dir: Path, metadata: dict[str, Any] | None) -> Path:
@@ -127,8 +194,45 @@ def _resolve_metrics_windows_path(*, run_dir: Path, metadata: dict[str, Any] | N
     return run_dir / "metrics" / "windows.jsonl"
 
 
-def _load_run_metadata(run_dir: Path) -> dict[str, Any] | None:
-    path = run_dir / "run_metadata.json"
+class _JsonFileCache:
+    """Parsed JSON payloads keyed by path, reused while `(mtime_ns, size)` is unchanged.
+
+    Cached payloads are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_JSON_FILE_CACHE_ENTRIES) -> None:
+        self._lock = threading.Lock()
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]] = OrderedDict()
+
+    def load(self, path: Path, loader: Callable[[Path], Any], *, variant: str = "") -> Any:
+        """Return `loader(path)`, parsing again only when the file has changed.
+
+        `variant` caches a second value derived from the same file under its own key.
+        Missing files and loader errors are never cached.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return loader(path)
+        key = (str(path), variant)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._entries.move_to_end(key)
+                return cached[1]
+
+        payload = loader(path)
+        with self._lock:
+            self._entries[key] = (stamp, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+
+def _parse_run_metadata(path: Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
     try:
@@ -140,20 +244,25 @@ def _load_run_metadata(run_dir: Path) -> dict[str, Any] | None:
     return payload
 
 
-def _open_replay(path: Path):
-    if path.suffix == ".gz":
-        return gzip.open(path, mode="rt", encoding="utf-8")
-    return path.open("r", encoding="utf-8")
+def _load_run_metadata(
+    run_dir: Path, *, cache: _JsonFileCache | None = None
+) -> dict[str, Any] | None:
+    path = run_dir / "run_metadata.json"
+    if cache is None:
+        return _parse_run_metadata(path)
+    return cache.load(path, _parse_run_metadata)
 
 
 def _load_jsonl_rows(path: Path) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
+    # Split the raw bytes and hand each line to the parser as-is: no decoded copy of
+    # the file and no per-line `str`.
+    for line in path.read_bytes().split(b"\n"):
         text = line.strip()
-        if text == "":
+        if not text:
             continue
         try:
-            payload = json.loads(text)
+            payload = json_loads(text)
         except json.JSONDecodeError as exc:
             raise HTTPException(status_code=500, detail=f"Invalid JSONL row in {path}") from exc
         if not isinstance(payload, dict):
@@ -162,13 +271,23 @@ def _load_jsonl_rows(path: Path) -> list[dict[str, Any]]:
     return rows
 
 
-def _parse_replay_frame_payload(line: str) -> dict[str, Any] | None:
+def _window_sort_key(row: dict[str, Any]) -> tuple[int, int]:
+    """`(window_id, env_steps_total)` as ints; values parsed as ints skip the `int()` call."""
+    window_id = row.get("window_id", -1)
+    env_steps = row.get("env_steps_total", -1)
+    return (
+        window_id if type(window_id) is int else int(window_id),
+        env_steps if type(env_steps) is int else int(env_steps),
+    )
+
+
+def _parse_replay_frame_payload(line: bytes) -> dict[str, Any] | None:
     text = line.strip()
-    if text == "":
+    if not text:
         return None
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:
+        payload = json_loads(text)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise HTTPException(
             status_code=500,
             detail="Invalid replay frame JSON",
@@ -181,6 +300,36 @@ def _parse_replay_frame_payload(line: str) -> dict[str, Any] | None:
     return payload
 
 
+def _replay_frame_json(line: bytes) -> bytes | None:
+    """JSON text of one replay frame line, for splicing into a frames message.
+
+    Lines orjson accepts as an object pass through verbatim (the parse only validates
+    them). Anything else goes through `_parse_replay_frame_payload`: non-finite number
+    tokens, which browsers' `JSON.parse` rejects, and >64-bit integers are re-encoded;
+    malformed or non-object lines raise its 500s.
+    """
+    text = line.strip()
+    if not text:
+        return None
+    if text[:1] == b"{":
+        try:
+            orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return text
+    return _json_dumps_text(_parse_replay_frame_payload(text)).encode("utf-8")
+
+
+def _frames_message_text(header: dict[str, Any], frames: list[bytes]) -> str:
+    """`{**header, "frames": [...]}` as JSON text, with frames already encoded."""
+    try:
+        body = b",".join(frames).decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=500, detail="Invalid replay frame JSON") from exc
+    return f'{_json_dumps_text(header)[:-1]},"frames":[{body}]}}'
+
+
 def _resolve_replay_file_path(*, run_dir: Path, entry: dict[str, Any]) -> tuple[str, Path]:
     replay_path_raw = entry.get("replay_path")
     if not isinstance(replay_path_raw, str) or replay_path_raw.strip() == "":
@@ -194,7 +343,8 @@ def _resolve_replay_file_path(*, run_dir: Path, entry: dict[str, Any]) -> tuple[
 
 
 def _obs_to_list(obs: Any) -> list[float]:
-    return [float(value) for value in np.asarray(obs, dtype=np.float32).tolist()]
+    # `tolist()` already yields Python floats; no per-element `float()` pass needed.
+    return np.asarray(obs, dtype=np.float32).tolist()
 
 
 def _parse_wandb_history_keys(value: str | None) -> list[str] | None:
@@ -734,50 +884,102 @@ class _PlaySession:
     steps: int
     created_at: str
     updated_at: str
+    # Serializes env calls on this session only; set `closed` under it once deleted.
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # Queues async handlers for this session before they take a threadpool thread.
+    pending: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    closed: bool = False
 
 
 class _PlaySessionStore:
-    def __init__(self) -> None:
+    """Play sessions by id.
+
+    The store lock only guards adding and removing ids and the env pool; lookups are
+    plain dict reads and env calls hold the session's own lock, so different sessions
+    step concurrently. Envs of deleted sessions are kept (up to `max_pooled_envs`,
+    per `time_max`) and re-seeded by `reset` for the next session.
+    """
+
+    def __init__(self, *, max_pooled_envs: int = DEFAULT_PLAY_ENV_POOL_SIZE) -> None:
+        # Resolved once when the app is built, so a broken env import fails at boot
+        # rather than on the first session.
+        _ensure_python_src_on_path()
+        from asteroid_prospector import ProspectorReferenceEnv, ReferenceEnvConfig
+
+        self._env_cls = ProspectorReferenceEnv
+        self._config_cls = ReferenceEnvConfig
         self._lock = threading.Lock()
         self._sessions: dict[str, _PlaySession] = {}
+        self._max_pooled_envs = max(0, int(max_pooled_envs))
+        self._env_pool: dict[float, list[Any]] = {}
+        self._pooled_count = 0
+        self._sysrand = random.SystemRandom()
+        self._id_bytes = memoryview(b"")
+        self._id_offset = 0
+
+    def _new_session_id_locked(self) -> str:
+        # Same shape as `uuid4().hex` (32 hex chars, 128 random bits); caller holds
+        # `self._lock`.
+        if self._id_offset >= len(self._id_bytes):
+            self._id_bytes = memoryview(os.urandom(PLAY_SESSION_ID_BYTES * PLAY_SESSION_ID_BATCH))
+            self._id_offset = 0
+        start = self._id_offset
+        self._id_offset = start + PLAY_SESSION_ID_BYTES
+        return self._id_bytes[start : self._id_offset].hex()
+
+    def _take_pooled_env(self, env_time_max: float) -> Any | None:
+        with self._lock:
+            pooled = self._env_pool.get(env_time_max)
+            if not pooled:
+                return None
+            self._pooled_count -= 1
+            return pooled.pop()
+
+    def _release_env(self, env_time_max: float, env: Any) -> bool:
+        with self._lock:
+            if self._pooled_count >= self._max_pooled_envs:
+                return False
+            self._env_pool.setdefault(env_time_max, []).append(env)
+            self._pooled_count += 1
+            return True
 
     def _coerce_seed(self, seed: int | None) -> int:
         if seed is not None:
             return int(seed)
-        return random.SystemRandom().randint(0, 2**31 - 1)
+        return self._sysrand.randint(0, 2**31 - 1)
 
     def create(
         self, *, env_time_max: float, seed: int | None
     ) -> tuple[str, int, Any, dict[str, Any], _PlaySession]:
-        _ensure_python_src_on_path()
-        from asteroid_prospector import ProspectorReferenceEnv, ReferenceEnvConfig
-
         actual_seed = self._coerce_seed(seed)
-        env = ProspectorReferenceEnv(
-            config=ReferenceEnvConfig(time_max=env_time_max),
-            seed=actual_seed,
-        )
+        env_time_max = float(env_time_max)
+        # `reset(seed=...)` rebuilds all episode state, so a pooled env starts the same
+        # episode a new one would.
+        env = self._take_pooled_env(env_time_max)
+        if env is None:
+            env = self._env_cls(
+                config=self._config_cls(time_max=env_time_max),
+                seed=actual_seed,
+            )
         obs, info = env.reset(seed=actual_seed)
 
         created_at = now_iso()
         session = _PlaySession(
             env=env,
-            env_time_max=float(env_time_max),
+            env_time_max=env_time_max,
             next_seed=int(actual_seed + 1),
             steps=0,
             created_at=created_at,
             updated_at=created_at,
         )
-        session_id = uuid4().hex
-
         with self._lock:
+            session_id = self._new_session_id_locked()
             self._sessions[session_id] = session
 
         return session_id, actual_seed, obs, info, session
 
     def get(self, session_id: str) -> _PlaySession:
-        with self._lock:
-            session = self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
         if session is None:
             raise HTTPException(status_code=404, detail=f"session_id not found: {session_id}")
         return session
@@ -785,9 +987,9 @@ class _PlaySessionStore:
     def reset(
         self, *, session_id: str, seed: int | None
     ) -> tuple[int, Any, dict[str, Any], _PlaySession]:
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
+        session = self.get(session_id)
+        with session.lock:
+            if session.closed:
                 raise HTTPException(status_code=404, detail=f"session_id not found: {session_id}")
 
             actual_seed = self._coerce_seed(seed) if seed is not None else session.next_seed
@@ -804,9 +1006,9 @@ class _PlaySessionStore:
         session_id: str,
         action: int,
     ) -> tuple[Any, float, bool, bool, dict[str, Any], _PlaySession]:
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
+        session = self.get(session_id)
+        with session.lock:
+            if session.closed:
                 raise HTTPException(status_code=404, detail=f"session_id not found: {session_id}")
 
             obs, reward, terminated, truncated, info = session.env.step(int(action))
@@ -821,9 +1023,26 @@ class _PlaySessionStore:
         if session is None:
             raise HTTPException(status_code=404, detail=f"session_id not found: {session_id}")
 
-        close = getattr(session.env, "close", None)
-        if callable(close):
-            close()
+        # Waits for an in-flight reset/step; later ones see `closed` and 404.
+        with session.lock:
+            session.closed = True
+            if self._release_env(session.env_time_max, session.env):
+                return
+            close = getattr(session.env, "close", None)
+            if callable(close):
+                close()
+
+
+@asynccontextmanager
+async def _app_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        # Scans after shutdown (e.g. a restarted test client) fall back to sequential.
+        executor = app.state.run_scan_executor
+        app.state.run_scan_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
 
 def create_app(
@@ -836,10 +1055,19 @@ def create_app(
     wandb_default_project: str | None = None,
     wandb_api_key: str | None = None,
     wandb_cache_ttl_seconds: float = DEFAULT_WANDB_CACHE_TTL_SECONDS,
+    run_scan_workers: int = DEFAULT_RUN_SCAN_WORKERS,
 ) -> FastAPI:
-    app = FastAPI(title="Asteroid Prospector API", version="0.2.0")
+    app = FastAPI(title="Asteroid Prospector API", version="0.2.0", lifespan=_app_lifespan)
     app.state.runs_root = runs_root
     app.state.play_sessions = _PlaySessionStore()
+    app.state.replay_seek_index = ReplaySeekIndex()
+    app.state.json_file_cache = _JsonFileCache()
+    # Worker threads only start on the first `/api/runs` call.
+    app.state.run_scan_executor = (
+        ThreadPoolExecutor(max_workers=int(run_scan_workers), thread_name_prefix="run-scan")
+        if int(run_scan_workers) > 1
+        else None
+    )
     app.state.wandb_proxy = (
         wandb_proxy
         if wandb_proxy is not None
@@ -878,15 +1106,57 @@ def create_app(
     )
 
     def _resolve_run_dir(run_id: str) -> Path:
+        # Ids that are not a single path component never reach the filesystem.
+        if RUN_ID_RE.fullmatch(run_id) is None:
+            raise HTTPException(status_code=404, detail=f"run_id not found: {run_id}")
         run_dir = runs_root / run_id
-        if not run_dir.exists() or not run_dir.is_dir():
+        # One stat: `is_dir` is already False for a missing path.
+        if not run_dir.is_dir():
             raise HTTPException(status_code=404, detail=f"run_id not found: {run_id}")
         return run_dir
 
+    def _load_metadata(run_dir: Path) -> dict[str, Any] | None:
+        return _load_run_metadata(run_dir, cache=app.state.json_file_cache)
+
+    def _load_replay_index(index_path: Path, run_id: str) -> dict[str, Any]:
+        # Keyed by path only, so the run_id check is repeated on every hit.
+        payload = app.state.json_file_cache.load(
+            index_path, lambda path: load_replay_index(path=path, run_id=run_id)
+        )
+        if str(payload.get("run_id")) != run_id:
+            return load_replay_index(path=index_path, run_id=run_id)
+        return payload
+
+    def _load_replay_count(index_path: Path, run_id: str) -> int:
+        if not index_path.exists():
+            return 0
+        # The run id is part of the key, so a hit never skips the sidecar's run check.
+        count = app.state.json_file_cache.load(
+            index_path,
+            lambda path: read_replay_count(path=path, run_id=run_id),
+            variant=f"replay_count:{run_id}",
+        )
+        if count is None:
+            # No current sidecar: count from the (cached) parsed index, with its errors.
+            entries = _load_replay_index(index_path, run_id).get("entries", [])
+            count = len(entries) if isinstance(entries, list) else 0
+        return count
+
+    def _load_metrics_rows(metrics_path: Path) -> list[dict[str, Any]]:
+        return app.state.json_file_cache.load(metrics_path, _load_jsonl_rows, variant="jsonl_rows")
+
+    def _load_sorted_metrics_rows(metrics_path: Path, order: str) -> list[dict[str, Any]]:
+        def _sort(path: Path) -> list[dict[str, Any]]:
+            # Rows are appended in window order, which timsort merges in linear time; a
+            # heap selection would be its worst case here (every row displaces the top).
+            return sorted(_load_metrics_rows(path), key=_window_sort_key, reverse=(order == "desc"))
+
+        return app.state.json_file_cache.load(metrics_path, _sort, variant=f"windows:{order}")
+
     def _load_index_for_run(run_id: str, run_dir: Path) -> tuple[Path, dict[str, Any]]:
-        metadata = _load_run_metadata(run_dir)
-        index_path = _resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
-        index_payload = load_replay_index(path=index_path, run_id=run_id)
+        metadata = _load_metadata(run_dir)
+        index_path = resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
+        index_payload = _load_replay_index(index_path, run_id)
         return index_path, index_payload
 
     def _resolve_wandb_scope(
@@ -1123,79 +1393,83 @@ def create_app(
             "kpis": _extract_iteration_kpis(summary=run_summary, history_rows=history_rows),
         }
 
-    @app.get("/api/runs")
-    def list_runs(limit: int = Query(default=50, ge=1, le=500)) -> dict[str, Any]:
-        if not runs_root.exists():
-            return {"runs": [], "count": 0, "total": 0}
-
-        runs: list[dict[str, Any]] = []
-        for run_dir in runs_root.iterdir():
-            if not run_dir.is_dir():
-                continue
-
-            metadata = _load_run_metadata(run_dir)
-            if metadata is None:
-                continue
+    def _run_row(run_dir: Path) -> dict[str, Any] | None:
+        metadata = _load_metadata(run_dir)
+        if metadata is None:
+            return None
 
-            run_id = str(metadata.get("run_id", run_dir.name))
-            replay_index_path = _resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
-            replay_count = 0
-            if replay_index_path.exists():
-                index_payload = load_replay_index(path=replay_index_path, run_id=run_id)
-                entries = index_payload.get("entries", [])
-                replay_count = len(entries) if isinstance(entries, list) else 0
+        run_id = str(metadata.get("run_id", run_dir.name))
+        replay_index_path = resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
+        replay_count = _load_replay_count(replay_index_path, run_id)
 
-            runs.append(
-                {
-                    "run_id": run_id,
-                    "status": metadata.get("status"),
-                    "trainer_backend": metadata.get("trainer_backend"),
-                    "env_steps_total": metadata.get("env_steps_total"),
-                    "windows_emitted": metadata.get("windows_emitted"),
-                    "checkpoints_written": metadata.get("checkpoints_written"),
-                    "latest_checkpoint": metadata.get("latest_checkpoint"),
-                    "latest_replay": metadata.get("latest_replay"),
-                    "replay_count": replay_count,
-                    "updated_at": metadata.get("updated_at"),
-                    "started_at": metadata.get("started_at"),
-                    "finished_at": metadata.get("finished_at"),
-                }
-            )
+        return {
+            "run_id": run_id,
+            "status": metadata.get("status"),
+            "trainer_backend": metadata.get("trainer_backend"),
+            "env_steps_total": metadata.get("env_steps_total"),
+            "windows_emitted": metadata.get("windows_emitted"),
+            "checkpoints_written": metadata.get("checkpoints_written"),
+            "latest_checkpoint": metadata.get("latest_checkpoint"),
+            "latest_replay": metadata.get("latest_replay"),
+            "replay_count": replay_count,
+            "updated_at": metadata.get("updated_at"),
+            "started_at": metadata.get("started_at"),
+            "finished_at": metadata.get("finished_at"),
+        }
 
-        runs.sort(
+    @app.get("/api/runs")
+    def list_runs(limit: int = Query(default=50, ge=1, le=500)) -> Response:
+        if not runs_root.exists():
+            return _json_response({"runs": [], "count": 0, "total": 0})
+
+        # `DirEntry.is_dir` answers from the readdir file type; only symlinks need a stat.
+        with os.scandir(runs_root) as it:
+            run_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+        executor = app.state.run_scan_executor
+        if executor is not None and len(run_dirs) > 1:
+            # Overlaps the per-run stats and reads on slow (network) filesystems;
+            # `map` keeps directory order and re-raises errors in that order.
+            rows = executor.map(_run_row, run_dirs)
+        else:
+            rows = map(_run_row, run_dirs)
+        runs = [row for row in rows if row is not None]
+
+        # Same order as a stable descending sort, without sorting runs past `limit`.
+        # Every row is still built: `total` counts runs with metadata, and `updated_at`
+        # is only known from that metadata (file mtimes do not track it).
+        visible = heapq.nlargest(
+            limit,
+            runs,
             key=lambda row: (
                 str(row.get("updated_at") or ""),
                 str(row.get("run_id") or ""),
             ),
-            reverse=True,
         )
-
-        visible = runs[:limit]
-        return {
-            "runs": visible,
-            "count": len(visible),
-            "total": len(runs),
-        }
+        return _json_response(
+            {
+                "runs": visible,
+                "count": len(visible),
+                "total": len(runs),
+            }
+        )
 
     @app.get("/api/runs/{run_id}")
-    def get_run(run_id: str) -> dict[str, Any]:
+    def get_run(run_id: str) -> Response:
         run_dir = _resolve_run_dir(run_id)
-        metadata = _load_run_metadata(run_dir)
+        metadata = _load_metadata(run_dir)
         if metadata is None:
             raise HTTPException(status_code=404, detail=f"run metadata not found: {run_id}")
 
-        index_path = _resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
-        replay_count = 0
-        if index_path.exists():
-            index_payload = load_replay_index(path=index_path, run_id=run_id)
-            entries = index_payload.get("entries", [])
-            replay_count = len(entries) if isinstance(entries, list) else 0
+        index_path = resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
+        replay_count = _load_replay_count(index_path, run_id)
 
-        return {
-            "run_id": run_id,
-            "metadata": metadata,
-            "replay_count": replay_count,
-        }
+        return _json_response(
+            {
+                "run_id": run_id,
+                "metadata": metadata,
+                "replay_count": replay_count,
+            }
+        )
 
     @app.get("/api/runs/{run_id}/metrics/windows")
     def get_run_metrics_windows(
@@ -1204,7 +1478,7 @@ def create_app(
         order: str = Query(default="desc", pattern="^(asc|desc)$"),
     ) -> dict[str, Any]:
         run_dir = _resolve_run_dir(run_id)
-        metadata = _load_run_metadata(run_dir)
+        metadata = _load_metadata(run_dir)
         if metadata is None:
             raise HTTPException(status_code=404, detail=f"run metadata not found: {run_id}")
 
@@ -1219,14 +1493,7 @@ def create_app(
                 "windows": [],
             }
 
-        rows = _load_jsonl_rows(metrics_path)
-        rows.sort(
-            key=lambda row: (
-                int(row.get("window_id", -1)),
-                int(row.get("env_steps_total", -1)),
-            ),
-            reverse=(order == "desc"),
-        )
+        rows = _load_sorted_metrics_rows(metrics_path, order)
         visible = rows[:limit]
         return {
             "run_id": run_id,
@@ -1247,14 +1514,14 @@ def create_app(
     ) -> dict[str, Any]:
         run_dir = _resolve_run_dir(run_id)
         metadata_path = run_dir / "run_metadata.json"
-        metadata = _load_run_metadata(run_dir)
+        metadata = _load_metadata(run_dir)
         if metadata is None:
             raise HTTPException(status_code=404, detail=f"run metadata not found: {run_id}")
 
         now_utc = datetime.now(UTC)
         metrics_path = _resolve_metrics_windows_path(run_dir=run_dir, metadata=metadata)
         metrics_path_rel = _as_relative_posix(metrics_path, start=run_dir)
-        replay_index_path = _resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
+        replay_index_path = resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
         replay_index_path_rel = _as_relative_posix(replay_index_path, start=run_dir)
 
         coverage: list[dict[str, Any]] = []
@@ -1334,7 +1601,7 @@ def create_app(
         metrics_error: str | None = None
         if metrics_path.exists():
             try:
-                metric_rows = _load_jsonl_rows(metrics_path)
+                metric_rows = _load_metrics_rows(metrics_path)
             except HTTPException as exc:
                 metrics_error = f"{exc.status_code}: {exc.detail}"
         latest_metric_row = metric_rows[-1] if len(metric_rows) > 0 else {}
@@ -1362,7 +1629,7 @@ def create_app(
         replay_error: str | None = None
         if replay_index_path.exists():
             try:
-                replay_payload = load_replay_index(path=replay_index_path, run_id=run_id)
+                replay_payload = _load_replay_index(replay_index_path, run_id)
                 replay_updated_at = _clean_str(replay_payload.get("updated_at")) or _path_mtime_iso(
                     replay_index_path
                 )
@@ -1560,41 +1827,54 @@ def create_app(
         tags_all: str | None = Query(default=None),
         window_id: int | None = Query(default=None),
         limit: int = Query(default=100, ge=1, le=5000),
-    ) -> dict[str, Any]:
+    ) -> Response:
         run_dir = _resolve_run_dir(run_id)
         index_path, index_payload = _load_index_for_run(run_id, run_dir)
         entries = index_payload.get("entries", [])
         if not isinstance(entries, list):
             raise HTTPException(status_code=500, detail="Invalid replay index entries payload")
 
-        replay_rows = filter_replay_entries(
-            entries,
-            tag=tag,
-            tags_any=_parse_csv_arg(tags_any),
-            tags_all=_parse_csv_arg(tags_all),
-            window_id=window_id,
-            limit=limit,
-        )
-
-        return {
-            "run_id": run_id,
-            "index_path": str(_as_relative_posix(index_path, start=run_dir)),
-            "count": len(replay_rows),
-            "replays": replay_rows,
+        filters = {
+            "tag": tag,
+            "tags_any": _parse_csv_arg(tags_any),
+            "tags_all": _parse_csv_arg(tags_all),
+            "window_id": window_id,
+            "limit": limit,
         }
+        try:
+            # Built once per index file version and reused across filter combinations.
+            table = app.state.json_file_cache.load(
+                index_path, lambda _: ReplayEntryTable(entries), variant="entry_table"
+            )
+        except (TypeError, ValueError, OverflowError):
+            # Entries whose sort keys do not coerce: keep the scan's error behavior.
+            replay_rows = filter_replay_entries(entries, **filters)
+        else:
+            replay_rows = table.filter(**filters)
+
+        return _json_response(
+            {
+                "run_id": run_id,
+                "index_path": str(_as_relative_posix(index_path, start=run_dir)),
+                "count": len(replay_rows),
+                "replays": replay_rows,
+            }
+        )
 
     @app.get("/api/runs/{run_id}/replays/{replay_id}")
-    def get_replay(run_id: str, replay_id: str) -> dict[str, Any]:
+    def get_replay(run_id: str, replay_id: str) -> Response:
         run_dir = _resolve_run_dir(run_id)
         _, index_payload = _load_index_for_run(run_id, run_dir)
         entry = get_replay_entry_by_id(index_payload, replay_id)
         if entry is None:
             raise HTTPException(status_code=404, detail=f"replay_id not found: {replay_id}")
 
-        return {
-            "run_id": run_id,
-            "replay": entry,
-        }
+        return _json_response(
+            {
+                "run_id": run_id,
+                "replay": entry,
+            }
+        )
 
     @app.get("/api/runs/{run_id}/replays/{replay_id}/frames")
     def get_replay_frames(
@@ -1602,7 +1882,7 @@ def create_app(
         replay_id: str,
         offset: int = Query(default=0, ge=0),
         limit: int = Query(default=256, ge=1, le=5000),
-    ) -> dict[str, Any]:
+    ) -> Response:
         run_dir = _resolve_run_dir(run_id)
         _, index_payload = _load_index_for_run(run_id, run_dir)
         entry = get_replay_entry_by_id(index_payload, replay_id)
@@ -1611,30 +1891,34 @@ def create_app(
 
         _, replay_path = _resolve_replay_file_path(run_dir=run_dir, entry=entry)
 
-        frames: list[dict[str, Any]] = []
+        # Frame JSON is passed through from the replay file, as in the websocket stream,
+        # so the response never holds parsed frame dicts.
+        frames: list[bytes] = []
         has_more = False
-        with _open_replay(replay_path) as handle:
-            for frame_idx, line in enumerate(handle):
-                if frame_idx < offset:
-                    continue
-                if len(frames) >= limit:
-                    has_more = True
-                    break
+        for _, line in app.state.replay_seek_index.iter_lines(replay_path, start=offset):
+            if len(frames) >= limit:
+                has_more = True
+                break
 
-                payload = _parse_replay_frame_payload(line)
-                if payload is None:
-                    continue
-                frames.append(payload)
+            frame_json = _replay_frame_json(line)
+            if frame_json is None:
+                continue
+            frames.append(frame_json)
 
-        return {
-            "run_id": run_id,
-            "replay_id": replay_id,
-            "offset": offset,
-            "next_offset": offset + len(frames),
-            "count": len(frames),
-            "has_more": has_more,
-            "frames": frames,
-        }
+        return Response(
+            content=_frames_message_text(
+                {
+                    "run_id": run_id,
+                    "replay_id": replay_id,
+                    "offset": offset,
+                    "next_offset": offset + len(frames),
+                    "count": len(frames),
+                    "has_more": has_more,
+                },
+                frames,
+            ),
+            media_type="application/json",
+        )
 
     @app.websocket("/ws/runs/{run_id}/replays/{replay_id}/frames")
     async def stream_replay_frames(websocket: WebSocket, run_id: str, replay_id: str) -> None:
@@ -1674,7 +1958,8 @@ def create_app(
 
             # Send an empty frames prelude immediately after validation so clients
             # receive traffic even when replay artifacts are cold on remote filesystems.
-            await websocket.send_json(
+            await _send_json_text(
+                websocket,
                 {
                     "type": "frames",
                     "run_id": run_id,
@@ -1688,7 +1973,7 @@ def create_app(
                     "max_chunk_bytes": max_chunk_bytes,
                     "frames": [],
                     "prelude": True,
-                }
+                },
             )
             # Yield once so the prelude can flush before filesystem work begins.
             await asyncio.sleep(0)
@@ -1703,31 +1988,36 @@ def create_app(
 
             sent_count = 0
             has_more = False
-            chunk: list[dict[str, Any]] = []
-            chunk_bytes = 0
             chunks_sent = 0
-            chunk_start = offset
-
-            with _open_replay(replay_path) as handle:
-                for frame_idx, line in enumerate(handle):
-                    if frame_idx < offset:
-                        continue
+            seek_index = app.state.replay_seek_index
+
+            def _chunk_messages() -> Iterator[str]:
+                # Runs in the threadpool: file reads, inflate, and message assembly stay
+                # off the event loop.
+                nonlocal sent_count, has_more, chunks_sent
+                chunk: list[bytes] = []
+                chunk_bytes = 0
+                chunk_start = offset
+                for _, line in seek_index.iter_lines(replay_path, start=offset):
                     if sent_count >= limit:
                         has_more = True
                         break
 
-                    payload = _parse_replay_frame_payload(line)
-                    if payload is None:
+                    # Frames are forwarded as the JSON text already on disk rather than
+                    # parsed and re-encoded.
+                    frame_json = _replay_frame_json(line)
+                    if frame_json is None:
                         continue
 
-                    chunk.append(payload)
-                    chunk_bytes += len(line.encode("utf-8"))
+                    chunk.append(frame_json)
+                    # Sized as the decoded text line, where `\r\n` reads as one newline.
+                    chunk_bytes += len(line) - 1 if line.endswith(b"\r\n") else len(line)
                     sent_count += 1
 
                     if len(chunk) >= batch_size or chunk_bytes >= max_chunk_bytes:
                         next_offset = offset + sent_count
                         chunks_sent += 1
-                        await websocket.send_json(
+                        yield _frames_message_text(
                             {
                                 "type": "frames",
                                 "run_id": run_id,
@@ -1739,34 +2029,53 @@ def create_app(
                                 "chunk_index": chunks_sent - 1,
                                 "chunk_bytes": chunk_bytes,
                                 "max_chunk_bytes": max_chunk_bytes,
-                                "frames": chunk,
-                            }
+                            },
+                            chunk,
                         )
                         chunk = []
                         chunk_bytes = 0
                         chunk_start = next_offset
-                        if yield_every_batches > 0 and chunks_sent % yield_every_batches == 0:
-                            await asyncio.sleep(0)
 
-            if chunk:
-                chunks_sent += 1
-                await websocket.send_json(
-                    {
-                        "type": "frames",
-                        "run_id": run_id,
-                        "replay_id": replay_id,
-                        "offset": chunk_start,
-                        "next_offset": offset + sent_count,
-                        "count": len(chunk),
-                        "has_more": has_more,
-                        "chunk_index": chunks_sent - 1,
-                        "chunk_bytes": chunk_bytes,
-                        "max_chunk_bytes": max_chunk_bytes,
-                        "frames": chunk,
-                    }
-                )
+                if chunk:
+                    chunks_sent += 1
+                    yield _frames_message_text(
+                        {
+                            "type": "frames",
+                            "run_id": run_id,
+                            "replay_id": replay_id,
+                            "offset": chunk_start,
+                            "next_offset": offset + sent_count,
+                            "count": len(chunk),
+                            "has_more": has_more,
+                            "chunk_index": chunks_sent - 1,
+                            "chunk_bytes": chunk_bytes,
+                            "max_chunk_bytes": max_chunk_bytes,
+                        },
+                        chunk,
+                    )
 
-            await websocket.send_json(
+            # One chunk of read-ahead: the next message is built in a worker thread
+            # while the current one is being sent.
+            messages = _chunk_messages()
+            pending = asyncio.ensure_future(run_in_threadpool(next, messages, None))
+            try:
+                sent_messages = 0
+                while (message := await pending) is not None:
+                    pending = asyncio.ensure_future(run_in_threadpool(next, messages, None))
+                    await websocket.send_text(message)
+                    sent_messages += 1
+                    if yield_every_batches > 0 and sent_messages % yield_every_batches == 0:
+                        await asyncio.sleep(0)
+            finally:
+                # The generator cannot be closed while a worker thread is still inside it.
+                if not pending.done():
+                    await asyncio.wait([pending])
+                if not pending.cancelled():
+                    pending.exception()  # Retrieved here; errors surface via `await pending`.
+                messages.close()
+
+            await _send_json_text(
+                websocket,
                 {
                     "type": "complete",
                     "run_id": run_id,
@@ -1780,7 +2089,7 @@ def create_app(
                     "batch_size": batch_size,
                     "max_chunk_bytes": max_chunk_bytes,
                     "yield_every_batches": yield_every_batches,
-                }
+                },
             )
             # Give intermediaries a brief window to flush terminal payloads
             # before issuing an explicit websocket close handshake.
@@ -1790,12 +2099,13 @@ def create_app(
             return
         except HTTPException as exc:
             try:
-                await websocket.send_json(
+                await _send_json_text(
+                    websocket,
                     {
                         "type": "error",
                         "status_code": exc.status_code,
                         "detail": str(exc.detail),
-                    }
+                    },
                 )
                 await websocket.close(code=1008)
             except RuntimeError:
@@ -1803,12 +2113,13 @@ def create_app(
         except Exception as exc:  # pragma: no cover - defensive envelope for transport stability
             detail = f"internal websocket error: {type(exc).__name__}: {exc}"
             try:
-                await websocket.send_json(
+                await _send_json_text(
+                    websocket,
                     {
                         "type": "error",
                         "status_code": 500,
                         "detail": detail,
-                    }
+                    },
                 )
                 await websocket.close(code=1011)
             except RuntimeError:
@@ -1838,11 +2149,14 @@ def create_app(
             "updated_at": session.updated_at,
         }
 
-    @app.post("/api/play/session/{session_id}/reset")
-    def reset_play_session(
-        session_id: str,
-        request: ResetPlaySessionRequest,
-    ) -> dict[str, Any]:
+    async def _run_play_call(session_id: str, call: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        # Env work runs in the threadpool, one call per session at a time; queued
+        # requests wait here instead of each parking a worker thread on the session lock.
+        session = app.state.play_sessions.get(session_id)
+        async with session.pending:
+            return await run_in_threadpool(call)
+
+    def _reset_play_session(session_id: str, request: ResetPlaySessionRequest) -> dict[str, Any]:
         seed_used, obs, info, session = app.state.play_sessions.reset(
             session_id=session_id,
             seed=request.seed,
@@ -1861,11 +2175,14 @@ def create_app(
             "updated_at": session.updated_at,
         }
 
-    @app.post("/api/play/session/{session_id}/step")
-    def step_play_session(
+    @app.post("/api/play/session/{session_id}/reset")
+    async def reset_play_session(
         session_id: str,
-        request: StepPlaySessionRequest,
+        request: ResetPlaySessionRequest,
     ) -> dict[str, Any]:
+        return await _run_play_call(session_id, lambda: _reset_play_session(session_id, request))
+
+    def _step_play_session(session_id: str, request: StepPlaySessionRequest) -> dict[str, Any]:
         obs, reward, terminated, truncated, info, session = app.state.play_sessions.step(
             session_id=session_id,
             action=request.action,
@@ -1883,6 +2200,13 @@ def create_app(
             "updated_at": session.updated_at,
         }
 
+    @app.post("/api/play/session/{session_id}/step")
+    async def step_play_session(
+        session_id: str,
+        request: StepPlaySessionRequest,
+    ) -> dict[str, Any]:
+        return await _run_play_call(session_id, lambda: _step_play_session(session_id, request))
+
     @app.delete("/api/play/session/{session_id}")
     def delete_play_session(session_id: str) -> dict[str, Any]:
         app.state.play_sessions.delete(session_id=session_id)
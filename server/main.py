@@ -30,6 +30,21 @@ def _parse_float_env(name: str, default: float) -> float:
         return float(default)
 
 
+def _parse_int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return int(default)
+
+    text = raw.strip()
+    if text == "":
+        return int(default)
+
+    try:
+        return int(text)
+    except ValueError:
+        return int(default)
+
+
 def _read_optional_env(name: str) -> str | None:
     raw = os.environ.get(name)
     if raw is None:
@@ -46,6 +61,7 @@ WANDB_DEFAULT_ENTITY = _read_optional_env("ABP_WANDB_ENTITY")
 WANDB_DEFAULT_PROJECT = _read_optional_env("ABP_WANDB_PROJECT")
 WANDB_API_KEY = _read_optional_env("WANDB_API_KEY") or _read_optional_env("ABP_WANDB_API_KEY")
 WANDB_CACHE_TTL_SECONDS = _parse_float_env("ABP_WANDB_CACHE_TTL_SECONDS", 30.0)
+RUN_SCAN_WORKERS = _parse_int_env("ABP_RUN_SCAN_WORKERS", 1)
 
 app = create_app(
     runs_root=RUNS_ROOT,
@@ -55,4 +71,5 @@ app = create_app(
     wandb_default_project=WANDB_DEFAULT_PROJECT,
     wandb_api_key=WANDB_API_KEY,
     wandb_cache_ttl_seconds=WANDB_CACHE_TTL_SECONDS,
+    run_scan_workers=RUN_SCAN_WORKERS,
 )
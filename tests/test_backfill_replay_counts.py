@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+from replay.index import read_replay_count
+from tools.backfill_replay_counts import backfill_replay_counts
+
+
+def _write_run(runs_root: Path, run_id: str, entry_count: int, **metadata: str) -> Path:
+    run_dir = runs_root / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "run_metadata.json").write_text(
+        json.dumps({"run_id": run_id, **metadata}), encoding="utf-8"
+    )
+    index_path = run_dir / metadata.get("replay_index_path", "replay_index.json")
+    index_path.write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "run_id": run_id,
+                "updated_at": "",
+                "entries": [{"replay_id": f"{run_id}-{idx}"} for idx in range(entry_count)],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return index_path
+
+
+def test_backfill_writes_missing_count_sidecars_once(tmp_path: Path) -> None:
+    plain = _write_run(tmp_path, "run-a", 3)
+    custom = _write_run(tmp_path, "run-b", 2, replay_index_path="custom_index.json")
+    (tmp_path / "run-c").mkdir()
+
+    report = backfill_replay_counts(tmp_path)
+    assert report == {"written": ["run-a", "run-b"], "current": [], "skipped": ["run-c"]}
+    assert read_replay_count(path=plain, run_id="run-a") == 3
+    assert read_replay_count(path=custom, run_id="run-b") == 2
+
+    assert backfill_replay_counts(tmp_path)["current"] == ["run-a", "run-b"]
+
+
+def test_backfill_skips_unreadable_runs_and_continues(tmp_path: Path) -> None:
+    bad_metadata = tmp_path / "run-a"
+    bad_metadata.mkdir()
+    (bad_metadata / "run_metadata.json").write_text("{not json", encoding="utf-8")
+    bad_index = _write_run(tmp_path, "run-b", 1)
+    bad_index.write_text("[", encoding="utf-8")
+    wrong_run = _write_run(tmp_path, "run-c", 1)
+    wrong_run.write_text(wrong_run.read_text().replace("run-c", "run-x"), encoding="utf-8")
+    good = _write_run(tmp_path, "run-d", 4)
+
+    report = backfill_replay_counts(tmp_path)
+    assert report == {"written": ["run-d"], "current": [], "skipped": ["run-a", "run-b", "run-c"]}
+    assert read_replay_count(path=good, run_id="run-d") == 4
+    assert read_replay_count(path=bad_index, run_id="run-b") is None
@@ -1,3 +1,4 @@
+import numpy as np
 from asteroid_prospector import N_ACTIONS, HelloProspectorEnv
 
 
@@ -28,3 +29,15 @@ def test_invalid_actions_are_flagged_and_penalized() -> None:
         assert truncated is False
         assert reward < 0.0
         assert info["invalid_action"] is True
+
+
+def test_action_space_accepts_numpy_integers_and_rejects_non_integers() -> None:
+    env = HelloProspectorEnv()
+
+    assert env.action_space.contains(np.int64(5)) is True
+    assert env.action_space.contains(np.uint8(N_ACTIONS - 1)) is True
+    assert env.action_space.contains(np.int32(N_ACTIONS)) is False
+    assert env.action_space.contains(-1) is False
+    assert env.action_space.contains(5.0) is False
+    assert env.action_space.contains("5") is False
+
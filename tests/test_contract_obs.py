@@ -32,3 +32,19 @@ def test_reset_is_deterministic_under_fixed_seed() -> None:
     obs_b, _ = env.reset(seed=1234)
 
     np.testing.assert_array_equal(obs_a, obs_b)
+
+
+def test_obs_is_read_only_view_unless_copy_requested() -> None:
+    env = HelloProspectorEnv()
+    obs_reset, _ = env.reset(seed=0)
+    obs_step, *_ = env.step(0)
+
+    assert obs_reset.flags.writeable is False
+    assert np.shares_memory(obs_reset, obs_step)
+
+    copying_env = HelloProspectorEnv(copy_obs=True)
+    obs_a, _ = copying_env.reset(seed=0)
+    obs_b, *_ = copying_env.step(0)
+
+    assert obs_a.flags.writeable is True
+    assert not np.shares_memory(obs_a, obs_b)
@@ -1,7 +1,15 @@
+import copy
 import math
 
 import numpy as np
 from asteroid_prospector import ProspectorReferenceEnv
+from asteroid_prospector.constants import (
+    MAX_ASTEROIDS,
+    MAX_NODES,
+    N_COMMODITIES,
+    NODE_CLUSTER,
+    NODE_HAZARD,
+)
 
 NUMERIC_INFO_KEYS = (
     "credits",
@@ -63,3 +71,62 @@ def test_different_seeds_produce_different_initial_world_observations() -> None:
     obs_b, _ = env_b.reset(seed=101)
 
     assert not np.array_equal(obs_a, obs_b)
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return min(high, max(low, value))
+
+
+def test_block_world_generation_matches_scalar_draw_order() -> None:
+    env = ProspectorReferenceEnv(seed=17)
+    for seed in (3, 17, 2024):
+        env.reset(seed=seed)
+        rng = copy.deepcopy(env._rng)
+        env._generate_world()
+
+        node_count = int(rng.integers(8, MAX_NODES + 1))
+        assert env.node_count == node_count
+        for node in range(1, node_count):
+            is_hazard = rng.random() < 0.25
+            hazard = float(np.float32(rng.uniform(0.05, 0.35)))
+            pirate = float(np.float32(rng.uniform(0.05, 0.30)))
+            if is_hazard:
+                hazard = _clamp(hazard + 0.25, 0.0, 1.0)
+                pirate = _clamp(pirate + 0.12, 0.0, 1.0)
+            assert env.node_type[node] == (NODE_HAZARD if is_hazard else NODE_CLUSTER)
+            assert env.node_hazard[node] == np.float32(hazard)
+            assert env.node_pirate[node] == np.float32(pirate)
+
+        rng = copy.deepcopy(env._rng)
+        env._generate_asteroids()
+        env._generate_market()
+        ones = np.ones((N_COMMODITIES,), dtype=np.float64)
+        for node in range(1, node_count):
+            n_ast = int(rng.integers(5, MAX_ASTEROIDS + 1))
+            assert env.ast_valid[node].tolist() == [1] * n_ast + [0] * (MAX_ASTEROIDS - n_ast)
+            for a_idx in range(n_ast):
+                np.testing.assert_array_equal(
+                    env.true_comp[node, a_idx], rng.dirichlet(ones).astype(np.float32)
+                )
+                richness = _clamp(rng.lognormal(mean=-0.2, sigma=0.65), 0.2, 4.0)
+                assert env.richness[node, a_idx] == np.float32(richness)
+                assert env.stability_true[node, a_idx] == np.float32(rng.beta(3.0, 2.0))
+                assert env.noise_profile[node, a_idx] == np.float32(rng.uniform(0.04, 0.22))
+                np.testing.assert_array_equal(
+                    env.comp_est[node, a_idx], rng.dirichlet(ones).astype(np.float32)
+                )
+
+        for c_idx in range(N_COMMODITIES):
+            assert env.station_inventory[c_idx] == np.float32(rng.uniform(20.0, 120.0))
+            phase = np.float32(rng.uniform(0.0, 2.0 * np.pi))
+            period = np.float32(rng.uniform(180.0, 380.0))
+            amp = np.float32(env.config.price_base[c_idx] * rng.uniform(0.10, 0.30))
+            assert (env.price_phase[c_idx], env.price_period[c_idx]) == (phase, period)
+            assert env.price_amp[c_idx] == amp
+            price = _clamp(
+                env.config.price_base[c_idx] + float(amp) * float(np.sin(float(phase))),
+                env.config.price_min[c_idx],
+                env.config.price_max[c_idx],
+            )
+            assert env.price[c_idx] == np.float32(price)
+        assert env._rng._next_u32() == rng._next_u32()
@@ -5,8 +5,13 @@ import numpy as np
 import pytest
 from asteroid_prospector.constants import N_ACTIONS, OBS_DIM
 from asteroid_prospector.native_core import (
+    _METRIC_FIELDS,
+    _RESULT_TAIL,
+    _RESULT_TAIL_OFFSET,
+    _STEP_RESULT_DTYPE,
     NativeProspectorCore,
     _AbpCoreState,
+    _AbpCoreStepResult,
     default_native_library_path,
 )
 
@@ -23,6 +28,25 @@ def test_default_native_library_path_points_to_platform_location() -> None:
         assert path.name in {"abp_core.so", "abp_core.dylib", "abp_core.dll"}
 
 
+def test_default_native_library_path_caches_only_found_library(monkeypatch, tmp_path) -> None:
+    import asteroid_prospector.native_core as native_core_module
+
+    monkeypatch.setattr(native_core_module, "_native_build_dir", lambda: tmp_path)
+    monkeypatch.setattr(native_core_module, "_FOUND_LIBRARY_PATH", None)
+
+    missing = default_native_library_path()
+    assert not missing.exists()
+    assert native_core_module._FOUND_LIBRARY_PATH is None
+
+    missing.write_bytes(b"")
+    found = default_native_library_path()
+    assert found == missing
+    assert native_core_module._FOUND_LIBRARY_PATH == found
+
+    monkeypatch.setattr(native_core_module, "_native_build_dir", lambda: tmp_path / "other")
+    assert default_native_library_path() == found
+
+
 def test_native_core_raises_for_missing_library(tmp_path) -> None:
     missing = tmp_path / "missing_core.dll"
     with pytest.raises(FileNotFoundError):
@@ -170,3 +194,275 @@ def test_batch_many_path_uses_native_many_symbols() -> None:
     assert infos["action_received"].tolist() == [5, 999]
     assert infos["action"].tolist() == [5, N_ACTIONS]
     assert infos["invalid_action"].tolist() == [False, True]
+    assert infos["dt"].tolist() == [1, 2]
+    assert infos["credits"].tolist() == pytest.approx([10.0, 11.0])
+    assert infos["survival"].tolist() == pytest.approx([1.0, 0.5])
+    assert infos["cargo_utilization_avg"].tolist() == pytest.approx([0.25, 0.5])
+    assert infos["time_remaining"].tolist() == pytest.approx([100.0, 99.0])
+    assert infos["terminated"].tolist() == [True, False]
+    assert infos["truncated"].tolist() == [False, True]
+
+    first_credits = infos["credits"].copy()
+    obs_again, _, _, _, infos_again = NativeProspectorCore.step_many(cores, [1, 2])
+    assert lib.step_many_calls == 2
+    assert infos_again["action"].tolist() == [1, 2]
+    assert not np.shares_memory(obs, obs_again)
+    np.testing.assert_array_equal(infos["credits"], first_credits)
+    assert infos["action"].tolist() == [5, N_ACTIONS]
+
+
+def test_step_result_metric_fields_are_contiguous_floats() -> None:
+    offsets = [getattr(_AbpCoreStepResult, name).offset for name in _METRIC_FIELDS]
+    float_size = ctypes.sizeof(ctypes.c_float)
+    assert offsets == [offsets[0] + i * float_size for i in range(len(_METRIC_FIELDS))]
+    assert offsets[-1] + float_size == ctypes.sizeof(_AbpCoreStepResult)
+    assert _RESULT_TAIL_OFFSET + _RESULT_TAIL.size == ctypes.sizeof(_AbpCoreStepResult)
+
+    result = _AbpCoreStepResult()
+    result.reward = 1.5
+    result.terminated = 1
+    result.invalid_action = 1
+    result.dt = 300
+    result.action = -2
+    result.time_remaining = 9.0
+    values = _RESULT_TAIL.unpack_from(result, _RESULT_TAIL_OFFSET)
+    assert values[:6] == (1.5, 1, 0, 1, 300, -2)
+    assert values[-1] == 9.0
+
+
+def test_step_info_is_a_read_only_mapping_over_metric_snapshot() -> None:
+    result = _AbpCoreStepResult()
+    result.action = 3
+    result.dt = 2
+    result.truncated = 1
+    for i, name in enumerate(_METRIC_FIELDS):
+        setattr(result, name, float(i))
+
+    values = _RESULT_TAIL.unpack_from(result, _RESULT_TAIL_OFFSET)
+    info = NativeProspectorCore._info_from_result(values, action_received=3)
+    result.action = 9
+    result.dt = 7
+    result.credits = -1.0
+
+    assert list(info) == [
+        "action",
+        "action_received",
+        "dt",
+        "invalid_action",
+        *_METRIC_FIELDS,
+        "terminated",
+        "truncated",
+    ]
+    assert info["action"] == 3
+    assert info["dt"] == 2
+    assert info["truncated"] is True
+    assert info["credits"] == 0.0
+    assert info["time_remaining"] == float(len(_METRIC_FIELDS) - 1)
+    assert isinstance(info["net_profit"], float)
+    assert info.get("missing", "default") == "default"
+    assert info.copy() == dict(info)
+    assert list(info.copy()) == list(info)
+    assert info.copy()["truncated"] is True
+    assert "action_received" in info and "credits" in info
+    assert "missing" not in info
+
+
+def test_load_library_configures_each_library_once(monkeypatch, tmp_path) -> None:
+    import asteroid_prospector.native_core as native_core_module
+
+    loaded: list[str] = []
+
+    class FakeFunction:
+        argtypes = None
+        restype = None
+
+    class FakeCDLL:
+        def __init__(self, path: str) -> None:
+            loaded.append(path)
+            for name in ("abp_core_create", "abp_core_destroy", "abp_core_reset", "abp_core_step"):
+                setattr(self, name, FakeFunction())
+
+    monkeypatch.setattr(native_core_module, "_LIBRARY_CACHE", {})
+    monkeypatch.setattr(native_core_module.ctypes, "CDLL", FakeCDLL)
+
+    library_file = tmp_path / "abp_core.so"
+    first = native_core_module._load_library(library_file)
+    second = native_core_module._load_library(library_file)
+
+    assert first is second
+    assert loaded == [str(library_file)]
+    assert first[1] is False
+    assert first[0].abp_core_step.argtypes is not None
+
+
+def test_step_many_fills_caller_provided_info_columns() -> None:
+    class FakeScalarCore:
+        def step(self, action: int):
+            info = {"action": action, "dt": 2, "credits": 1.5}
+            return np.zeros((OBS_DIM,), dtype=np.float32), 0.0, False, False, info
+
+    infos_out = NativeProspectorCore._allocate_info_arrays(2)
+    credits_column = infos_out["credits"]
+
+    _, _, _, _, infos = NativeProspectorCore.step_many(
+        [FakeScalarCore(), FakeScalarCore()], [3, 4], infos_out=infos_out
+    )
+
+    assert infos is infos_out
+    assert infos["credits"] is credits_column
+    assert infos["action_received"].tolist() == [3, 4]
+    assert infos["dt"].tolist() == [2, 2]
+    assert infos["credits"].tolist() == pytest.approx([1.5, 1.5])
+
+
+@pytest.mark.skipif(
+    not default_native_library_path().exists(), reason="native core library not built"
+)
+def test_native_step_obs_is_owned_copy_of_result_buffer() -> None:
+    with NativeProspectorCore(seed=3) as core:
+        reset_a = core.reset(3)
+        reset_b = core.reset(3)
+        assert not np.shares_memory(reset_a, reset_b)
+        np.testing.assert_array_equal(reset_a, reset_b)
+
+        obs_a, *_ = core.step(6)
+        snapshot = obs_a.copy()
+        obs_b, *_ = core.step(0)
+
+        assert not np.shares_memory(obs_a, core._obs_view)
+        assert not np.shares_memory(obs_a, obs_b)
+        np.testing.assert_array_equal(obs_a, snapshot)
+        np.testing.assert_array_equal(obs_b, core._obs_view)
+
+
+@pytest.mark.skipif(
+    not default_native_library_path().exists(), reason="native core library not built"
+)
+def test_native_library_is_loaded_without_holding_the_gil() -> None:
+    # ctypes.CDLL releases the GIL around foreign calls; PyDLL (a CDLL subclass) would not.
+    with NativeProspectorCore(seed=1) as core:
+        assert type(core._lib) is ctypes.CDLL
+        assert not isinstance(core._lib, ctypes.PyDLL)
+
+
+@pytest.mark.skipif(
+    not default_native_library_path().exists(), reason="native core library not built"
+)
+def test_native_step_and_step_many_agree() -> None:
+    actions = [6, 0, 3, 999, -2, 1, 6, 5] * 8
+    with NativeProspectorCore(seed=11) as single, NativeProspectorCore(seed=11) as batched:
+        np.testing.assert_array_equal(
+            single.reset(11), NativeProspectorCore.reset_many([batched], [11])[0]
+        )
+        for action in actions:
+            obs, reward, terminated, truncated, info = single.step(action)
+            b_obs, b_rew, b_term, b_trunc, b_infos = NativeProspectorCore.step_many(
+                [batched], [action]
+            )
+            np.testing.assert_array_equal(obs, b_obs[0])
+            assert reward == float(b_rew[0])
+            assert (terminated, truncated) == (bool(b_term[0]), bool(b_trunc[0]))
+            assert info.copy() == {key: b_infos[key][0].item() for key in info}
+
+
+def test_coerce_action_u8_maps_out_of_range_actions_to_n_actions() -> None:
+    assert NativeProspectorCore._coerce_action_u8(0) == 0
+    assert NativeProspectorCore._coerce_action_u8(N_ACTIONS - 1) == N_ACTIONS - 1
+    for action in (-1, N_ACTIONS, 200, 255, 256, 10_000):
+        assert NativeProspectorCore._coerce_action_u8(action) == N_ACTIONS
+
+
+def test_native_core_reraises_load_error_for_existing_invalid_library(tmp_path) -> None:
+    invalid = tmp_path / "abp_core.so"
+    invalid.write_bytes(b"not a shared library")
+    with pytest.raises(OSError) as excinfo:
+        NativeProspectorCore(seed=0, library_path=invalid)
+    assert not isinstance(excinfo.value, FileNotFoundError)
+
+
+def test_step_result_dtype_matches_ctypes_layout() -> None:
+    assert _STEP_RESULT_DTYPE.itemsize == ctypes.sizeof(_AbpCoreStepResult)
+    for name, _ in _AbpCoreStepResult._fields_:
+        assert _STEP_RESULT_DTYPE.fields[name][1] == getattr(_AbpCoreStepResult, name).offset
+    assert _STEP_RESULT_DTYPE["obs"].shape == (OBS_DIM,)
+    assert _STEP_RESULT_DTYPE["obs"].base == np.float32
+
+
+def test_batch_buffers_are_reused_and_state_addresses_refreshed() -> None:
+    states = [_AbpCoreState(), _AbpCoreState(), _AbpCoreState()]
+    cores = []
+    for state in states:
+        core = object.__new__(NativeProspectorCore)
+        core._state = ctypes.pointer(state)
+        cores.append(core)
+
+    buffers = NativeProspectorCore._batch_buffers(cores[0], 2)
+    buffers.fill_states(cores[:2])
+    assert buffers.states[:2].tolist() == [ctypes.addressof(s) for s in states[:2]]
+    assert NativeProspectorCore._batch_buffers(cores[0], 1) is buffers
+
+    cores[1]._state = ctypes.pointer(states[2])
+    buffers.fill_states(cores[:2])
+    assert int(buffers.states[1]) == ctypes.addressof(states[2])
+
+    grown = NativeProspectorCore._batch_buffers(cores[0], 3)
+    assert grown is not buffers
+    assert grown.capacity == 3
+    assert NativeProspectorCore._batch_buffers(cores[0], 2) is grown
+
+    for core in cores:
+        core._state = None
+
+
+def test_step_many_coerces_actions_like_scalar_path() -> None:
+    captured: list[list[int]] = []
+
+    class FakeLib:
+        def abp_core_step_many(self, states, actions, count, out_results) -> None:
+            del states, out_results
+            n = int(count.value)
+            captured.append(np.ctypeslib.as_array(actions, shape=(n,)).tolist())
+
+    lib = FakeLib()
+    cores = []
+    raw = [0, N_ACTIONS - 1, N_ACTIONS, -1, 255, 256, 2**40, -(2**40)]
+    for _ in raw:
+        core = object.__new__(NativeProspectorCore)
+        core._lib = lib
+        core._has_batch_apis = True
+        core._state = ctypes.POINTER(_AbpCoreState)()
+        cores.append(core)
+
+    NativeProspectorCore.step_many(cores, raw)
+    assert captured == [[NativeProspectorCore._coerce_action_u8(a) for a in raw]]
+
+
+def test_allocate_info_arrays_views_one_structured_buffer() -> None:
+    infos = NativeProspectorCore._allocate_info_arrays(3, action_received=np.array([4, -1, 99]))
+    assert list(infos) == ["action", "action_received", "dt", "invalid_action"] + list(
+        _METRIC_FIELDS
+    ) + ["terminated", "truncated"]
+    assert infos["action_received"].tolist() == [4, -1, 99]
+    assert infos["action"].dtype == np.int16
+    assert infos["dt"].dtype == np.int32
+    assert infos["credits"].dtype == np.float32
+    assert infos["terminated"].dtype == np.bool_
+    for column in infos.values():
+        assert column.shape == (3,)
+        assert column.base is infos["action"].base
+
+
+def test_infos_rows_to_arrays_applies_defaults_and_sanitizes_values() -> None:
+    rows = [
+        {"action": "3", "credits": "nan", "survival": None, "terminated": 1},
+        {"dt": 4, "credits": 2.5, "invalid_action": True, "truncated": 0},
+    ]
+    infos = NativeProspectorCore._infos_rows_to_arrays(rows, np.array([3, 8]))
+    assert infos["action"].tolist() == [3, 0]
+    assert infos["dt"].tolist() == [1, 4]
+    assert infos["credits"].tolist() == [0.0, 2.5]
+    assert infos["survival"].tolist() == [0.0, 0.0]
+    assert infos["invalid_action"].tolist() == [False, True]
+    assert infos["terminated"].tolist() == [True, False]
+    assert infos["truncated"].tolist() == [False, False]
+    assert infos["action_received"].tolist() == [3, 8]
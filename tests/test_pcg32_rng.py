@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from asteroid_prospector.pcg32_rng import Pcg32Rng
+
+
+@pytest.mark.parametrize("count", [0, 1, 31, 32, 33, 257, 4096])
+def test_u32_block_matches_scalar_stream(count: int) -> None:
+    scalar = Pcg32Rng(seed=2024)
+    block = Pcg32Rng(seed=2024)
+
+    expected = [scalar._next_u32() for _ in range(count)]
+    drawn = block._next_u32_block(count)
+
+    assert drawn.tolist() == expected
+    assert block._next_u32() == scalar._next_u32()
+
+
+def test_sized_draws_match_scalar_draw_sequence() -> None:
+    scalar = Pcg32Rng(seed=9, stream=3)
+    block = Pcg32Rng(seed=9, stream=3)
+
+    ints = block.integers(-4, 11, size=(5, 8))
+    assert ints.shape == (5, 8)
+    assert ints.ravel().tolist() == [scalar.integers(-4, 11) for _ in range(40)]
+
+    randoms = block.random(size=64)
+    assert randoms.tolist() == [scalar.random() for _ in range(64)]
+
+    lows = np.linspace(0.0, 3.0, 32)
+    uniforms = block.uniform(lows, 5.0)
+    assert uniforms.tolist() == [scalar.uniform(float(lo), 5.0) for lo in lows]
+
+
+def test_sized_normal_draws_match_scalar_box_muller_sequence() -> None:
+    scalar = Pcg32Rng(seed=77)
+    block = Pcg32Rng(seed=77)
+
+    locs = np.arange(6.0)
+    scales = np.linspace(0.1, 1.0, 6)
+    assert block.normal(locs, scales).tolist() == [
+        scalar.normal(float(loc), float(scale)) for loc, scale in zip(locs, scales, strict=True)
+    ]
+
+    draws = block.normal(1.0, 2.0, size=(10, 10))
+    assert draws.shape == (10, 10)
+    assert draws.ravel().tolist() == [scalar.normal(1.0, 2.0) for _ in range(100)]
+    assert block._next_u32() == scalar._next_u32()
+
+
+def test_integer_shape_gamma_families_match_scalar_draw_sequence() -> None:
+    scalar = Pcg32Rng(seed=5)
+    block = Pcg32Rng(seed=5)
+
+    betas = block.beta(3.0, 2.0, size=40)
+    assert betas.tolist() == [scalar.beta(3.0, 2.0) for _ in range(40)]
+
+    for alpha in (np.ones(6), np.array([1.0, 2.0, 3.0]), np.ones(11)):
+        assert block.dirichlet(alpha).tolist() == scalar.dirichlet(alpha).tolist()
+        batch = block.dirichlet(alpha, size=(3, 4))
+        assert batch.shape == (3, 4, alpha.size)
+        expected = [scalar.dirichlet(alpha).tolist() for _ in range(12)]
+        assert batch.reshape(12, alpha.size).tolist() == expected
+
+    mixed = block.dirichlet(np.array([0.5, 2.0]), size=5)
+    assert mixed.tolist() == [scalar.dirichlet(np.array([0.5, 2.0])).tolist() for _ in range(5)]
+    assert block._next_u32() == scalar._next_u32()
+
+
+def test_integers_wide_span_matches_scalar_draws() -> None:
+    block, scalar = Pcg32Rng(seed=21), Pcg32Rng(seed=21)
+    wide = block.integers(-5, 2**70, size=40)
+    assert wide.tolist() == [scalar.integers(-5, 2**70) for _ in range(40)]
+    assert block.integers(0, 2**32, size=40).tolist() == [
+        scalar.integers(0, 2**32) for _ in range(40)
+    ]
+
+
+def test_uniform_broadcasts_bounds_and_rejects_mismatched_size() -> None:
+    block, scalar = Pcg32Rng(seed=5), Pcg32Rng(seed=5)
+    lows = np.array([[0.0], [10.0]])
+    highs = np.array([1.0, 2.0, 3.0])
+    drawn = block.uniform(lows, highs)
+    assert drawn.shape == (2, 3)
+    assert drawn.ravel().tolist() == [
+        scalar.uniform(float(lo), float(hi)) for lo in (0.0, 10.0) for hi in (1.0, 2.0, 3.0)
+    ]
+    with pytest.raises(ValueError):
+        block.uniform(np.zeros(3), 1.0, size=2)
+
+
+def test_scalar_parameter_fast_path_matches_zero_dim_arrays() -> None:
+    fast, slow = Pcg32Rng(seed=13), Pcg32Rng(seed=13)
+    for lo, hi in ((0.8, 1.2), (1, 4), (np.float32(0.5), 1.0)):
+        assert fast.uniform(lo, hi) == slow.uniform(np.array(lo), np.array(hi))
+        assert fast.normal(lo, hi) == slow.normal(np.array(lo), np.array(hi))
+    assert fast.integers(3, 17) == slow.integers(np.int64(3), np.int64(17))
+    assert fast._next_u32() == slow._next_u32()
+    assert isinstance(fast.uniform(0.0, 1.0), float)
+    assert isinstance(fast.normal(0.0, 1.0), float)
@@ -5,6 +5,7 @@ from pathlib import Path
 import asteroid_prospector
 import numpy as np
 import pytest
+from asteroid_prospector.native_core import default_native_library_path
 
 from training.puffer_backend import (
     PpoConfig,
@@ -15,6 +16,7 @@ from training.puffer_backend import (
     _resolve_env_impl,
     _validate_config,
 )
+from training.windowing import WindowMetricsAggregator
 
 
 def _base_cfg(**overrides: object) -> PpoConfig:
@@ -156,6 +158,38 @@ def test_native_wrapper_contract_with_fake_core(monkeypatch: pytest.MonkeyPatch)
     assert instance.closed is True
 
 
+@pytest.mark.skipif(
+    not default_native_library_path().exists(), reason="native core library not built"
+)
+def test_native_gym_env_step_infos_reach_window_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_gym = types.SimpleNamespace(
+        spaces=types.SimpleNamespace(Discrete=_FakeDiscrete, Box=_FakeBox)
+    )
+    monkeypatch.setitem(sys.modules, "gymnasium", fake_gym)
+
+    env = _ProspectorNativeGymEnv(time_max=321.0, seed=7)
+    try:
+        env.reset(seed=11)
+        _, reward, terminated, truncated, step_info = env.step(6)
+    finally:
+        env.close()
+
+    assert type(step_info) is dict
+    agg = WindowMetricsAggregator(run_id="native-infos", window_env_steps=1)
+    emitted = agg.record_step_batch(
+        rewards=[reward],
+        infos=[step_info],
+        terminated=[terminated],
+        truncated=[truncated],
+    )
+
+    assert len(emitted) == 1
+    record = emitted[0]
+    assert record.env_steps_in_window == int(step_info["dt"])
+    assert record.metric_means["credits"] == pytest.approx(float(step_info["credits"]))
+    assert record.metric_means["fuel_used"] == pytest.approx(float(step_info["fuel_used"]))
+
+
 def test_dispatch_step_callbacks_prefers_batch_callback() -> None:
     calls = {"step": 0, "batch": 0}
 
@@ -223,6 +257,7 @@ def test_native_batch_vector_env_uses_batch_bridge_and_autoresets_done_envs(
         instances: list["FakeCore"] = []
         reset_many_calls: list[dict[str, object]] = []
         step_many_calls: list[dict[str, object]] = []
+        infos_out_args: list[object] = []
 
         def __init__(self, seed: int, *, config: object) -> None:
             self.seed = int(seed)
@@ -247,8 +282,11 @@ def test_native_batch_vector_env_uses_batch_bridge_and_autoresets_done_envs(
         def step_many(
             cores: list["FakeCore"],
             actions: list[int],
+            *,
+            infos_out: dict[str, np.ndarray] | None = None,
         ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
             count = len(cores)
+            FakeCore.infos_out_args.append(infos_out)
             FakeCore.step_many_calls.append(
                 {
                     "count": count,
@@ -288,6 +326,9 @@ def test_native_batch_vector_env_uses_batch_bridge_and_autoresets_done_envs(
 
     assert len(FakeCore.step_many_calls) == 1
     assert FakeCore.step_many_calls[0]["actions"] == [4, 5, 6]
+    infos_out = FakeCore.infos_out_args[0]
+    assert isinstance(infos_out, dict)
+    assert infos_out["credits"].shape == (3,)
     assert rewards.tolist() == pytest.approx([1.0, 2.0, 3.0])
     assert terminated.tolist() == [False, True, False]
     assert truncated.tolist() == [False, False, False]
@@ -326,8 +367,10 @@ def test_native_batch_vector_env_rejects_wrong_action_count(
         def step_many(
             cores: list["FakeCore"],
             actions: list[int],
+            *,
+            infos_out: dict[str, np.ndarray] | None = None,
         ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
-            del actions
+            del actions, infos_out
             count = len(cores)
             return (
                 np.zeros((count, asteroid_prospector.OBS_DIM), dtype=np.float32),
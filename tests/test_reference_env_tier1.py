@@ -6,6 +6,10 @@ from asteroid_prospector.constants import (
     FUEL_MAX,
     HEAT_MAX,
     HULL_MAX,
+    MAX_ASTEROIDS,
+    MAX_NEIGHBORS,
+    MAX_NODES,
+    NODE_STATION,
     TOOL_MAX,
 )
 
@@ -79,3 +83,133 @@ def test_market_prices_stay_finite_and_bounded() -> None:
 
         if terminated or truncated:
             env.reset(seed=100)
+
+
+def test_edge_bookkeeping_matches_neighbor_table() -> None:
+    env = ProspectorReferenceEnv(seed=9)
+    for seed in (1, 9, 77):
+        env.reset(seed=seed)
+        pairs = set()
+        for node in range(env.node_count):
+            row = env.neighbors[node]
+            degree = int(np.sum(row >= 0))
+            assert np.all(row[:degree] >= 0) and np.all(row[degree:] < 0)
+            assert env._first_free_slot(node) == (degree if degree < row.size else -1)
+            pairs.update((min(node, int(n)), max(node, int(n))) for n in row[:degree])
+        assert env._edge_set == pairs
+        assert all(env._edge_exists(v, u) for u, v in pairs)
+
+
+def test_wide_scan_batch_matches_per_asteroid_updates() -> None:
+    import copy
+
+    env = ProspectorReferenceEnv(seed=5)
+    env.reset(seed=5)
+    env.step(_first_valid_travel_action(env))
+    node = env.current_node
+    twin = copy.deepcopy(env)
+
+    env._update_cluster_priors_with_noise()
+    for a_idx in np.flatnonzero(twin.ast_valid[node] > 0):
+        twin._update_asteroid_estimates(int(a_idx), mode="wide")
+
+    for name in ("comp_est", "stability_est", "scan_conf"):
+        np.testing.assert_array_equal(getattr(env, name), getattr(twin, name))
+    assert env._rng._next_u32() == twin._rng._next_u32()
+
+
+def test_neighbor_threat_update_matches_scalar_draw_order() -> None:
+    import copy
+
+    env = ProspectorReferenceEnv(seed=9)
+    env.reset(seed=9)
+    node = env.current_node
+    twin = copy.deepcopy(env)
+
+    env._update_neighbor_threat_estimates()
+    for slot in range(MAX_NEIGHBORS):
+        if twin.neighbors[node, slot] < 0:
+            continue
+        noisy = float(twin.edge_threat_true[node, slot]) + float(twin._rng.normal(0.0, 0.08))
+        noisy = min(max(noisy, 0.0), 1.0)
+        prev = float(twin.edge_threat_est[node, slot])
+        twin.edge_threat_est[node, slot] = np.float32(0.25 * prev + 0.75 * noisy)
+
+    np.testing.assert_array_equal(env.edge_threat_est, twin.edge_threat_est)
+    assert env._rng._next_u32() == twin._rng._next_u32()
+
+
+def test_normalize_probs_writes_into_scratch_buffer() -> None:
+    from asteroid_prospector.reference_env import _normalize_probs
+
+    values = np.array([0.2, 0.0, 0.5, 1.0e-12, 0.3, 0.1], dtype=np.float32)
+    out = np.empty(values.shape, dtype=np.float64)
+    expected = np.clip(values.astype(np.float64), 1.0e-8, None)
+    expected /= expected.sum()
+
+    assert _normalize_probs(values, out=out) is None
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_station_flag_follows_current_node() -> None:
+    env = ProspectorReferenceEnv(seed=11)
+    obs, _ = env.reset(seed=11)
+    assert env._is_at_station() and obs[17] == 1.0
+
+    obs, _, _, _, _ = env.step(_first_valid_travel_action(env))
+    at_station = int(env.node_type[env.current_node]) == NODE_STATION
+    assert env._is_at_station() is at_station
+    assert obs[17] == float(at_station)
+
+
+def test_station_distances_match_per_node_bfs() -> None:
+    from collections import deque
+
+    env = ProspectorReferenceEnv(seed=0)
+    for seed in range(20):
+        env.reset(seed=seed)
+        for start in range(env.node_count):
+            expected = MAX_NODES - 1
+            seen = {start}
+            queue = deque([(start, 0)])
+            while queue and start != 0:
+                node, dist = queue.popleft()
+                nxts = [int(n) for n in env.neighbors[node] if 0 <= n < env.node_count]
+                if 0 in nxts:
+                    expected = dist + 1
+                    break
+                for nxt in nxts:
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        queue.append((nxt, dist + 1))
+            env.current_node = start
+            assert env._steps_to_station() == (0 if start == 0 else expected)
+
+
+def test_market_rows_stay_views_of_one_block() -> None:
+    env = ProspectorReferenceEnv(seed=4)
+    env.reset(seed=4)
+    for _ in range(5):
+        env.step(6)
+    rows = (env.price, env.prev_price, env.station_inventory, env.recent_sales)
+    for idx, row in enumerate(rows):
+        assert row.base is env._market
+        np.testing.assert_array_equal(env._market[idx], row)
+
+
+def test_selected_asteroid_flag_tracks_selection_state() -> None:
+    env = ProspectorReferenceEnv(seed=21)
+    env.reset(seed=21)
+    rng = np.random.default_rng(21)
+    actions = [*range(0, 6), *range(12, 31), 31, 9, 10]
+    for _ in range(400):
+        _, _, terminated, truncated, _ = env.step(int(rng.choice(actions)))
+        a_idx = env.selected_asteroid
+        expected = (
+            0 <= a_idx < MAX_ASTEROIDS
+            and env.ast_valid[env.current_node, a_idx] != 0
+            and env.depletion[env.current_node, a_idx] < 1.0
+        )
+        assert env._selected_asteroid_valid() is bool(expected)
+        if terminated or truncated:
+            env.reset(seed=21)
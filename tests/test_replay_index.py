@@ -1,4 +1,19 @@
-from replay.index import filter_replay_entries, get_replay_entry_by_id
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import replay.index as replay_index
+from replay.index import (
+    append_replay_entry,
+    filter_replay_entries,
+    get_replay_entry_by_id,
+    load_replay_count,
+    load_replay_index,
+    read_replay_count,
+    replay_count_path,
+)
 
 
 def _entry(window_id: int, replay_id: str, tags: list[str]) -> dict:
@@ -50,3 +65,87 @@ def test_get_replay_entry_by_id_returns_match_or_none() -> None:
 
     assert get_replay_entry_by_id(index_payload, "r1") is not None
     assert get_replay_entry_by_id(index_payload, "missing") is None
+
+
+def test_replay_entry_table_matches_filter_replay_entries() -> None:
+    import random
+
+    from replay.index import ReplayEntryTable
+
+    rng = random.Random(7)
+    vocab = ["every_window", "best_so_far", "milestone:profit:100", "milestone:survival:1", ""]
+    entries: list = []
+    for idx in range(300):
+        entry = _entry(rng.randrange(12), f"r{idx:03d}", rng.sample(vocab, rng.randrange(4)))
+        entry["created_at"] = f"2026-02-28T00:00:{rng.randrange(60):02d}+00:00"
+        entries.append(entry)
+    entries.extend(["not-an-entry", {"replay_id": "no-window", "tags": "every_window"}])
+
+    table = ReplayEntryTable(entries)
+    filters = [
+        {},
+        {"tag": "every_window"},
+        {"tag": "missing"},
+        {"tag": ""},
+        {"tags_any": ["best_so_far", "milestone:profit:100"]},
+        {"tags_any": ["missing"]},
+        {"tags_any": ["", "missing", "best_so_far"]},
+        {"tags_all": ["every_window", "best_so_far"]},
+        {"tags_all": ["every_window", "missing"]},
+        {"tag": "every_window", "tags_any": ["milestone:survival:1"], "window_id": 3},
+        {"window_id": -1},
+        {"window_id": 2**70},
+        {"tags_all": ["every_window"], "limit": 5},
+        {"limit": 0},
+    ]
+    for kwargs in filters:
+        assert table.filter(**kwargs) == filter_replay_entries(entries, **kwargs), kwargs
+
+
+def test_replay_count_sidecar_tracks_appends_and_goes_stale_on_edits(
+    monkeypatch, tmp_path: Path
+) -> None:
+    index_path = tmp_path / "replay_index.json"
+    assert load_replay_count(path=index_path, run_id="run-a") == 0
+
+    for window_id in range(3):
+        append_replay_entry(
+            path=index_path, run_id="run-a", entry=_entry(window_id, f"r{window_id}", [])
+        )
+    assert replay_count_path(index_path) == tmp_path / "replay_index.count"
+    assert read_replay_count(path=index_path, run_id="run-a") == 3
+    assert read_replay_count(path=index_path, run_id="run-b") is None
+
+    def _no_parse(**_kwargs):
+        raise AssertionError("index parsed despite a current sidecar")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(replay_index, "load_replay_index", _no_parse)
+        assert load_replay_count(path=index_path, run_id="run-a") == 3
+
+    # Rewriting the index outside append_replay_entry leaves the sidecar stale.
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    payload["entries"] = payload["entries"][:1]
+    index_path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_replay_count(path=index_path, run_id="run-a") is None
+    assert load_replay_count(path=index_path, run_id="run-a") == 1
+
+    with pytest.raises(ValueError, match="run_id mismatch"):
+        load_replay_count(path=index_path, run_id="run-b")
+
+
+def test_load_replay_index_accepts_stdlib_only_json_tokens(tmp_path: Path) -> None:
+    index_path = tmp_path / "replay_index.json"
+    entry = dict(_entry(0, "r0", ["every_window"]), profit=float("nan"), seed=2**70)
+    payload = {"schema_version": 1, "run_id": "run-a", "updated_at": "", "entries": [entry]}
+    index_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    loaded = load_replay_index(path=index_path, run_id="run-a")
+    assert loaded["entries"][0]["seed"] == 2**70
+    assert loaded["entries"][0]["profit"] != loaded["entries"][0]["profit"]
+
+    index_path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        load_replay_index(path=index_path, run_id="run-a")
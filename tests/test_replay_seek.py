@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import replay.seek as replay_seek
+from replay.seek import ReplaySeekIndex, iter_replay_lines
+
+
+def _frame_lines(count: int, *, newline: str = "\n") -> list[bytes]:
+    return [
+        (json.dumps({"frame_index": idx, "pad": "x" * (idx % 37)}) + newline).encode("utf-8")
+        for idx in range(count)
+    ]
+
+
+def _read_all(index: ReplaySeekIndex, path: Path, start: int = 0) -> list[tuple[int, bytes]]:
+    return list(index.iter_lines(path, start=start))
+
+
+def test_replay_line_splitter_matches_text_mode_iteration(monkeypatch, tmp_path: Path) -> None:
+    raw = b'{"a": 1}\r\n{"b": 2}\n\n{"c": "\xc3\xa9"}\r{"d": 4}\r\n{"e": 5}'
+    path = tmp_path / "frames.jsonl"
+    path.write_bytes(raw)
+    with path.open("r", encoding="utf-8") as handle:
+        expected = list(handle)
+
+    for block_bytes in (1, 2, 3, 7, 9, 1024):
+        monkeypatch.setattr(replay_seek, "READ_BLOCK_BYTES", block_bytes)
+        lines = list(iter_replay_lines(io.BytesIO(raw)))
+        decoded = [line.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n") for line in lines]
+        assert decoded == expected
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+@pytest.mark.parametrize("block_bytes", [5, 64, 128 * 1024])
+def test_seek_index_offsets_match_full_scan(
+    monkeypatch, tmp_path: Path, suffix: str, block_bytes: int
+) -> None:
+    monkeypatch.setattr(replay_seek, "READ_BLOCK_BYTES", block_bytes)
+    lines = _frame_lines(300, newline="\r\n")[:150] + _frame_lines(150)
+    raw = b"".join(lines)
+    path = tmp_path / f"frames{suffix}"
+    path.write_bytes(gzip.compress(raw) if suffix.endswith(".gz") else raw)
+
+    index = ReplaySeekIndex(checkpoint_every=16)
+    full = _read_all(index, path)
+    assert [line for _, line in full] == lines
+    assert [line_no for line_no, _ in full] == list(range(len(lines)))
+
+    # The first scan recorded checkpoints; every offset resumes to the same lines.
+    for start in (0, 1, 15, 16, 17, 100, 149, 150, 299, 300, 400):
+        assert _read_all(index, path, start) == full[start:]
+
+
+def test_seek_index_reads_concatenated_gzip_members_with_padding(tmp_path: Path) -> None:
+    lines = _frame_lines(120)
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(
+        gzip.compress(b"".join(lines[:50])) + gzip.compress(b"".join(lines[50:])) + b"\x00" * 16
+    )
+    with gzip.open(path, "rb") as handle:
+        assert handle.read() == b"".join(lines)
+
+    index = ReplaySeekIndex(checkpoint_every=8)
+    assert [line for _, line in _read_all(index, path)] == lines
+    assert [line for _, line in _read_all(index, path, 45)] == lines[45:]
+    assert [line for _, line in _read_all(index, path, 97)] == lines[97:]
+
+
+def test_seek_index_reads_members_after_padding_longer_than_a_read(tmp_path: Path) -> None:
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(gzip.compress(b"a\n") + b"\x00" * (300 * 1024) + gzip.compress(b"b\n"))
+    with gzip.open(path, "rb") as handle:
+        assert handle.read() == b"a\nb\n"
+
+    assert _read_all(ReplaySeekIndex(), path) == [(0, b"a\n"), (1, b"b\n")]
+
+
+def test_seek_index_raises_on_truncated_gzip(tmp_path: Path) -> None:
+    compressed = gzip.compress(b"".join(_frame_lines(5000)))
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(compressed[: len(compressed) // 2])
+    with pytest.raises(EOFError), gzip.open(path, "rb") as handle:
+        handle.read()
+
+    with pytest.raises(EOFError):
+        _read_all(ReplaySeekIndex(), path)
+
+
+def test_seek_index_resumes_from_checkpoints(monkeypatch, tmp_path: Path) -> None:
+    lines = _frame_lines(200)
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(gzip.compress(b"".join(lines)))
+    monkeypatch.setattr(replay_seek, "READ_BLOCK_BYTES", 256)
+
+    index = ReplaySeekIndex(checkpoint_every=10)
+    _read_all(index, path)
+    checkpoint = index._nearest_checkpoint(
+        str(path), (path.stat().st_mtime_ns, path.stat().st_size), 150, gz=True
+    )
+    assert 140 <= checkpoint.line <= 150
+    assert checkpoint.raw_offset > 0
+    assert _read_all(index, path, 150) == list(enumerate(lines))[150:]
+
+
+def test_seek_index_caps_checkpoints_per_file(monkeypatch, tmp_path: Path) -> None:
+    lines = _frame_lines(400)
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(gzip.compress(b"".join(lines)))
+    monkeypatch.setattr(replay_seek, "READ_BLOCK_BYTES", 512)
+
+    index = ReplaySeekIndex(checkpoint_every=4, max_checkpoints=6)
+    full = _read_all(index, path)
+    entry = index._files[str(path)]
+    assert len(entry.checkpoints) <= 6
+    assert entry.every > 4
+    for checkpoint in entry.checkpoints:
+        held = len(checkpoint.inflater.unconsumed_tail) + len(checkpoint.inflater.unused_data)
+        assert held <= replay_seek._INFLATE_INPUT_BYTES
+    for start in (0, 3, 57, 200, 399, 400):
+        assert _read_all(index, path, start) == full[start:]
+
+
+def test_seek_index_drops_checkpoints_when_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "frames.jsonl.gz"
+    path.write_bytes(gzip.compress(b"".join(_frame_lines(80))))
+    index = ReplaySeekIndex(checkpoint_every=4)
+    _read_all(index, path)
+
+    rewritten = [line.replace(b"frame_index", b"frame_idx") for line in _frame_lines(60)]
+    path.write_bytes(gzip.compress(b"".join(rewritten)))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [line for _, line in _read_all(index, path, 30)] == rewritten[30:]
+
+
+def test_seek_index_evicts_least_recently_used_files(tmp_path: Path) -> None:
+    index = ReplaySeekIndex(checkpoint_every=2, max_files=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_bytes(b"".join(_frame_lines(10)))
+        paths.append(path)
+        _read_all(index, path)
+
+    assert list(index._files) == [str(paths[1]), str(paths[2])]
+    with pytest.raises(ValueError):
+        ReplaySeekIndex(checkpoint_every=0)
+
+
+@pytest.mark.parametrize("block_bytes", [3, 40, 128 * 1024])
+def test_seek_index_skips_to_start_across_newline_styles(
+    monkeypatch, tmp_path: Path, block_bytes: int
+) -> None:
+    monkeypatch.setattr(replay_seek, "READ_BLOCK_BYTES", block_bytes)
+    # LF-only prefix (counted without splitting), then CR/CRLF lines and no final newline.
+    raw = b"".join(_frame_lines(40)) + b'{"a": 1}\r{"b": 2}\r\n{"c": 3}'
+    path = tmp_path / "frames.jsonl"
+    path.write_bytes(raw)
+    expected = list(enumerate(raw.splitlines(keepends=True)))
+    assert len(expected) == 43
+
+    for start in (0, 1, 39, 40, 41, 42, 43, 50):
+        # A fresh index each time, so every read skips from the first line.
+        assert _read_all(ReplaySeekIndex(checkpoint_every=1024), path, start) == expected[start:]
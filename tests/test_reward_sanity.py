@@ -60,3 +60,15 @@ def test_high_heat_state_gets_stronger_penalty() -> None:
     _, reward_high, _, _, _ = env_high.step(6)
 
     assert reward_high < reward_low
+
+
+def test_reward_cfg_heat_safe_is_derived_not_serialized() -> None:
+    from dataclasses import asdict
+
+    from asteroid_prospector.constants import HEAT_MAX
+    from asteroid_prospector.reference_env import RewardCfg
+
+    cfg = RewardCfg(heat_safe_frac=0.5)
+    assert cfg.heat_safe == 0.5 * HEAT_MAX
+    assert "heat_safe" not in asdict(cfg)
+    assert cfg == RewardCfg(heat_safe_frac=0.5)
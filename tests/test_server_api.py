@@ -1,7 +1,11 @@
 import gzip
+import io
 import json
+import re
 from pathlib import Path
+from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
 from server.app import create_app
@@ -149,6 +153,160 @@ def test_runs_catalog_and_run_detail(tmp_path: Path) -> None:
     assert run_payload["replay_count"] == 1
 
 
+def test_runs_catalog_limit_keeps_newest_runs(tmp_path: Path) -> None:
+    for hour in (3, 0, 5, 1, 4, 2):
+        _make_run(tmp_path, f"run-{hour}", updated_at=f"2026-02-28T0{hour}:00:00+00:00")
+    _make_run(tmp_path, "run-5b", updated_at="2026-02-28T05:00:00+00:00")
+
+    payload = TestClient(create_app(runs_root=tmp_path)).get("/api/runs?limit=3").json()
+    assert [row["run_id"] for row in payload["runs"]] == ["run-5b", "run-5", "run-4"]
+    assert payload["count"] == 3
+    assert payload["total"] == 7
+
+
+def test_runs_catalog_threaded_scan_matches_sequential(tmp_path: Path) -> None:
+    for idx in range(12):
+        _make_run(tmp_path, f"run-{idx:02d}", updated_at=f"2026-02-28T{idx:02d}:00:00+00:00")
+    (tmp_path / "notes.txt").write_text("not a run", encoding="utf-8")
+    (tmp_path / "empty-dir").mkdir()
+
+    sequential = TestClient(create_app(runs_root=tmp_path)).get("/api/runs?limit=5").json()
+    threaded_app = create_app(runs_root=tmp_path, run_scan_workers=4)
+    assert threaded_app.state.run_scan_executor is not None
+    threaded = TestClient(threaded_app).get("/api/runs?limit=5").json()
+
+    assert threaded == sequential
+    assert sequential["total"] == 12
+
+
+def test_run_scan_executor_is_shut_down_with_the_app(tmp_path: Path) -> None:
+    _make_run(tmp_path, "run-a", updated_at="2026-02-28T00:00:00+00:00")
+    app = create_app(runs_root=tmp_path, run_scan_workers=4)
+    executor = app.state.run_scan_executor
+
+    with TestClient(app) as client:
+        assert client.get("/api/runs").json()["total"] == 1
+    assert app.state.run_scan_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(int)
+
+    with TestClient(app) as client:
+        assert client.get("/api/runs").json()["total"] == 1
+
+
+def test_run_ids_outside_the_runs_root_are_not_found(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    _make_run(runs_root, "run-a", updated_at="2026-02-28T00:00:00+00:00")
+    _write_json(tmp_path / "run_metadata.json", {"run_id": ".."})
+    client = TestClient(create_app(runs_root=runs_root))
+
+    assert client.get("/api/runs/run-a").status_code == 200
+    for run_id in ("%2E%2E", "%2E", "..%5Crun-a", "C:run-a", "x" * 256):
+        assert client.get(f"/api/runs/{run_id}").status_code == 404
+        assert client.get(f"/api/runs/{run_id}/replays").status_code == 404
+
+
+def test_run_json_files_are_parsed_once_until_they_change(monkeypatch, tmp_path: Path) -> None:
+    import os
+
+    import server.app as server_app
+
+    _make_run(tmp_path, "run-a", updated_at="2026-02-28T00:00:00+00:00")
+    parsed: list[str] = []
+    real_read_json = server_app._read_json
+    real_load_index = server_app.load_replay_index
+
+    def _counting_read_json(path: Path) -> dict:
+        parsed.append(path.name)
+        return real_read_json(path)
+
+    def _counting_load_index(*, path: Path, run_id: str) -> dict:
+        parsed.append(path.name)
+        return real_load_index(path=path, run_id=run_id)
+
+    monkeypatch.setattr(server_app, "_read_json", _counting_read_json)
+    monkeypatch.setattr(server_app, "load_replay_index", _counting_load_index)
+    client = TestClient(create_app(runs_root=tmp_path))
+
+    for _ in range(3):
+        assert client.get("/api/runs").json()["runs"][0]["replay_count"] == 1
+        assert client.get("/api/runs/run-a/replays").json()["count"] == 1
+    assert sorted(parsed) == ["replay_index.json", "run_metadata.json"]
+
+    index_path = tmp_path / "run-a" / "replay_index.json"
+    index_payload = json.loads(index_path.read_text(encoding="utf-8"))
+    index_payload["entries"].append(dict(index_payload["entries"][0], replay_id="run-a-second"))
+    _write_json(index_path, index_payload)
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert client.get("/api/runs/run-a").json()["replay_count"] == 2
+    assert parsed.count("replay_index.json") == 2
+    assert parsed.count("run_metadata.json") == 1
+
+
+def test_runs_catalog_counts_replays_from_sidecar_without_parsing_index(
+    monkeypatch, tmp_path: Path
+) -> None:
+    import server.app as server_app
+    from replay.index import write_replay_count
+
+    _make_run(tmp_path, "run-a", updated_at="2026-02-28T00:00:00+00:00")
+    index_path = tmp_path / "run-a" / "replay_index.json"
+    write_replay_count(path=index_path, run_id="run-a", count=1)
+    parsed: list[str] = []
+    real_load_index = server_app.load_replay_index
+
+    def _counting_load_index(*, path: Path, run_id: str) -> dict:
+        parsed.append(path.name)
+        return real_load_index(path=path, run_id=run_id)
+
+    monkeypatch.setattr(server_app, "load_replay_index", _counting_load_index)
+    client = TestClient(create_app(runs_root=tmp_path))
+
+    assert client.get("/api/runs").json()["runs"][0]["replay_count"] == 1
+    assert client.get("/api/runs/run-a").json()["replay_count"] == 1
+    assert parsed == []
+    assert client.get("/api/runs/run-a/replays").json()["count"] == 1
+    assert parsed == ["replay_index.json"]
+
+
+def test_run_and_replay_endpoints_encode_non_finite_floats_as_null(tmp_path: Path) -> None:
+    from server.app import _json_response
+
+    _make_run(tmp_path, "run-a", updated_at="2026-02-28T00:00:00+00:00")
+    index_path = tmp_path / "run-a" / "replay_index.json"
+    index_payload = json.loads(index_path.read_text(encoding="utf-8"))
+    index_payload["entries"][0]["profit"] = float("nan")
+    index_payload["entries"][0]["label"] = "caf\u00e9"
+    index_path.write_text(json.dumps(index_payload), encoding="utf-8")
+    replay_id = index_payload["entries"][0]["replay_id"]
+    client = TestClient(create_app(runs_root=tmp_path))
+
+    listed = client.get("/api/runs/run-a/replays")
+    assert listed.headers["content-type"] == "application/json"
+    assert listed.json()["replays"][0]["profit"] is None
+    assert "caf\u00e9".encode("utf-8") in listed.content
+    detail = client.get(f"/api/runs/run-a/replays/{replay_id}").json()
+    assert detail["replay"]["profit"] is None
+    assert client.get("/api/runs/run-a").json()["replay_count"] == 1
+    assert client.get("/api/runs").json()["runs"][0]["replay_count"] == 1
+
+    # Integers past 64 bits take the stdlib fallback, which must null non-finite floats too.
+    index_payload["entries"][0]["seed"] = 2**70
+    index_payload["entries"][0]["scores"] = [float("inf"), 1.5, float("-inf")]
+    index_path.write_text(json.dumps(index_payload), encoding="utf-8")
+    listed = client.get("/api/runs/run-a/replays")
+    entry = json.loads(listed.content)["replays"][0]
+    assert entry["seed"] == 2**70
+    assert entry["profit"] is None
+    assert entry["scores"] == [None, 1.5, None]
+    assert b"NaN" not in listed.content and b"Infinity" not in listed.content
+    assert _json_response({"a": 2**70, "b": float("nan")}).body == (
+        b'{"a":1180591620717411303424,"b":null}'
+    )
+
+
 def test_run_metrics_windows_endpoint(tmp_path: Path) -> None:
     run_id = "run-metrics"
     _make_run(tmp_path, run_id, updated_at="2026-02-28T03:00:00+00:00")
@@ -171,6 +329,45 @@ def test_run_metrics_windows_endpoint(tmp_path: Path) -> None:
     assert [row["window_id"] for row in asc_payload["windows"]] == [0, 1]
 
 
+def test_run_metrics_windows_are_parsed_once_until_the_file_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    import os
+
+    import server.app as server_app
+
+    run_id = "run-metrics"
+    _make_run(tmp_path, run_id, updated_at="2026-02-28T03:00:00+00:00")
+    parsed: list[str] = []
+    real_load_rows = server_app._load_jsonl_rows
+
+    def _counting_load_rows(path: Path) -> list[dict]:
+        parsed.append(path.name)
+        return real_load_rows(path)
+
+    monkeypatch.setattr(server_app, "_load_jsonl_rows", _counting_load_rows)
+    client = TestClient(create_app(runs_root=tmp_path))
+    url = f"/api/runs/{run_id}/metrics/windows"
+
+    for _ in range(2):
+        desc = client.get(url, params={"limit": 2}).json()
+        asc = client.get(url, params={"order": "asc"}).json()
+        assert [row["window_id"] for row in desc["windows"]] == [2, 1]
+        assert [row["window_id"] for row in asc["windows"]] == [0, 1, 2]
+    assert len(parsed) == 1
+
+    metrics_path = tmp_path / run_id / "metrics" / "windows.jsonl"
+    with metrics_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(dict(asc["windows"][-1], window_id=3)) + "\n")
+    stat = metrics_path.stat()
+    os.utime(metrics_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    desc = client.get(url, params={"limit": 2}).json()
+    assert [row["window_id"] for row in desc["windows"]] == [3, 2]
+    assert desc["total"] == 4
+    assert len(parsed) == 2
+
+
 def test_run_analytics_completeness_endpoint_reports_ok_coverage(tmp_path: Path) -> None:
     run_id = "run-complete"
     _make_run(tmp_path, run_id, updated_at="2026-03-03T01:00:00+00:00")
@@ -918,3 +1115,337 @@ def test_wandb_proxy_surfaces_unavailable_errors(tmp_path: Path) -> None:
     response = client.get("/api/wandb/runs/latest")
     assert response.status_code == 503
     assert "W&B proxy unavailable" in response.json()["detail"]
+
+
+def test_json_codec_helpers_match_stdlib_semantics() -> None:
+    import math
+
+    import pytest
+
+    from replay.index import json_loads
+    from server.app import _json_dumps_text
+
+    payload = {"type": "frames", "frames": [{"t": 1, "r": 0.25, "s": "é"}], "big": 2**70}
+    assert json.loads(_json_dumps_text(payload)) == payload
+    assert json_loads(json.dumps(payload)) == payload
+    assert json_loads(json.dumps(payload).encode("utf-8")) == payload
+    assert math.isnan(json_loads('{"v": NaN}')["v"])
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{not json")
+
+
+def test_load_jsonl_rows_reads_raw_lines(tmp_path: Path) -> None:
+    import pytest
+    from fastapi import HTTPException
+
+    from server.app import _load_jsonl_rows
+
+    path = tmp_path / "windows.jsonl"
+    path.write_bytes(
+        b'{"window_id": 0}\r\n\n  \n{"window_id": 1, "note": "a\xe2\x80\xa8b"}\n{"window_id": 2}'
+    )
+    assert _load_jsonl_rows(path) == [
+        {"window_id": 0},
+        {"window_id": 1, "note": "a\u2028b"},
+        {"window_id": 2},
+    ]
+
+    path.write_bytes(b'{"window_id": 0}\n[1, 2]\n')
+    with pytest.raises(HTTPException):
+        _load_jsonl_rows(path)
+    path.write_bytes(b'{"window_id": 0\n')
+    with pytest.raises(HTTPException):
+        _load_jsonl_rows(path)
+
+
+def test_window_sort_key_coerces_like_int() -> None:
+    from server.app import _window_sort_key
+
+    assert _window_sort_key({"window_id": 3, "env_steps_total": 40}) == (3, 40)
+    assert _window_sort_key({"window_id": "7", "env_steps_total": 2.0}) == (7, 2)
+    assert _window_sort_key({"window_id": True}) == (1, -1)
+    assert _window_sort_key({}) == (-1, -1)
+
+
+def test_frames_message_splices_frame_json(tmp_path: Path) -> None:
+    import pytest
+    from fastapi import HTTPException
+
+    from server.app import _frames_message_text, _replay_frame_json
+
+    assert _replay_frame_json(b"  \r\n") is None
+    verbatim = _replay_frame_json(b'{"t": 1.5, "s": "\xc3\xa9"}\r\n')
+    assert verbatim == b'{"t": 1.5, "s": "\xc3\xa9"}'
+    assert json.loads(_replay_frame_json(b'{"r": NaN, "q": -Infinity}\n')) == {
+        "r": None,
+        "q": None,
+    }
+    with pytest.raises(HTTPException):
+        _replay_frame_json(b"[1, 2]\n")
+    with pytest.raises(HTTPException):
+        _replay_frame_json(b'{"t": 1\n')
+    # Object-shaped but malformed lines are parsed, not spliced.
+    for bad in (b'{"t": 1,, }\n', b"{}{}\n", b'{"s": "\xff"}\n'):
+        with pytest.raises(HTTPException, match="Invalid replay frame JSON"):
+            _replay_frame_json(bad)
+    assert json.loads(_replay_frame_json(b'{"big": 1180591620717411303424}')) == {"big": 2**70}
+
+    message = _frames_message_text({"type": "frames", "count": 2}, [verbatim, b'{"t":2}'])
+    assert json.loads(message) == {
+        "type": "frames",
+        "count": 2,
+        "frames": [{"t": 1.5, "s": "é"}, {"t": 2}],
+    }
+    assert json.loads(_frames_message_text({"type": "frames"}, [])) == {
+        "type": "frames",
+        "frames": [],
+    }
+    with pytest.raises(HTTPException):
+        _frames_message_text({"type": "frames"}, [b'{"s": "\xff"}'])
+
+
+def test_replay_frames_endpoint_passes_frames_through(tmp_path: Path) -> None:
+    _make_run(tmp_path, "run-raw", updated_at="2026-02-28T00:00:00+00:00")
+    replay_path = tmp_path / "run-raw" / "replays" / "run-raw-replay.jsonl.gz"
+    replay_path.parent.mkdir(parents=True, exist_ok=True)
+    replay_path.write_bytes(
+        gzip.compress(
+            b'{"frame_index": 0}\n\n{"frame_index": 1, "reward": NaN}\n{"frame_index": 2}\n'
+        )
+    )
+    client = TestClient(create_app(runs_root=tmp_path))
+    url = "/api/runs/run-raw/replays/run-raw-replay/frames"
+
+    response = client.get(url, params={"limit": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "run_id": "run-raw",
+        "replay_id": "run-raw-replay",
+        "offset": 0,
+        "next_offset": 2,
+        "count": 2,
+        "has_more": True,
+        "frames": [{"frame_index": 0}, {"frame_index": 1, "reward": None}],
+    }
+
+    replay_path.write_bytes(gzip.compress(b'{"frame_index": 0}\n{"frame_index": 1\n'))
+    assert client.get(url).status_code == 500
+
+    replay_path.write_bytes(
+        gzip.compress(b'{"frame_index": 0}\n{"frame_index": 1,, }\n{"frame_index": 2}\n')
+    )
+    malformed = client.get(url)
+    assert malformed.status_code == 500
+    assert malformed.json() == {"detail": "Invalid replay frame JSON"}
+
+
+def test_play_session_store_locks_per_session() -> None:
+    import threading
+
+    import pytest
+    from fastapi import HTTPException
+
+    from server.app import _PlaySession, _PlaySessionStore
+
+    class _Env:
+        def __init__(self, gate: threading.Event | None = None) -> None:
+            self.gate = gate
+            self.entered = threading.Event()
+            self.closed = False
+
+        def step(self, action: int):
+            self.entered.set()
+            if self.gate is not None:
+                assert self.gate.wait(timeout=5.0)
+            return None, 1.0, False, False, {"action": action}
+
+        def close(self) -> None:
+            self.closed = True
+
+    gate = threading.Event()
+    store = _PlaySessionStore(max_pooled_envs=0)
+    blocked_env, free_env = _Env(gate), _Env()
+    for session_id, env in (("blocked", blocked_env), ("free", free_env)):
+        store._sessions[session_id] = _PlaySession(
+            env=env, env_time_max=10.0, next_seed=1, steps=0, created_at="", updated_at=""
+        )
+
+    worker = threading.Thread(target=store.step, kwargs={"session_id": "blocked", "action": 1})
+    worker.start()
+    assert blocked_env.entered.wait(timeout=5.0)
+    # Another session steps while the first one is still inside env.step.
+    assert store.step(session_id="free", action=2)[4] == {"action": 2}
+    gate.set()
+    worker.join(timeout=5.0)
+    assert store.get("blocked").steps == 1
+
+    session = store.get("blocked")
+    store.delete(session_id="blocked")
+    assert blocked_env.closed and session.closed
+    with pytest.raises(HTTPException):
+        store.step(session_id="blocked", action=0)
+
+
+def test_play_session_endpoints_round_trip(tmp_path: Path) -> None:
+    client = TestClient(create_app(runs_root=tmp_path))
+
+    created = client.post("/api/play/session", json={"seed": 7, "env_time_max": 50.0}).json()
+    session_id = created["session_id"]
+    assert created["seed"] == 7 and created["steps"] == 0
+
+    stepped = client.post(f"/api/play/session/{session_id}/step", json={"action": 0})
+    assert stepped.status_code == 200
+    assert stepped.json()["steps"] == 1
+    assert len(stepped.json()["obs"]) == len(created["obs"])
+
+    reset = client.post(f"/api/play/session/{session_id}/reset", json={}).json()
+    assert reset["seed"] == 8 and reset["steps"] == 0
+    assert reset["obs"] != created["obs"]
+
+    assert client.delete(f"/api/play/session/{session_id}").json()["deleted"] is True
+    assert (
+        client.post(f"/api/play/session/{session_id}/step", json={"action": 0}).status_code == 404
+    )
+    assert client.post("/api/play/session/missing/reset", json={}).status_code == 404
+
+
+def test_obs_to_list_returns_python_floats() -> None:
+    import numpy as np
+
+    from server.app import _obs_to_list
+
+    values = _obs_to_list(np.array([0.1, 2.0, -3.5], dtype=np.float64))
+    assert values == [float(np.float32(0.1)), 2.0, -3.5]
+    assert all(type(value) is float for value in values)
+
+
+def test_play_session_store_reuses_envs_of_deleted_sessions() -> None:
+    import numpy as np
+
+    from server.app import _PlaySessionStore
+
+    actions = [0, 3, 1, 7, 2, 5, 0, 4]
+
+    def _rollout(store: _PlaySessionStore, seed: int) -> tuple[Any, list[tuple]]:
+        session_id, _, obs, info, session = store.create(env_time_max=500.0, seed=seed)
+        trace = [(obs.tolist(), info)]
+        for action in actions:
+            obs, reward, terminated, truncated, info, _ = store.step(
+                session_id=session_id, action=action
+            )
+            trace.append((obs.tolist(), reward, terminated, truncated, info))
+        return session, trace
+
+    pooled_store = _PlaySessionStore(max_pooled_envs=1)
+    first, _ = _rollout(pooled_store, seed=5)
+    pooled_store.delete(session_id=next(iter(pooled_store._sessions)))
+    reused, pooled_trace = _rollout(pooled_store, seed=11)
+    assert reused.env is first.env
+
+    fresh, fresh_trace = _rollout(_PlaySessionStore(max_pooled_envs=0), seed=11)
+    assert fresh.env is not first.env
+    assert pooled_trace == fresh_trace
+    assert np.isfinite(pooled_trace[-1][0]).all()
+
+    # Pooled envs are only handed to sessions with the same time budget.
+    pooled_store.delete(session_id=next(iter(pooled_store._sessions)))
+    other, _ = _rollout(pooled_store, seed=11)
+    assert other.env is first.env
+    _, _, _, _, longer = pooled_store.create(env_time_max=900.0, seed=11)
+    assert longer.env is not first.env
+
+
+def test_play_session_ids_are_unique_across_urandom_batches(monkeypatch) -> None:
+    import server.app as server_app
+    from server.app import _PlaySessionStore
+
+    reads: list[int] = []
+    real_urandom = server_app.os.urandom
+
+    def _counting_urandom(size: int) -> bytes:
+        reads.append(size)
+        return real_urandom(size)
+
+    monkeypatch.setattr(server_app, "PLAY_SESSION_ID_BATCH", 4)
+    monkeypatch.setattr(server_app.os, "urandom", _counting_urandom)
+    store = _PlaySessionStore(max_pooled_envs=0)
+    ids = [store.create(env_time_max=100.0, seed=idx)[0] for idx in range(10)]
+
+    assert len(set(ids)) == 10
+    assert all(re.fullmatch(r"[0-9a-f]{32}", session_id) for session_id in ids)
+    assert reads == [64, 64, 64]
+
+
+def test_replay_frame_websocket_reports_bad_frame_after_earlier_chunks(tmp_path: Path) -> None:
+    _make_run(tmp_path, "run-ws-bad", updated_at="2026-02-28T00:00:00+00:00")
+    replay_path = tmp_path / "run-ws-bad" / "replays" / "run-ws-bad-replay.jsonl.gz"
+    replay_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps({"frame_index": idx}).encode("utf-8") + b"\n" for idx in range(5)]
+    replay_path.write_bytes(gzip.compress(b"".join(lines) + b'{"frame_index": 5\n'))
+
+    client = TestClient(create_app(runs_root=tmp_path))
+    url = "/ws/runs/run-ws-bad/replays/run-ws-bad-replay/frames?batch_size=2"
+    with client.websocket_connect(url) as ws:
+        messages = [ws.receive_json() for _ in range(4)]
+
+    # Full chunks before the bad line are delivered; the partial chunk is not.
+    assert [message["type"] for message in messages] == ["frames", "frames", "frames", "error"]
+    assert [message["count"] for message in messages[:3]] == [0, 2, 2]
+    assert messages[3]["status_code"] == 500
+
+    # A client leaving mid-stream does not wedge later streams.
+    with client.websocket_connect(url.replace("batch_size=2", "batch_size=1")) as ws:
+        assert ws.receive_json()["prelude"] is True
+        assert ws.receive_json()["count"] == 1
+    with client.websocket_connect(url) as ws:
+        assert [ws.receive_json()["type"] for _ in range(4)][-1] == "error"
+
+
+def test_replay_frame_websocket_reports_malformed_object_line(tmp_path: Path) -> None:
+    _make_run(tmp_path, "run-ws-shape", updated_at="2026-02-28T00:00:00+00:00")
+    replay_path = tmp_path / "run-ws-shape" / "replays" / "run-ws-shape-replay.jsonl.gz"
+    replay_path.parent.mkdir(parents=True, exist_ok=True)
+    replay_path.write_bytes(
+        gzip.compress(b'{"frame_index": 0}\n{"frame_index": 1,, }\n{"frame_index": 2}\n')
+    )
+
+    client = TestClient(create_app(runs_root=tmp_path))
+    url = "/ws/runs/run-ws-shape/replays/run-ws-shape-replay/frames?batch_size=8"
+    with client.websocket_connect(url) as ws:
+        prelude = ws.receive_json()
+        error = ws.receive_json()
+
+    assert prelude["prelude"] is True
+    assert error["type"] == "error"
+    assert error["status_code"] == 500
+    assert error["detail"] == "Invalid replay frame JSON"
+
+
+def test_replay_frame_websocket_chunk_bytes_count_text_lines(tmp_path: Path) -> None:
+    _make_run(tmp_path, "run-ws-size", updated_at="2026-02-28T00:00:00+00:00")
+    replay_path = tmp_path / "run-ws-size" / "replays" / "run-ws-size-replay.jsonl.gz"
+    replay_path.parent.mkdir(parents=True, exist_ok=True)
+    raw = '{"frame_index": 0, "s": "é"}\r\n{"frame_index": 1}\n{"frame_index": 2, "s": "☄"}'
+    replay_path.write_bytes(gzip.compress(raw.encode("utf-8")))
+    # What text-mode iteration plus `len(line.encode("utf-8"))` used to report.
+    expected = sum(len(line.encode("utf-8")) for line in io.StringIO(raw, newline=None))
+
+    client = TestClient(create_app(runs_root=tmp_path))
+    with client.websocket_connect("/ws/runs/run-ws-size/replays/run-ws-size-replay/frames") as ws:
+        ws.receive_json()
+        chunk = ws.receive_json()
+
+    assert chunk["count"] == 3
+    assert chunk["chunk_bytes"] == expected
+
+
+def test_parse_csv_arg_returns_fresh_lists() -> None:
+    from server.app import _parse_csv_arg
+
+    first = _parse_csv_arg(" a ,b,,c ")
+    assert first == ["a", "b", "c"]
+    first.append("mutated")
+    assert _parse_csv_arg(" a ,b,,c ") == ["a", "b", "c"]
+    assert _parse_csv_arg(" , ,") is None
+    assert _parse_csv_arg(None) is None
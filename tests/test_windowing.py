@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import numpy as np
 
 from training.windowing import INFO_METRIC_KEYS, WindowMetricsAggregator
@@ -158,3 +160,19 @@ def test_record_step_batch_supports_dict_of_arrays_infos() -> None:
     assert record.invalid_action_rate == 3.0 / 5.0
     assert record.episodes_completed == 1
     assert record.terminated_episodes == 1
+
+
+def test_record_step_batch_reads_read_only_mapping_infos() -> None:
+    info = _info(3, invalid=True)
+    agg = WindowMetricsAggregator(run_id="mapping-infos", window_env_steps=3)
+    emitted = agg.record_step_batch(
+        rewards=[1.0],
+        infos=[MappingProxyType(info)],
+        terminated=[False],
+        truncated=[False],
+    )
+
+    assert len(emitted) == 1
+    assert emitted[0].env_steps_in_window == 3
+    assert emitted[0].invalid_action_rate == 1.0
+    assert emitted[0].metric_means["credits"] == 10.0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Write `replay_index.count` sidecars for runs recorded before they existed."""
+
+from __future__ import annotations
+
+# ruff: noqa: E402
+import argparse
+import json
+import sys
+from pathlib import Path
+
+if __package__ is None or __package__ == "":
+    REPO_ROOT = Path(__file__).resolve().parents[1]
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+from replay.index import (
+    load_replay_index,
+    read_replay_count,
+    resolve_replay_index_path,
+    write_replay_count,
+)
+
+
+def _backfill_run(run_dir: Path) -> tuple[str, str]:
+    """Return `(status, run_id)` for one run, writing its count sidecar if needed."""
+    metadata_path = run_dir / "run_metadata.json"
+    if not metadata_path.exists():
+        return "skipped", run_dir.name
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    if not isinstance(metadata, dict):
+        raise ValueError("run metadata must be a JSON object")
+    run_id = str(metadata.get("run_id", run_dir.name))
+    index_path = resolve_replay_index_path(run_dir=run_dir, metadata=metadata)
+    if not index_path.exists():
+        return "skipped", run_id
+    if read_replay_count(path=index_path, run_id=run_id) is not None:
+        return "current", run_id
+    entries = load_replay_index(path=index_path, run_id=run_id)["entries"]
+    write_replay_count(path=index_path, run_id=run_id, count=len(entries))
+    return "written", run_id
+
+
+def backfill_replay_counts(runs_root: Path) -> dict[str, list[str]]:
+    """Write a current count sidecar next to every run's replay index that lacks one.
+
+    A run whose metadata or index can't be read or parsed is reported as skipped.
+    """
+    report: dict[str, list[str]] = {"written": [], "current": [], "skipped": []}
+    for run_dir in sorted(path for path in runs_root.iterdir() if path.is_dir()):
+        try:
+            status, run_id = _backfill_run(run_dir)
+        except (OSError, ValueError) as exc:
+            print(f"skipping {run_dir.name}: {exc}", file=sys.stderr)
+            status, run_id = "skipped", run_dir.name
+        report[status].append(run_id)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs-root", type=Path, default=Path("runs"))
+    args = parser.parse_args(argv)
+    if not args.runs_root.is_dir():
+        parser.error(f"runs root not found: {args.runs_root}")
+
+    report = backfill_replay_counts(args.runs_root)
+    print(json.dumps({key: len(value) for key, value in report.items()}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
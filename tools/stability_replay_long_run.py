@@ -20,8 +20,9 @@ if __package__ is None or __package__ == "":
     if str(REPO_ROOT) not in sys.path:
         sys.path.insert(0, str(REPO_ROOT))
 
-from replay.index import load_replay_index
+from replay.index import json_loads, load_replay_index
 from replay.schema import validate_replay_frame
+from replay.seek import iter_replay_lines
 from server.app import create_app
 from training import TrainConfig, run_training
 
@@ -113,12 +114,13 @@ def _validate_replay_file(path: Path) -> dict[str, Any]:
 
     frame_count = 0
     first_frame: dict[str, Any] | None = None
-    with gzip.open(path, mode="rt", encoding="utf-8") as handle:
-        for line in handle:
+    # Frames are parsed straight from bytes, without a text-mode decode pass.
+    with gzip.open(path, mode="rb") as handle:
+        for line in iter_replay_lines(handle):
             text = line.strip()
-            if text == "":
+            if not text:
                 continue
-            payload = json.loads(text)
+            payload = json_loads(text)
             if not isinstance(payload, dict):
                 raise RuntimeError(f"Invalid replay frame payload in {path.as_posix()}")
             validate_replay_frame(payload)
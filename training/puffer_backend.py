@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -139,8 +139,8 @@ def _info_for_env(infos: Any, index: int) -> dict[str, Any]:
 
     if isinstance(infos, list | tuple) and index < len(infos):
         value = infos[index]
-        if isinstance(value, dict):
-            return value
+        if isinstance(value, Mapping):
+            return value if isinstance(value, dict) else dict(value)
 
     return {}
 
@@ -278,7 +278,7 @@ class _ProspectorNativeGymEnv:
             float(reward),
             bool(terminated),
             bool(truncated),
-            info,
+            dict(info),
         )
 
     def close(self) -> None:
@@ -291,6 +291,7 @@ class _NativeBatchVectorEnv:
     """Native vector env that batches reset/step calls through ctypes bridge."""
 
     def __init__(self, *, time_max: float, seed: int, num_envs: int) -> None:
+        import asteroid_prospector.native_core as native_core
         import gymnasium as gym
         from asteroid_prospector import N_ACTIONS, OBS_DIM, NativeCoreConfig, NativeProspectorCore
 
@@ -302,6 +303,9 @@ class _NativeBatchVectorEnv:
         self._time_max = float(time_max)
         self._cores: list[Any] = []
         self._episode_seed_rngs: list[np.random.Generator] = []
+        # Step infos are consumed by callbacks before the next step, so one set of
+        # info columns is refilled in place every tick.
+        self._infos = native_core.NativeProspectorCore._allocate_info_arrays(self._num_envs)
 
         initial_seeds = self._sample_seed_vector(int(seed))
         for env_seed in initial_seeds:
@@ -369,6 +373,7 @@ class _NativeBatchVectorEnv:
         obs, rewards, terminated, truncated, infos = self._NativeProspectorCore.step_many(
             self._cores,
             [int(action) for action in action_arr],
+            infos_out=self._infos,
         )
 
         # Keep vector-env autoreset behavior so the next obs for done envs is episode-start.
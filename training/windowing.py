@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -88,7 +89,7 @@ def _info_value_for_env(infos: Any, index: int, key: str, default: Any) -> Any:
 
     if isinstance(infos, (list, tuple)) and index < len(infos):
         value = infos[index]
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             raw = value.get(key, default)
             return raw.item() if isinstance(raw, np.generic) else raw
 
@@ -152,9 +153,7 @@ class WindowMetricsAggregator:
             dt = 1
 
         invalid_action = bool(info.get("invalid_action", False))
-        metric_values = {
-            key: _safe_float(info.get(key, 0.0)) for key in self.info_metric_keys
-        }
+        metric_values = {key: _safe_float(info.get(key, 0.0)) for key in self.info_metric_keys}
         return self._record_step_values(
             reward=float(reward),
             dt=dt,